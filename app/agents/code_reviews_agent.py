@@ -10,14 +10,19 @@ The agent runs in a separate process to handle long-running tasks without blocki
 the main service. It follows the established standards agent pattern for consistency
 across the codebase.
 """
+import json
 import os
+from collections import defaultdict
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import asyncio
 from bson import ObjectId
 
 from app.utils.anthropic_client import AnthropicClient
+from app.utils.rate_limit import AsyncRateLimiter
+from app.config.config import settings
+from app.common import cache
 from app.common.logging import get_logger
 from app.database.database_utils import get_database
 from app.models.code_review import ReviewStatus
@@ -57,6 +62,36 @@ Determine if code meets each standard.
 Provide detailed recommendations for non-compliant areas.
 Consider the codebase as a whole when evaluating compliance."""
 
+# Classifications change rarely, so lookups are cached briefly across reviews.
+# Invalidation only clears the API process's cache, so a background worker can
+# keep using stale classifications for up to this many seconds after a change
+CLASSIFICATIONS_CACHE_TTL = 60.0
+
+# Rough allowance of output tokens for a single standard's report, used to
+# decide how many standards can share one prompt within ANTHROPIC_MAX_TOKENS
+REPORT_TOKEN_ESTIMATE = 1000
+
+# Concurrency and rate limits shared by every review in this worker process,
+# created on first use along with the event loop they belong to
+_llm_limits: Optional[
+    Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore, AsyncRateLimiter]
+] = None
+
+# Report section format shared by the single and multi-standard prompts
+REPORT_FORMAT = """Replace the <span style="color: [COLOUR]"> with the appropriate hash code of the colour for the compliance status detailed below.
+Yes = #00703c, No = #d4351c, Partially = #1d70b8
+
+## Standard: [Standard Title from the standard text]
+
+Compliant: <span style="color: [COLOUR]">**[Yes/No/Partially]**</span>
+
+Relevant Files/Sections:
+- [file/path/1]
+- [file/path/2]
+
+[Describe how the codebase implements or fails to implement this standard - keep this informative and concise]
+[If partially compliant or non-compliant, explain specific issues - keep this informative and concise]"""
+
 
 class CodeReviewConfig:
     """Configuration management for code reviews."""
@@ -64,9 +99,13 @@ class CodeReviewConfig:
     def __init__(self) -> None:
         self.llm_testing: bool = os.getenv(
             "LLM_TESTING", "false").lower() == "true"
-        self.testing_files: List[str] = (
-            os.getenv("LLM_TESTING_STANDARDS_FILES", "").split(",")
-            if self.llm_testing else []
+        self.testing_files: Tuple[str, ...] = (
+            tuple(
+                name.strip()
+                for name in os.getenv("LLM_TESTING_STANDARDS_FILES", "").split(",")
+                if name.strip()
+            )
+            if self.llm_testing else ()
         )
 
 
@@ -90,12 +129,12 @@ async def filter_standards(
         if not config.llm_testing:
             return standards
 
-        filtered_standards = []
-        for standard in standards:
-            repository_path = standard.get('repository_path', '')
-            if any(test_file.strip() in repository_path
-                   for test_file in config.testing_files):
-                filtered_standards.append(standard)
+        testing_files = config.testing_files
+        filtered_standards = [
+            standard for standard in standards
+            if any(test_file in standard.get('repository_path', '')
+                   for test_file in testing_files)
+        ]
 
         logger.info(
             f"LLM Testing enabled - filtered to {len(filtered_standards)} standards")
@@ -106,18 +145,40 @@ async def filter_standards(
             f"Failed to filter standards: {str(e)}") from e
 
 
+def generate_codebase_block(codebase_content: str) -> Dict[str, Any]:
+    """Generate the content block holding the codebase under review.
+
+    The block is placed first in every prompt for a review so that, with
+    prompt caching enabled, the codebase prefix written to the cache by the
+    first request can be read from it by later ones.
+
+    Args:
+        codebase_content: Content of the codebase to analyze
+
+    Returns:
+        Text content block for the codebase
+    """
+    block: Dict[str, Any] = {
+        "type": "text",
+        "text": f"Submitted repository codebase:\n{codebase_content}"
+    }
+    if settings.ANTHROPIC_PROMPT_CACHING:
+        block["cache_control"] = {"type": "ephemeral"}
+    return block
+
+
 async def generate_user_prompt(
     standard: Dict[str, Any],
-    codebase_content: str
-) -> str:
+    codebase_block: Dict[str, Any]
+) -> List[Dict[str, Any]]:
     """Generate the user prompt for the Anthropic model.
 
     Args:
         standard: Standard to check compliance against
-        codebase_content: Content of the codebase to analyze
+        codebase_block: Content block holding the codebase to analyze
 
     Returns:
-        Generated prompt for the model
+        Prompt content blocks for the model, codebase first
     """
     standard_preview = (
         standard.get('text', '')[:150] + '...'
@@ -131,8 +192,7 @@ async def generate_user_prompt(
 ## Standard {standard['_id']}
 {standard['text']}
 
-Compare the entire codebase of the submitted repository below, to assess how well the standard is adhered to:
-{codebase_content}
+Compare the entire codebase of the submitted repository above, to assess how well the standard is adhered to.
 
 Determine if the codebase as a whole is compliant (true/false).
 List specific files/sections in the codebase that are relevant to the standard (if any).
@@ -141,19 +201,7 @@ Consider dependencies and interactions between different parts of the code.
 
 Generate a informative but concise compliance report using this format:
 
-Replace the <span style="color: [COLOUR]"> with the appropriate hash code of the colour for the compliance status detailed below.
-Yes = #00703c, No = #d4351c, Partially = #1d70b8
-
-## Standard: [Standard Title from the standard text]
-
-Compliant: <span style="color: [COLOUR]">**[Yes/No/Partially]**</span>
-
-Relevant Files/Sections:
-- [file/path/1]
-- [file/path/2]
-
-[Describe how the codebase implements or fails to implement this standard - keep this informative and concise]
-[If partially compliant or non-compliant, explain specific issues - keep this informative and concise]
+{REPORT_FORMAT}
 
 ## [Standard Category 2]
 
@@ -166,47 +214,410 @@ Relevant Files/Sections:
 """
     word_count = len(prompt.split())
     logger.debug(f"Generated prompt word count: {word_count}")
-    return prompt
+    return [codebase_block, {"type": "text", "text": prompt}]
+
+
+async def generate_multi_standard_prompt(
+    standards_chunk: List[Dict[str, Any]],
+    codebase_block: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """Generate a user prompt asking for reports on several standards at once.
+
+    Args:
+        standards_chunk: Standards to check compliance against
+        codebase_block: Content block holding the codebase to analyze
+
+    Returns:
+        Prompt content blocks for the model, codebase first
+    """
+    standards_text = "\n\n".join(
+        f"## Standard {standard['_id']}\n{standard['text']}"
+        for standard in standards_chunk
+    )
+    logger.debug(
+        f"Processing standard IDs: {[str(s.get('_id')) for s in standards_chunk]}")
+
+    prompt = f"""Given the standards below:
+{standards_text}
+
+Compare the entire codebase of the submitted repository above, to assess how well each standard is adhered to.
+
+For each standard:
+Determine if the codebase as a whole is compliant (true/false).
+List specific files/sections in the codebase that are relevant to the standard (if any).
+If non-compliant, provide concise recommendations - 1-2 sentences.
+Consider dependencies and interactions between different parts of the code.
+
+Generate an informative but concise compliance report for each standard using this format:
+
+{REPORT_FORMAT}
+
+Respond with only a JSON array containing one object per standard, in the order the standards are given:
+[{{"standard_id": "<id from the standard heading>", "report": "<compliance report in the format above>"}}]
+"""
+    word_count = len(prompt.split())
+    logger.debug(f"Generated prompt word count: {word_count}")
+    return [codebase_block, {"type": "text", "text": prompt}]
+
+
+def chunk_standards(
+    standards: List[Dict[str, Any]],
+    max_tokens: int
+) -> List[List[Dict[str, Any]]]:
+    """Group standards so each group's reports fit within the output budget.
+
+    max_tokens caps the model's output, so only the reports count against
+    it, each estimated at REPORT_TOKEN_ESTIMATE tokens. With
+    ANTHROPIC_GROUP_STANDARDS disabled every standard gets its own group.
+
+    Args:
+        standards: Standards to group
+        max_tokens: Maximum output tokens per response
+
+    Returns:
+        Standards grouped in their original order
+    """
+    group_size = (
+        max(1, max_tokens // REPORT_TOKEN_ESTIMATE)
+        if settings.ANTHROPIC_GROUP_STANDARDS else 1
+    )
+    return [
+        standards[start:start + group_size]
+        for start in range(0, len(standards), group_size)
+    ]
+
+
+async def generate_chunk_prompt(
+    standards_chunk: List[Dict[str, Any]],
+    codebase_block: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """Generate the prompt for a group of standards.
+
+    Args:
+        standards_chunk: Standards to check compliance against
+        codebase_block: Content block holding the codebase to analyze
+
+    Returns:
+        Single-standard prompt for groups of one, multi-standard prompt otherwise
+    """
+    if len(standards_chunk) == 1:
+        return await generate_user_prompt(standards_chunk[0], codebase_block)
+    return await generate_multi_standard_prompt(standards_chunk, codebase_block)
+
+
+def _decode_report_items(response_text: str) -> List[Any]:
+    """Find the JSON array of reports in a grouped response.
+
+    Tries each '[' in turn and returns the first well-formed JSON array of
+    objects, so brackets in any text around the array are skipped. If the response was
+    cut off before the array closed, the complete items at its start are
+    returned instead.
+
+    Args:
+        response_text: Raw model response
+
+    Returns:
+        Items of the array, or an empty list if none was found
+    """
+    decoder = json.JSONDecoder()
+    salvaged: List[Any] = []
+    start = response_text.find('[')
+    while start != -1:
+        try:
+            value, _ = decoder.raw_decode(response_text, start)
+            if (isinstance(value, list) and value
+                    and all(isinstance(item, dict) for item in value)):
+                return value
+        except ValueError:
+            if not salvaged:
+                salvaged = _decode_leading_items(decoder, response_text, start + 1)
+        start = response_text.find('[', start + 1)
+    return salvaged
+
+
+def _decode_leading_items(
+    decoder: json.JSONDecoder,
+    text: str,
+    pos: int
+) -> List[Any]:
+    """Decode the complete items of a JSON array that is not closed.
+
+    Args:
+        decoder: Decoder to read each item with
+        text: Text holding the array
+        pos: Position just after the array's opening bracket
+
+    Returns:
+        Items decoded before the first incomplete or invalid one
+    """
+    items = []
+    while True:
+        while pos < len(text) and text[pos].isspace():
+            pos += 1
+        try:
+            item, pos = decoder.raw_decode(text, pos)
+        except ValueError:
+            return items
+        if not isinstance(item, dict):
+            return items
+        items.append(item)
+        while pos < len(text) and text[pos].isspace():
+            pos += 1
+        if pos >= len(text) or text[pos] != ',':
+            return items
+        pos += 1
+
+
+def parse_chunk_reports(
+    response_text: str,
+    standards_chunk: List[Dict[str, Any]]
+) -> Dict[str, str]:
+    """Extract the reports in the model response for a group of standards.
+
+    Reports are matched to standards by ID. Reports for IDs that are not in
+    the group are logged and dropped, and standards without a report are
+    left out so the caller can check them again.
+
+    Args:
+        response_text: Raw model response
+        standards_chunk: Standards the response was generated for
+
+    Returns:
+        Reports keyed by standard ID
+    """
+    if len(standards_chunk) == 1:
+        return {str(standards_chunk[0]['_id']): response_text}
+
+    expected_ids = {str(standard['_id']) for standard in standards_chunk}
+    reports: Dict[str, str] = {}
+    for item in _decode_report_items(response_text):
+        try:
+            standard_id, report = str(item['standard_id']), str(item['report'])
+        except (TypeError, KeyError):
+            logger.warning(f"Ignoring malformed report item: {str(item)[:100]}")
+            continue
+        if standard_id not in expected_ids:
+            logger.warning(f"Dropping report for unknown standard ID: {standard_id}")
+            continue
+        reports[standard_id] = report
+    return reports
+
+
+def generate_failed_report(standard: Dict[str, Any], error: BaseException) -> str:
+    """Generate the report section for a standard that could not be checked.
+
+    Args:
+        standard: Standard whose compliance check failed
+        error: Error raised by the compliance check
+
+    Returns:
+        Report section recording the failure
+    """
+    return (
+        f"## Standard: {standard['_id']}\n\n"
+        f"Compliance check could not be completed: {str(error)}"
+    )
+
+
+def get_llm_limits() -> Tuple[asyncio.Semaphore, AsyncRateLimiter]:
+    """Get the concurrency and rate limits shared by compliance checks.
+
+    LLM_MAX_CONCURRENCY and LLM_REQUESTS_PER_MINUTE are totals for the
+    service, so each of the BACKGROUND_WORKERS processes gets an equal share.
+    The limits are created once per process and recreated only if the event
+    loop changes.
+
+    Returns:
+        Semaphore bounding in-flight requests and the requests per minute limiter
+    """
+    global _llm_limits
+    loop = asyncio.get_running_loop()
+    if _llm_limits is None or _llm_limits[0] is not loop:
+        workers = max(1, settings.BACKGROUND_WORKERS)
+        _llm_limits = (
+            loop,
+            asyncio.Semaphore(max(1, settings.LLM_MAX_CONCURRENCY // workers)),
+            AsyncRateLimiter(max(1, settings.LLM_REQUESTS_PER_MINUTE // workers))
+        )
+    return _llm_limits[1], _llm_limits[2]
+
+
+def _use_batch(standards_count: int) -> bool:
+    """Check whether compliance checks should use the Message Batches API.
+
+    Args:
+        standards_count: Number of standards to check
+
+    Returns:
+        True if the batch threshold is enabled, exceeded and supported
+    """
+    threshold = settings.ANTHROPIC_BATCH_THRESHOLD
+    return (
+        threshold > 0
+        and standards_count > threshold
+        and AnthropicClient.supports_batches()
+    )
+
+
+def _collect_reports(
+    chunks: List[List[Dict[str, Any]]],
+    results: List[Any]
+) -> List[str]:
+    """Combine the results of each group's check into one list of reports.
+
+    Keeps the reports that succeeded and only fails the whole set of
+    standards when no group could be checked.
+
+    Args:
+        chunks: Groups of standards that were checked
+        results: Reports for each group, or the exception its check raised
+
+    Returns:
+        One report per standard, with a failure section for failed groups
+
+    Raises:
+        BaseException: The first group's error, if every group failed
+    """
+    failures = [r for r in results if isinstance(r, BaseException)]
+    if failures and len(failures) == len(results):
+        raise failures[0]
+
+    reports = []
+    for chunk, result in zip(chunks, results):
+        if isinstance(result, BaseException):
+            logger.error(
+                f"Compliance check failed for {len(chunk)} standards: {str(result)}")
+            reports.extend(
+                generate_failed_report(standard, result) for standard in chunk)
+        else:
+            reports.extend(result)
+    return reports
 
 
 async def process_standards(
     standards: List[Dict[str, Any]],
-    codebase_content: str
+    codebase_file: Path
 ) -> List[str]:
     """Process each standard and generate compliance reports.
 
+    Standards are grouped so that several share one prompt (and one copy of
+    the codebase) while their reports still fit within ANTHROPIC_MAX_TOKENS,
+    unless ANTHROPIC_GROUP_STANDARDS is disabled. Standards missing from a
+    grouped response are checked again on their own.
+    The codebase is only read into memory here, for the duration of the
+    compliance checks.
+
+    Every prompt starts with the same codebase block so it can be served
+    from the prompt cache. With caching enabled, the first group is checked
+    before the others start, so that they find the codebase already cached.
+
+    Groups are checked concurrently, bounded and paced by the limits from
+    get_llm_limits, which every review in the process shares. When there
+    are more groups than ANTHROPIC_BATCH_THRESHOLD and the client supports
+    it, they are submitted as a single message batch instead.
+
+    Reports are returned in the same order as the standards; a group whose
+    check fails gets a failure section per standard instead of failing the
+    whole set.
+
     Args:
         standards: List of standards to process
-        codebase_content: Content of the codebase
+        codebase_file: Path to the flattened codebase file
 
     Returns:
         List of generated reports
 
     Raises:
-        ReportGenerationError: If report generation fails
+        ReportGenerationError: If report generation fails for every group
     """
-    try:
-        reports = []
-        for idx, standard in enumerate(standards, 1):
-            prompt = await generate_user_prompt(standard, codebase_content)
+    chunks = chunk_standards(standards, settings.ANTHROPIC_MAX_TOKENS)
+    semaphore, rate_limiter = get_llm_limits()
+    total = len(chunks)
+
+    async def _run_one(idx: int, chunk: List[Dict[str, Any]]) -> List[str]:
+        async with semaphore:
+            prompt = await generate_chunk_prompt(chunk, codebase_block)
+            await rate_limiter.acquire()
+            standard_ids = ", ".join(str(s['_id']) for s in chunk)
             logger.info(
-                f"Starting compliance check {idx}/{len(standards)}: {standard['_id']}")
+                f"Starting compliance check {idx}/{total}: {standard_ids}")
 
-            report_text = await AnthropicClient.create_message(
+            response_text = await AnthropicClient.create_message(
                 prompt=prompt,
                 system_prompt=SYSTEM_PROMPT
             )
 
-            reports.append(report_text)
             logger.debug(
-                f"Completed standard {idx}/{len(standards)}: {standard['_id']}\n"
-                f"Report length: {len(report_text)} chars\n"
-                f"Preview: {report_text[:150]}..."
+                f"Completed compliance check {idx}/{total}: {standard_ids}\n"
+                f"Response length: {len(response_text)} chars\n"
+                f"Preview: {response_text[:150]}..."
             )
+            return await _complete_reports(chunk, response_text)
+
+    async def _complete_reports(
+        chunk: List[Dict[str, Any]],
+        response_text: str
+    ) -> List[str]:
+        # Standards missing from a grouped response are checked one at a
+        # time, rather than failing the whole group
+        reports = parse_chunk_reports(response_text, chunk)
+        for standard in chunk:
+            standard_id = str(standard['_id'])
+            if standard_id in reports:
+                continue
+            logger.warning(
+                f"No report for standard {standard_id} in grouped response, "
+                "checking it on its own")
+            try:
+                await rate_limiter.acquire()
+                reports[standard_id] = await AnthropicClient.create_message(
+                    prompt=await generate_user_prompt(standard, codebase_block),
+                    system_prompt=SYSTEM_PROMPT
+                )
+            except Exception as e:
+                logger.error(f"Compliance check failed for {standard_id}: {str(e)}")
+                reports[standard_id] = generate_failed_report(standard, e)
+        return [reports[str(standard['_id'])] for standard in chunk]
 
-            await asyncio.sleep(10)  # Rate limiting
-
-        return reports
+    try:
+        codebase_block = generate_codebase_block(
+            codebase_file.read_text(encoding='utf-8'))
+        logger.debug(
+            f"Codebase content length: {len(codebase_block['text'])} characters")
+
+        if _use_batch(total):
+            logger.info(f"Submitting {total} compliance checks as a message batch")
+            prompts = [
+                await generate_chunk_prompt(chunk, codebase_block)
+                for chunk in chunks
+            ]
+            responses = await AnthropicClient.create_batch(
+                prompts=prompts,
+                system_prompt=SYSTEM_PROMPT
+            )
+            results: List[Any] = []
+            for response, chunk in zip(responses, chunks):
+                if isinstance(response, BaseException):
+                    results.append(response)
+                    continue
+                async with semaphore:
+                    results.append(await _complete_reports(chunk, response))
+            return _collect_reports(chunks, results)
+
+        # With prompt caching, check the first group on its own so the cache
+        # is written once before the remaining groups read the codebase from it
+        waves = (
+            [chunks[:1], chunks[1:]]
+            if settings.ANTHROPIC_PROMPT_CACHING else [chunks]
+        )
+        results = []
+        for wave in waves:
+            results.extend(await asyncio.gather(
+                *(_run_one(idx, chunk)
+                  for idx, chunk in enumerate(wave, len(results) + 1)),
+                return_exceptions=True
+            ))
+        return _collect_reports(chunks, results)
 
     except Exception as e:
         raise ReportGenerationError(
@@ -224,12 +635,38 @@ async def get_classification_names(
     Returns:
         List of classification names
     """
-    db = await get_database()
-    classification_obj_ids = [ObjectId(id) for id in classification_ids]
-    classifications = await db.classifications.find(
-        {"_id": {"$in": classification_obj_ids}}
-    ).to_list(None)
-    return [c.get('name', '') for c in classifications if c.get('name')]
+    async def load() -> List[str]:
+        db = await get_database()
+        classification_obj_ids = [ObjectId(id) for id in classification_ids]
+        classifications = await db.classifications.find(
+            {"_id": {"$in": classification_obj_ids}}
+        ).to_list(None)
+        return [c.get('name', '') for c in classifications if c.get('name')]
+
+    names = await cache.get_or_load(
+        cache.CLASSIFICATIONS_BUCKET,
+        ("names", frozenset(classification_ids)),
+        load,
+        CLASSIFICATIONS_CACHE_TTL
+    )
+    return list(names)
+
+
+async def get_all_classifications() -> List[Classification]:
+    """Get all classifications from database.
+
+    Returns:
+        List of classifications
+    """
+    async def load() -> List[Classification]:
+        db = await get_database()
+        raw_classifications = await db.classifications.find().to_list(None)
+        return [Classification.model_validate(doc) for doc in raw_classifications]
+
+    classifications = await cache.get_or_load(
+        cache.CLASSIFICATIONS_BUCKET, "all", load, CLASSIFICATIONS_CACHE_TTL
+    )
+    return list(classifications)
 
 
 async def generate_report_header(
@@ -285,23 +722,21 @@ async def check_compliance(
         config = CodeReviewConfig()
         filtered_standards = await filter_standards(standards, config)
 
-        with open(codebase_file, 'r', encoding='utf-8') as f:
-            codebase_content = f.read()
-        logger.debug(
-            f"Codebase content length: {len(codebase_content)} characters")
-
-        reports = await process_standards(filtered_standards, codebase_content)
+        reports = await process_standards(filtered_standards, codebase_file)
         logger.info(f"Generated {len(reports)} compliance reports")
 
         header = await generate_report_header(standard_set_name, classification_names)
 
-        combined_report = header + "\n\n".join(reports)
-        combined_report += "\n\n## Specific Recommendations\n\n"
-
         report_file = codebase_file.parent / \
             f"{review_id}-{standard_set_name}.md"
+        # Write each part directly rather than building one combined string
         with open(report_file, 'w', encoding='utf-8') as f:
-            f.write(combined_report)
+            f.write(header)
+            for idx, report in enumerate(reports):
+                if idx:
+                    f.write("\n\n")
+                f.write(report)
+            f.write("\n\n## Specific Recommendations\n\n")
 
         logger.info(
             f"Completed compliance check for '{standard_set_name}', "
@@ -340,9 +775,7 @@ async def process_code_review(review_id: str, repository_url: str, standard_sets
         codebase_file = await process_repositories(repository_url)
 
         # Get all classifications
-        raw_classifications = await db.classifications.find().to_list(None)
-        classifications = [Classification.model_validate(
-            doc) for doc in raw_classifications]
+        classifications = await get_all_classifications()
 
         # Analyze codebase to determine relevant classifications
         matching_classification_ids = await analyze_codebase_classifications(
@@ -350,40 +783,57 @@ async def process_code_review(review_id: str, repository_url: str, standard_sets
             classifications
         )
 
-        # Process each standard set
-        compliance_reports = []
+        # Resolve valid standard set IDs, preserving the requested order
+        object_ids = []
         for standard_set_id in standard_sets:
             try:
-                # Get standard set from database
                 object_id = ensure_object_id(standard_set_id)
-                if not object_id:
-                    logger.error(
-                        f"Invalid standard set ID format: {standard_set_id}")
-                    continue
+            except ValueError:
+                object_id = None
+            if not object_id:
+                logger.error(
+                    f"Invalid standard set ID format: {standard_set_id}")
+                continue
+            object_ids.append(object_id)
+
+        # Fetch all requested standard sets and their matching standards
+        # in one query each rather than two queries per standard set
+        standard_sets_by_id = {}
+        standards_by_set = defaultdict(list)
+        if object_ids:
+            found_sets = await db.standard_sets.find(
+                {"_id": {"$in": object_ids}}
+            ).to_list(None)
+            standard_sets_by_id = {s["_id"]: s for s in found_sets}
+
+            query = {
+                "standard_set_id": {"$in": object_ids},
+                "$or": [
+                    *[{"classification_ids": obj_id}
+                        for obj_id in matching_classification_ids],
+                    {"$or": [
+                        {"classification_ids": {"$size": 0}},
+                        {"classification_ids": {"$exists": False}},
+                        {"classification_ids": None}
+                    ]}
+                ]
+            }
+            for standard in await db.standards.find(query).to_list(None):
+                standards_by_set[standard.get("standard_set_id")].append(standard)
 
-                standard_set = await db.standard_sets.find_one({"_id": object_id})
+        # Process each standard set
+        compliance_reports = []
+        for object_id in object_ids:
+            try:
+                standard_set = standard_sets_by_id.get(object_id)
                 if not standard_set:
-                    logger.error(f"Standard set {standard_set_id} not found")
+                    logger.error(f"Standard set {object_id} not found")
                     continue
 
-                # Query for matching standards
-                query = {
-                    "standard_set_id": object_id,
-                    "$or": [
-                        *[{"classification_ids": obj_id}
-                            for obj_id in matching_classification_ids],
-                        {"$or": [
-                            {"classification_ids": {"$size": 0}},
-                            {"classification_ids": {"$exists": False}},
-                            {"classification_ids": None}
-                        ]}
-                    ]
-                }
-
-                standards = await db.standards.find(query).to_list(None)
+                standards = standards_by_set.get(object_id)
                 if not standards:
                     logger.warning(
-                        f"No matching standards found for standard set {standard_set_id}")
+                        f"No matching standards found for standard set {object_id}")
                     continue
 
                 # Check compliance
@@ -405,7 +855,7 @@ async def process_code_review(review_id: str, repository_url: str, standard_sets
 
             except Exception as e:
                 logger.error(
-                    f"Error processing standard set {standard_set_id}: {str(e)}")
+                    f"Error processing standard set {object_id}: {str(e)}")
                 continue
 
         # Update the code review with compliance reports
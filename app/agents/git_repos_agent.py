@@ -1,8 +1,10 @@
 """Git Repos Agent for handling repository operations."""
+import asyncio
 import os
+import shutil
 import git
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 from app.common.logging import get_logger
 from app.config.config import settings
 import tempfile
@@ -13,18 +15,29 @@ STANDARDS_REPO = "https://github.com/DEFRA/software-development-standards"
 DATA_DIR = Path("/app/data")
 CODEBASE_DIR = DATA_DIR / "codebase"
 
-# Files to exclude when flattening
-EXCLUDED_FILES = {
-    # Binary files
-    '.png', '.jpg', '.jpeg', '.gif', '.pdf', '.zip',
-    # Package lock files
+# File extensions to exclude when flattening (binary files)
+EXCLUDED_EXTS = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.pdf', '.zip'
+})
+
+# File names to exclude when flattening (package lock files)
+EXCLUDED_NAMES = frozenset({
     'package-lock.json', 'yarn.lock', 'pnpm-lock.yaml',
     'poetry.lock', 'Pipfile.lock', 'composer.lock',
     'Gemfile.lock', 'cargo.lock', 'packages.lock.json'
-}
+})
+
+# Files to exclude when flattening
+EXCLUDED_FILES = EXCLUDED_EXTS | EXCLUDED_NAMES
+
+# Options for cloning only the latest commit of the default branch
+SHALLOW_CLONE_OPTIONS = ['--depth=1', '--single-branch', '--no-tags']
+
+# Buffer size used when copying file contents into the flattened output
+COPY_BUFFER_SIZE = 1024 * 1024
 
 # Directories to exclude
-EXCLUDED_DIRS = {'.git', 'node_modules', '__pycache__', '.venv', 'venv'}
+EXCLUDED_DIRS = frozenset({'.git', 'node_modules', '__pycache__', '.venv', 'venv'})
 
 def configure_git_proxy():
     """Configure git proxy settings from environment variables.
@@ -46,29 +59,60 @@ def configure_git_proxy():
         logger.debug("No proxy configuration found")
 
 async def flatten_repository(repo_path: Path, output_file: Path) -> None:
-    """Flatten a repository's files into a single text file."""
+    """Flatten a repository's files into a single text file.
+
+    The directory walk and file reads are blocking, so they run in a worker
+    thread to keep the event loop free while large repositories are read.
+    """
     logger.debug(f"Flattening repository at {repo_path} to {output_file}")
+    await asyncio.to_thread(_flatten_repository_sync, repo_path, output_file)
+
+
+def _iter_repo(path: str) -> Iterator[os.DirEntry]:
+    """Yield the files of a directory tree, skipping excluded directories.
+
+    Uses os.scandir so file and directory checks come from the directory
+    listing rather than a separate stat call per entry. Files in a directory
+    are yielded before those in its subdirectories, and symlinked directories
+    are not followed.
+    """
+    subdirs = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in EXCLUDED_DIRS:
+                    subdirs.append(entry.path)
+            elif entry.is_file():
+                yield entry
+
+    for subdir in subdirs:
+        yield from _iter_repo(subdir)
+
 
+def _flatten_repository_sync(repo_path: Path, output_file: Path) -> None:
+    """Write the included files of a repository into a single text file."""
     with open(output_file, 'w', encoding='utf-8') as f:
-        for root, dirs, files in os.walk(repo_path):
-            # Modify dirs in place to exclude unwanted directories
-            dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS]
-
-            for file in files:
-                # Skip excluded files
-                if any(file.endswith(ext) for ext in EXCLUDED_FILES) or any(file == excluded for excluded in EXCLUDED_FILES):
-                    logger.debug(f"Skipping excluded file: {file}")
-                    continue
-
-                file_path = Path(root) / file
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as source_file:
-                        relative_path = file_path.relative_to(repo_path)
-                        f.write(f"\n# File: {relative_path}\n")
-                        f.write(source_file.read())
-                        f.write("\n")
-                except (UnicodeDecodeError, IOError) as e:
-                    logger.warning(f"Skipping file {file_path}: {str(e)}")
+        for entry in _iter_repo(str(repo_path)):
+            # Skip excluded files
+            ext = os.path.splitext(entry.name)[1].lower()
+            if ext in EXCLUDED_EXTS or entry.name in EXCLUDED_NAMES:
+                logger.debug(f"Skipping excluded file: {entry.name}")
+                continue
+
+            file_path = Path(entry.path)
+            # Remember where this file's section starts, so a file that turns
+            # out not to be valid UTF-8 part way through leaves no output
+            section_start = f.tell()
+            try:
+                with open(file_path, 'r', encoding='utf-8') as source_file:
+                    relative_path = file_path.relative_to(repo_path)
+                    f.write(f"\n# File: {relative_path}\n")
+                    shutil.copyfileobj(source_file, f, COPY_BUFFER_SIZE)
+                    f.write("\n")
+            except (UnicodeDecodeError, IOError) as e:
+                logger.warning(f"Skipping file {file_path}: {str(e)}")
+                f.seek(section_start)
+                f.truncate()
 
 
 async def clone_repo(repo_url: str, target_dir: Path) -> None:
@@ -76,13 +120,13 @@ async def clone_repo(repo_url: str, target_dir: Path) -> None:
     logger.info(f"Cloning repository {repo_url} to {target_dir}")
     if target_dir.exists():
         logger.info(f"Removing existing directory: {target_dir}")
-        import shutil
         shutil.rmtree(target_dir)
 
     # Configure proxy before git operations
     configure_git_proxy()
     
-    git.Repo.clone_from(repo_url, str(target_dir))
+    # Only the working tree is reviewed, so skip history and other refs
+    git.Repo.clone_from(repo_url, str(target_dir), multi_options=SHALLOW_CLONE_OPTIONS)
 
 
 async def download_repository(repository_url: str) -> Tuple[Path, tempfile.TemporaryDirectory]:
@@ -52,6 +52,9 @@ async def read_codebase_content(codebase_path: Path) -> str:
     Raises:
         CodebaseReadError: If reading files fails
     """
+    if not Path(codebase_path).is_dir():
+        raise CodebaseReadError(f"Codebase path not found: {codebase_path}")
+
     try:
         codebase_content = ""
         for root, _, files in os.walk(codebase_path):
@@ -0,0 +1,108 @@
+"""In-process TTL cache for repeated database lookups.
+
+Each process has its own cache, and invalidate only clears the calling
+process. The TTL is the only consistency guarantee across processes: a
+change made through the API is seen by background workers once their
+cached value expires.
+"""
+import asyncio
+import time
+from collections.abc import Hashable
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+from app.common.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+CacheKey = Tuple[str, Hashable]
+
+# Buckets shared by the modules that read and invalidate them
+CLASSIFICATIONS_BUCKET = "classifications"
+
+# {(bucket, key): (expiry, value)}
+_entries: Dict[CacheKey, Tuple[float, Any]] = {}
+_locks: Dict[CacheKey, asyncio.Lock] = {}
+
+
+async def get_or_load(
+    bucket: str,
+    key: Hashable,
+    loader: Callable[[], Awaitable[T]],
+    ttl: float
+) -> T:
+    """Return a cached value, loading and storing it on a miss or expiry.
+
+    Concurrent callers for the same key wait on a single load rather than
+    each issuing their own query. Storing a value also evicts every expired
+    entry, so keys that are never read again do not accumulate.
+
+    Args:
+        bucket: Logical group of the cached value, used for invalidation
+        key: Hashable key identifying the value within the bucket
+        loader: Coroutine function producing the value on a miss
+        ttl: Seconds the loaded value stays valid
+
+    Returns:
+        The cached or freshly loaded value
+    """
+    cache_key = (bucket, key)
+    entry = _entries.get(cache_key)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+
+    lock = _locks.setdefault(cache_key, asyncio.Lock())
+    async with lock:
+        # Another caller may have loaded the value while we waited
+        entry = _entries.get(cache_key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+
+        logger.debug(f"Cache miss for {bucket}:{key}")
+        value = await loader()
+        now = time.monotonic()
+        _evict_expired(now)
+        _entries[cache_key] = (now + ttl, value)
+        return value
+
+
+def _evict_expired(now: float) -> None:
+    """Drop expired entries, along with their idle locks.
+
+    Args:
+        now: Current time.monotonic() value
+    """
+    for cache_key in [k for k, (expiry, _) in _entries.items() if expiry <= now]:
+        del _entries[cache_key]
+        lock = _locks.get(cache_key)
+        if lock and not lock.locked():
+            del _locks[cache_key]
+
+
+def invalidate(bucket: str) -> None:
+    """Drop all cached values in a bucket, along with their idle locks.
+
+    Locks held by an in-progress load are kept so its waiters still share it.
+
+    Args:
+        bucket: Bucket to invalidate
+    """
+    for cache_key in [k for k in _entries if k[0] == bucket]:
+        del _entries[cache_key]
+    for cache_key in [k for k, lock in _locks.items()
+                      if k[0] == bucket and not lock.locked()]:
+        del _locks[cache_key]
+
+
+def clear(bucket: Optional[str] = None) -> None:
+    """Drop cached values and locks, for all buckets when none is given.
+
+    Args:
+        bucket: Optional bucket to clear
+    """
+    if bucket is not None:
+        invalidate(bucket)
+        return
+    _entries.clear()
+    _locks.clear()
@@ -1,30 +1,50 @@
 """Logging configuration for the application."""
 import logging
 import logging.config
-import os
-from datetime import datetime
 from pathlib import Path
 import yaml
 from app.config.config import settings
 import sys
 from typing import Optional
 
+try:
+    # Prefer the LibYAML-backed loader when PyYAML was built with it
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader
+
+# Base logging configuration, read from the working directory
+LOGGING_CONFIG_FILE = Path("logging.yaml")
+
+# Local log file, rotated once it reaches LOG_FILE_MAX_BYTES
+LOG_FILE = Path("logs") / "app.log"
+LOG_FILE_MAX_BYTES = 10 * 1024 * 1024
+LOG_FILE_BACKUP_COUNT = 5
+
+STANDARD_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+_configured = False
+
 def configure_logging() -> None:
     """Configure logging for the application.
     
     Uses standard formatting for local development and ECS formatting for other environments.
-    Adds file logging in local environment.
+    Adds file logging in local environment. Repeated calls in the same process
+    are no-ops.
     """
+    global _configured
+    if _configured:
+        return
+    
     # Load base config
-    with open("logging.yaml", "r") as f:
-        config = yaml.safe_load(f)
+    with open(LOGGING_CONFIG_FILE, "r") as f:
+        config = yaml.load(f, Loader=SafeLoader)
     
     # Set log level from settings
     config["root"]["level"] = settings.LOG_LEVEL
     
     # Configure formatters based on environment
-    is_local = os.environ.get("LOG_TYPE", "").lower() == "local"
-    standard_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    is_local = settings.LOG_TYPE.lower() == "local"
     
     # Reduce MongoDB noise
     config["loggers"]["pymongo"] = {
@@ -35,16 +55,19 @@ def configure_logging() -> None:
     
     if is_local:
         # Use standard format for local development
-        config["formatters"]["default"]["format"] = standard_format
-        config["formatters"]["access"]["format"] = standard_format
+        config["formatters"]["default"]["format"] = STANDARD_FORMAT
+        config["formatters"]["access"]["format"] = STANDARD_FORMAT
         
-        # Add file handler for local development
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
+        # Add a rotating file handler for local development; the file is only
+        # opened on the first record
+        LOG_FILE.parent.mkdir(exist_ok=True)
         
         config["handlers"]["file"] = {
-            "class": "logging.FileHandler",
-            "filename": str(log_dir / f"app_{datetime.now():%Y%m%d_%H%M%S}.log"),
+            "class": "logging.handlers.RotatingFileHandler",
+            "filename": str(LOG_FILE),
+            "maxBytes": LOG_FILE_MAX_BYTES,
+            "backupCount": LOG_FILE_BACKUP_COUNT,
+            "delay": True,
             "formatter": "default",
             "level": "DEBUG"
         }
@@ -56,6 +79,7 @@ def configure_logging() -> None:
     
     # Apply configuration
     logging.config.dictConfig(config)
+    _configured = True
 
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     """Get a logger instance.
@@ -1,16 +1,20 @@
 """SSL context configuration for MongoDB connections."""
+import atexit
 import os
 import base64
 import tempfile
+from functools import lru_cache
 from typing import Dict, Tuple
 from app.common.logging import get_logger
 
 logger = get_logger(__name__)
 
+@lru_cache(maxsize=1)
 def get_truststore_certs() -> list[str]:
     """Get certificates from environment variables starting with TRUSTSTORE_.
     
     Reads base64 encoded certificates from environment variables and decodes them.
+    The result is cached as the environment is fixed once the process starts.
     
     Returns:
         list[str]: List of decoded certificate strings.
@@ -35,11 +39,32 @@ def get_truststore_certs() -> list[str]:
     
     return certs
 
+def remove_ca_file(path: str, owner_pid: int) -> None:
+    """Remove the CA file at exit of the process that created it.
+    
+    The MongoDB client reads the file for every new TLS connection, so it
+    must outlive startup and is only removed when the process exits.
+    
+    Args:
+        path: Path of the CA file
+        owner_pid: PID of the process that created the file
+    """
+    if os.getpid() != owner_pid:
+        return
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning("Failed to remove CA file", extra={"path": path, "error": str(e)})
+
+@lru_cache(maxsize=1)
 def get_mongodb_ssl_options() -> Tuple[Dict, str]:
     """Get MongoDB SSL options based on environment configuration.
     
     Creates a temporary file with CA certificates from environment variables
-    when secure context is enabled.
+    when secure context is enabled. The result is cached so every client
+    shares one CA file rather than writing a new one per connection.
     
     Returns:
         Tuple[Dict, str]: (MongoDB connection options, temp file path)
@@ -62,9 +87,9 @@ def get_mongodb_ssl_options() -> Tuple[Dict, str]:
             delete=False,
             suffix='.pem'
         )
-        for cert in certs:
-            temp_ca_file.write(f"{cert}\n")
-        temp_ca_file.flush()
+        temp_ca_file.write("\n".join(certs) + "\n")
+        temp_ca_file.close()
+        atexit.register(remove_ca_file, temp_ca_file.name, os.getpid())
         
         # MongoDB TLS configuration
         return {
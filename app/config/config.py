@@ -9,25 +9,52 @@ class Settings(BaseSettings):
     MONGO_URI: str = "mongodb://127.0.0.1:27017/"
     ANTHROPIC_API_KEY: Optional[str] = None  # Made optional
     LOG_LEVEL: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO"
+    LOG_TYPE: str = ""  # "local" for plain text logs and a log file, otherwise ECS
     
     # Anthropic settings
     ANTHROPIC_BEDROCK: str = "false"  # Controls whether to use AWS Bedrock or direct API
     ANTHROPIC_MODEL: str = "claude-3-5-sonnet-20241022"
     ANTHROPIC_MAX_TOKENS: int = 8192
     ANTHROPIC_TEMPERATURE: float = 0.0
-    
+    ANTHROPIC_PROMPT_CACHING: bool = True
+    # Retries with exponential backoff on rate limits, 5xx and connection errors
+    ANTHROPIC_MAX_RETRIES: int = 4
+
+    # LLM request throughput settings, totals split evenly across the
+    # BACKGROUND_WORKERS processes
+    LLM_MAX_CONCURRENCY: int = 8
+    LLM_REQUESTS_PER_MINUTE: int = 50
+    # Check several standards per prompt, as many as ANTHROPIC_MAX_TOKENS
+    # leaves room for; disable to send one prompt per standard
+    ANTHROPIC_GROUP_STANDARDS: bool = True
+    # Use the Message Batches API above this many standards (0 disables)
+    ANTHROPIC_BATCH_THRESHOLD: int = 0
+    ANTHROPIC_BATCH_POLL_INTERVAL: float = 30.0
+
     # AWS Bedrock settings
     AWS_ACCESS_KEY: str = ""
     AWS_SECRET_KEY: str = ""
     AWS_REGION: str = ""
     AWS_BEDROCK_MODEL: str = ""
     
+    # Worker processes for background code reviews
+    BACKGROUND_WORKERS: int = 4
+
     # Feature flags
     LLM_TESTING: bool = False
     LLM_TESTING_STANDARDS_FILES: str = ""
     
     # MongoDB Docker settings (optional with defaults)
     MONGO_DATABASE: str = "ai-sdlc-codereview-api"
+    MONGO_MAX_POOL_SIZE: int = 100
+    MONGO_MIN_POOL_SIZE: int = 0
+    MONGO_MAX_IDLE_TIME_MS: int = 30000
+    MONGO_WAIT_QUEUE_TIMEOUT_MS: int = 10000
+    # Schema setup at startup: in the background, before serving, or not at all
+    MIGRATION_MODE: Literal["async", "sync", "skip"] = "async"
+    # Acknowledge schema commands from the primary only, without waiting for
+    # replication or the journal; schema setup is idempotent and re-run on start
+    FAST_STARTUP: bool = True
     
     # Git proxy settings
     CDP_HTTP_PROXY: Optional[str] = None
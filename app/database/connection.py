@@ -3,9 +3,11 @@
 This module provides functions for creating and managing MongoDB connections
 with consistent configuration across the application and child processes.
 """
+import atexit
 import os
 from typing import Dict, Any, Tuple, Optional
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo.read_preferences import ReadPreference
 
 from app.config.config import settings
 from app.common.ssl_context import get_mongodb_ssl_options
@@ -13,6 +15,10 @@ from app.common.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Long-lived clients keyed by (uri, pid). A forked child sees the parent's
+# entries under a different pid and so builds its own client.
+_clients: Dict[Tuple[str, int], AsyncIOMotorClient] = {}
+
 def get_connection_options() -> Dict[str, Any]:
     """Get standardized MongoDB connection options.
     
@@ -22,7 +28,10 @@ def get_connection_options() -> Dict[str, Any]:
     # Base MongoDB connection options
     connection_options = {
         "retryWrites": True,
-        "readPreference": "primary"
+        "maxPoolSize": settings.MONGO_MAX_POOL_SIZE,
+        "minPoolSize": settings.MONGO_MIN_POOL_SIZE,
+        "maxIdleTimeMS": settings.MONGO_MAX_IDLE_TIME_MS,
+        "waitQueueTimeoutMS": settings.MONGO_WAIT_QUEUE_TIMEOUT_MS
     }
     
     # Add AWS auth mechanism only if in AWS
@@ -37,7 +46,10 @@ def get_connection_options() -> Dict[str, Any]:
     return connection_options
 
 def create_client(uri: Optional[str] = None) -> Tuple[AsyncIOMotorClient, AsyncIOMotorDatabase]:
-    """Create a new MongoDB client and database.
+    """Get the MongoDB client and database for this process.
+    
+    Clients are reused for the same URI within a process, so repeated calls
+    share one connection pool instead of handshaking again.
     
     Args:
         uri: Optional MongoDB URI. If not provided, uses the one from settings.
@@ -46,9 +58,35 @@ def create_client(uri: Optional[str] = None) -> Tuple[AsyncIOMotorClient, AsyncI
         Tuple of (client, database)
     """
     connection_uri = uri or settings.MONGO_URI
-    connection_options = get_connection_options()
+    key = (connection_uri, os.getpid())
     
-    client = AsyncIOMotorClient(connection_uri, **connection_options)
-    db = client[settings.MONGO_DATABASE]
+    client = _clients.get(key)
+    if client is None:
+        connection_options = get_connection_options()
+        client = AsyncIOMotorClient(connection_uri, **connection_options)
+        _clients[key] = client
+    db = client.get_database(
+        settings.MONGO_DATABASE,
+        read_preference=ReadPreference.PRIMARY
+    )
+    
+    return client, db
+
+def close_client(client: AsyncIOMotorClient) -> None:
+    """Close a client and stop it being reused.
     
-    return client, db 
\ No newline at end of file
+    Args:
+        client: Client returned by create_client
+    """
+    for key, cached in list(_clients.items()):
+        if cached is client:
+            del _clients[key]
+    client.close()
+
+@atexit.register
+def close_all_clients() -> None:
+    """Close every client created by this process."""
+    pid = os.getpid()
+    for key, client in list(_clients.items()):
+        if key[1] == pid:
+            close_client(client)
@@ -1,243 +1,265 @@
 """Database initialization module."""
+import asyncio
+import json
 import os
-from datetime import datetime, UTC
+import socket
+from datetime import datetime, timedelta, UTC
+from typing import Optional
+import bson
+from bson.raw_bson import RawBSONDocument
+from pymongo import ASCENDING, DESCENDING, IndexModel, ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from pymongo.write_concern import WriteConcern
 from app.config.config import settings
-from app.models.code_review import ReviewStatus
-from app.common.ssl_context import get_mongodb_ssl_options
 from app.common.logging import get_logger
 from app.database.connection import create_client
+from app.database.schemas import (
+    classifications_schema,
+    code_review_schema,
+    standard_sets_schema,
+    standards_schema
+)
 
 logger = get_logger(__name__)
 
-# MongoDB validation schemas
-classifications_schema = {
-    "$jsonSchema": {
-        "bsonType": "object",
-        "required": ["name"],
-        "properties": {
-            "_id": {
-                "bsonType": "objectId",
-                "description": "Unique identifier"
-            },
-            "name": {
-                "bsonType": "string",
-                "description": "Classification name"
-            }
-        }
-    }
-}
+# Advisory lock so only one replica sets up the schema at a time
+SCHEMA_LOCK_COLLECTION = "_migration_lock"
+SCHEMA_LOCK_ID = "schema"
+SCHEMA_LOCK_TTL = timedelta(seconds=60)
+SCHEMA_LOCK_POLL_INTERVAL = 1.0
 
-standard_sets_schema = {
-    "$jsonSchema": {
-        "bsonType": "object",
-        "required": ["name", "repository_url"],
-        "properties": {
-            "_id": {
-                "bsonType": "objectId",
-                "description": "Unique identifier"
-            },
-            "name": {
-                "bsonType": "string",
-                "description": "Standard set name"
-            },
-            "repository_url": {
-                "bsonType": "string",
-                "description": "URL of the repository containing standards"
-            },
-            "custom_prompt": {
-                "bsonType": "string",
-                "description": "Custom prompt for LLM processing"
-            },
-            "created_at": {
-                "bsonType": "date",
-                "description": "Creation timestamp"
-            },
-            "updated_at": {
-                "bsonType": "date",
-                "description": "Last update timestamp"
-            }
-        }
-    }
+async def try_schema_lock(lock_collection, owner: str) -> bool:
+    """Take the schema lock if it is free or has expired.
+
+    Args:
+        lock_collection: Collection holding the lock document
+        owner: Identifier of this process
+
+    Returns:
+        bool: True if this process now holds the lock
+    """
+    now = datetime.now(UTC)
+    try:
+        lock = await lock_collection.find_one_and_update(
+            {"_id": SCHEMA_LOCK_ID, "expires": {"$lt": now}},
+            {"$set": {"expires": now + SCHEMA_LOCK_TTL, "owner": owner, "status": "running"}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+    except DuplicateKeyError:
+        # The lock document exists and has not expired
+        return False
+    return bool(lock) and lock.get("owner") == owner
+
+async def acquire_schema_lock(db, owner: str) -> bool:
+    """Wait for the schema lock, or for another replica to finish setup.
+
+    Args:
+        db: Database to lock
+        owner: Identifier of this process
+
+    Returns:
+        bool: True if this process should run schema setup, False if another
+        replica completed it or did not finish within the lock TTL
+    """
+    lock_collection = db[SCHEMA_LOCK_COLLECTION]
+    deadline = datetime.now(UTC) + SCHEMA_LOCK_TTL
+    while not await try_schema_lock(lock_collection, owner):
+        await asyncio.sleep(SCHEMA_LOCK_POLL_INTERVAL)
+        lock = await lock_collection.find_one({"_id": SCHEMA_LOCK_ID})
+        if lock and lock.get("status") == "succeeded":
+            logger.info(f"Schema setup completed by {lock.get('owner')}")
+            return False
+        if datetime.now(UTC) > deadline:
+            logger.warning("Timed out waiting for schema lock, skipping schema setup")
+            return False
+    return True
+
+async def release_schema_lock(db, owner: str, status: str) -> None:
+    """Release the schema lock, recording the outcome for waiting replicas.
+
+    Args:
+        db: Database holding the lock
+        owner: Identifier of this process
+        status: Outcome of schema setup
+    """
+    await db[SCHEMA_LOCK_COLLECTION].update_one(
+        {"_id": SCHEMA_LOCK_ID, "owner": owner},
+        {"$set": {"status": status, "expires": datetime.now(UTC)}}
+    )
+
+def schema_fingerprint(schema: dict) -> str:
+    """Get a stable representation of a validator for comparison.
+
+    Args:
+        schema: Validator document
+
+    Returns:
+        str: JSON text of the validator with sorted keys
+    """
+    return json.dumps(schema, sort_keys=True, default=str)
+
+# Validation schema for each managed collection
+COLLECTION_SCHEMAS = {
+    "code_reviews": code_review_schema,
+    "classifications": classifications_schema,
+    "standard_sets": standard_sets_schema,
+    "standards": standards_schema
 }
 
-standards_schema = {
-    "$jsonSchema": {
-        "bsonType": "object",
-        "required": ["text", "repository_path", "standard_set_id", "classification_ids", "created_at", "updated_at"],
-        "properties": {
-            "_id": {
-                "bsonType": "objectId",
-                "description": "Unique identifier"
-            },
-            "text": {
-                "bsonType": "string",
-                "description": "Standard text content"
-            },
-            "repository_path": {
-                "bsonType": "string",
-                "description": "Path to the standard in the repository"
-            },
-            "standard_set_id": {
-                "bsonType": "objectId",
-                "description": "Reference to the standard set"
-            },
-            "classification_ids": {
-                "bsonType": "array",
-                "items": {
-                    "bsonType": "objectId",
-                    "description": "Reference to classifications"
-                },
-                "description": "List of classification references"
-            },
-            "created_at": {
-                "bsonType": "date",
-                "description": "Creation timestamp"
-            },
-            "updated_at": {
-                "bsonType": "date",
-                "description": "Last update timestamp"
-            }
-        }
-    }
+# Encoded to BSON and fingerprinted once at import, then reused for every
+# create_collection / collMod call and comparison
+ENCODED_SCHEMAS = {
+    name: RawBSONDocument(bson.encode(schema))
+    for name, schema in COLLECTION_SCHEMAS.items()
+}
+SCHEMA_FINGERPRINTS = {
+    name: schema_fingerprint(schema)
+    for name, schema in COLLECTION_SCHEMAS.items()
 }
 
-code_review_schema = {
-    "$jsonSchema": {
-        "bsonType": "object",
-        "required": ["repository_url", "status", "standard_sets", "created_at", "updated_at"],
-        "properties": {
-            "_id": {
-                "bsonType": "objectId",
-                "description": "Unique identifier"
-            },
-            "repository_url": {
-                "bsonType": "string",
-                "description": "Repository URL to analyze"
-            },
-            "status": {
-                "enum": [s.value for s in ReviewStatus],
-                "description": "Current review status"
-            },
-            "standard_sets": {
-                "bsonType": "array",
-                "items": {
-                    "bsonType": "object",
-                    "required": ["_id", "name"],
-                    "properties": {
-                        "_id": {
-                            "bsonType": "objectId",
-                            "description": "Standard set identifier"
-                        },
-                        "name": {
-                            "bsonType": "string",
-                            "description": "Name of the standard set"
-                        }
-                    }
-                }
-            },
-            "compliance_reports": {
-                "bsonType": "array",
-                "items": {
-                    "bsonType": "object",
-                    "required": ["_id", "standard_set_name", "file", "report"],
-                    "properties": {
-                        "_id": {
-                            "bsonType": "objectId",
-                            "description": "Report identifier"
-                        },
-                        "standard_set_name": {
-                            "bsonType": "string",
-                            "description": "Name of the standard set"
-                        },
-                        "file": {
-                            "bsonType": "string",
-                            "description": "File path being reviewed"
-                        },
-                        "report": {
-                            "bsonType": "string",
-                            "description": "Detailed compliance report"
-                        }
-                    }
-                }
-            },
-            "created_at": {
-                "bsonType": "date",
-                "description": "Creation timestamp"
-            },
-            "updated_at": {
-                "bsonType": "date",
-                "description": "Last update timestamp"
-            }
-        }
-    }
+# Indexes for the managed collections, matching the repository and agent
+# queries; create_indexes is a no-op for indexes that already exist
+COLLECTION_INDEXES = {
+    "code_reviews": [
+        IndexModel([("status", ASCENDING), ("created_at", DESCENDING)]),
+        IndexModel([("created_at", DESCENDING)])
+    ],
+    "classifications": [
+        IndexModel([("name", ASCENDING)])
+    ],
+    "standard_sets": [
+        IndexModel([("name", ASCENDING)], unique=True)
+    ],
+    "standards": [
+        IndexModel([("standard_set_id", ASCENDING)]),
+        IndexModel([("classification_ids", ASCENDING)])
+    ]
 }
 
+# Write concern for schema commands when FAST_STARTUP is enabled
+FAST_WRITE_CONCERN = WriteConcern(w=1, j=False)
+
+def schema_write_concern() -> Optional[WriteConcern]:
+    """Return the write concern for schema commands.
+
+    Returns:
+        Optional[WriteConcern]: Primary-only acknowledgement when FAST_STARTUP is
+        enabled, otherwise None to use the database default
+    """
+    return FAST_WRITE_CONCERN if settings.FAST_STARTUP else None
+
 async def init_database():
-    """Initialize database with schema validation.
+    """Initialize database with schema validation and indexes.
     
     Sets up MongoDB connection with proper SSL/TLS configuration and 
-    initializes collections with schema validation.
+    initializes collections with schema validation and their indexes.
     
     Returns:
         AsyncIOMotorDatabase: Initialized database instance
     """
-    # Configure SSL/TLS if enabled
-    _, temp_ca_file = get_mongodb_ssl_options()
+    # Initialize MongoDB client and test connection
+    client, db = create_client()
+    await client.admin.command('ping')
     
+    async def ensure_collection(
+        collection_name: str,
+        existing_validators: dict
+    ) -> None:
+        """Create a collection with validation, or update an existing one's validator."""
+        schema = ENCODED_SCHEMAS[collection_name]
+        write_concern = schema_write_concern()
+        if collection_name not in existing_validators:
+            try:
+                await db.create_collection(
+                    collection_name,
+                    write_concern=write_concern,
+                    validator=schema
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Failed to create collection {collection_name} with schema validation. "
+                    f"Creating without validation. Error: {str(e)}"
+                )
+                await db.create_collection(collection_name, write_concern=write_concern)
+        elif schema_fingerprint(existing_validators[collection_name]) == SCHEMA_FINGERPRINTS[collection_name]:
+            logger.debug(f"Schema validation for {collection_name} is up to date")
+        else:
+            command = {"collMod": collection_name, "validator": schema}
+            if write_concern is not None:
+                command["writeConcern"] = write_concern.document
+            try:
+                await db.command(command)
+            except Exception as e:
+                logger.warning(
+                    f"Failed to update schema validation for {collection_name}. "
+                    f"Continuing without validation. Error: {str(e)}"
+                )
+
+    async def ensure_indexes(collection_name: str) -> None:
+        """Create the collection's indexes if they do not already exist."""
+        collection = db.get_collection(
+            collection_name,
+            write_concern=schema_write_concern()
+        )
+        await collection.create_indexes(COLLECTION_INDEXES[collection_name])
+
+    owner = f"{socket.gethostname()}:{os.getpid()}"
     try:
-        # Initialize MongoDB client and test connection
-        client, db = create_client()
-        await client.admin.command('ping')
-        
-        # Create collections with schema validation
-        collections_config = {
-            "code_reviews": code_review_schema,
-            "classifications": classifications_schema,
-            "standard_sets": standard_sets_schema,
-            "standards": standards_schema
-        }
+        if not await acquire_schema_lock(db, owner):
+            return db
+        locked = True
+    except Exception as e:
+        logger.warning(f"Could not use schema lock, continuing without it. Error: {str(e)}")
+        locked = False
 
-        try:
-            for collection_name, schema in collections_config.items():
-                if collection_name not in await db.list_collection_names():
-                    try:
-                        await db.create_collection(
-                            collection_name,
-                            validator=schema
-                        )
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to create collection {collection_name} with schema validation. "
-                            f"Creating without validation. Error: {str(e)}"
-                        )
-                        await db.create_collection(collection_name)
-                else:
-                    try:
-                        await db.command({
-                            "collMod": collection_name,
-                            "validator": schema
-                        })
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to update schema validation for {collection_name}. "
-                            f"Continuing without validation. Error: {str(e)}"
-                        )
-        except Exception as e:
-            logger.warning(
-                "Failed to set up schema validation. "
-                "Application will continue without schema validation. "
-                f"Error: {str(e)}"
-            )
-                
-        return db
-        
+    status = "failed"
+    try:
+        # Fetch the existing collections with their current validators
+        cursor = await db.list_collections(
+            filter={"name": {"$in": list(COLLECTION_SCHEMAS)}}
+        )
+        existing = await cursor.to_list(None)
+        existing_validators = {
+            info["name"]: info.get("options", {}).get("validator", {})
+            for info in existing
+        }
+        # Set up all collections concurrently; a failure in one does not
+        # stop the others
+        results = await asyncio.gather(
+            *(ensure_collection(name, existing_validators)
+              for name in COLLECTION_SCHEMAS),
+            return_exceptions=True
+        )
+        for collection_name, result in zip(COLLECTION_SCHEMAS, results):
+            if isinstance(result, Exception):
+                logger.warning(
+                    f"Failed to set up collection {collection_name}. "
+                    f"Error: {str(result)}"
+                )
+        # Indexes need the collections to exist, so they follow the schema setup
+        results = await asyncio.gather(
+            *(ensure_indexes(name) for name in COLLECTION_INDEXES),
+            return_exceptions=True
+        )
+        for collection_name, result in zip(COLLECTION_INDEXES, results):
+            if isinstance(result, Exception):
+                logger.warning(
+                    f"Failed to create indexes for {collection_name}. "
+                    f"Error: {str(result)}"
+                )
+        status = "succeeded"
+    except Exception as e:
+        logger.warning(
+            "Failed to set up schema validation. "
+            "Application will continue without schema validation. "
+            f"Error: {str(e)}"
+        )
     finally:
-        # Clean up temporary certificate file
-        if temp_ca_file:
+        if locked:
             try:
-                os.unlink(temp_ca_file)
+                await release_schema_lock(db, owner, status)
             except Exception as e:
-                logger.error(
-                    "Failed to remove temporary CA file",
-                    extra={"error": str(e)}
-                )
+                logger.warning(f"Failed to release schema lock. Error: {str(e)}")
+            
+    return db
@@ -1,14 +1,34 @@
 """MongoDB database connection and initialization."""
+import os
+
 from app.database.database_init import init_database
-from app.database.connection import create_client
+from app.database.connection import close_client, create_client
 
-# Initialize client with centralized connection options
-client, db = create_client()
+# Created lazily on first use so the client binds to the running event loop
+# of the process that uses it, rather than the one that imported this module
+client = None
+db = None
+_pid = None
 
 async def get_database():
-    """Get database connection."""
+    """Get database connection, creating the client on first use in this process."""
+    global client, db, _pid
+    if db is None or _pid != os.getpid():
+        client, db = create_client()
+        _pid = os.getpid()
     return db
 
+def reset_database() -> None:
+    """Forget the current connection so the next get_database creates a new one."""
+    global client, db, _pid
+    client, db, _pid = None, None, None
+
+def close_database() -> None:
+    """Close this process's connection, if one was created, and forget it."""
+    if client is not None and _pid == os.getpid():
+        close_client(client)
+    reset_database()
+
 async def initialize_database():
     """Initialize database with schema validation if enabled."""
-    await init_database()
\ No newline at end of file
+    await init_database()
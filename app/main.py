@@ -1,27 +1,48 @@
 """Main FastAPI application."""
 
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from logging import getLogger
+from fastapi.responses import ORJSONResponse
 
 from aws_embedded_metrics.config import get_config
 from app.api.v1 import classifications, code_reviews, standard_sets
 from app.config.config import settings
-from app.database.database_utils import get_database, initialize_database
+from app.database.database_utils import close_database, get_database, initialize_database
 from app.common.logging import configure_logging, get_logger
+from app.utils.process_utils import shutdown_process_pool
 
 Confg = get_config()
 
 configure_logging()
 logger = get_logger(__name__)
 
+async def run_schema_migration(app: FastAPI, raise_errors: bool = False) -> None:
+    """Initialize the database schema, recording progress for the health check."""
+    app.state.migration_status = "running"
+    try:
+        await initialize_database()
+        app.state.migration_status = "succeeded"
+    except Exception as e:
+        app.state.migration_status = "failed"
+        logger.error(f"Database schema initialization failed: {str(e)}")
+        if raise_errors:
+            raise
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for database connection."""
+    migration_task = None
     try:
         # Initialize database schema only during startup
-        await initialize_database()
+        app.state.migration_status = "pending"
+        if settings.MIGRATION_MODE == "sync":
+            await run_schema_migration(app, raise_errors=True)
+        elif settings.MIGRATION_MODE == "async":
+            migration_task = asyncio.create_task(run_schema_migration(app))
+        else:
+            app.state.migration_status = "skipped"
         app.state.db = await get_database()
         
         logger.info(f"EMF Environment: {Confg.environment}")
@@ -29,12 +50,15 @@ async def lifespan(app: FastAPI):
         logger.info(f"EMF Service Name: {Confg.service_name}")
         yield
     finally:
-        if hasattr(app.state, 'db') and hasattr(app.state.db, 'client'):
-            app.state.db.client.close()
+        if migration_task and not migration_task.done():
+            migration_task.cancel()
+        shutdown_process_pool()
+        close_database()
 
 app = FastAPI(
     title="Defra AI Code Review API",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -54,4 +78,7 @@ app.include_router(standard_sets.router, prefix="/api/v1", tags=["Standard Sets"
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy"} 
\ No newline at end of file
+    return {
+        "status": "healthy",
+        "migration": getattr(app.state, "migration_status", "pending")
+    } 
\ No newline at end of file
@@ -7,7 +7,7 @@ from app.models.standard_set import StandardSet, StandardSetCreate, StandardSetW
 from app.common.logging import get_logger
 from app.utils.id_validation import ensure_object_id
 from pymongo import ReturnDocument
-from pymongo.errors import OperationFailure
+from pymongo.errors import DuplicateKeyError, OperationFailure
 from app.repositories.errors import DatabaseError, RepositoryError
 from bson.errors import InvalidId
 
@@ -44,12 +44,24 @@ class StandardSetRepository:
             })
             
             # Replace/insert the standard set
-            result = await self.collection.find_one_and_replace(
-                {"name": standard_set.name},
-                doc,
-                return_document=ReturnDocument.AFTER,
-                upsert=True
-            )
+            try:
+                result = await self.collection.find_one_and_replace(
+                    {"name": standard_set.name},
+                    doc,
+                    return_document=ReturnDocument.AFTER,
+                    upsert=True
+                )
+            except DuplicateKeyError:
+                # A concurrent create inserted this name first (names are
+                # unique), so replace that document, keeping its _id
+                logger.warning(
+                    f"Standard set {standard_set.name} was created concurrently, replacing it")
+                del doc["_id"]
+                result = await self.collection.find_one_and_replace(
+                    {"name": standard_set.name},
+                    doc,
+                    return_document=ReturnDocument.AFTER
+                )
             
             if result:
                 result["_id"] = str(result["_id"])
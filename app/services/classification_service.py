@@ -3,6 +3,7 @@ from typing import List, Optional
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from app.models.classification import Classification, ClassificationCreate
 from app.repositories.classification_repo import ClassificationRepository
+from app.common import cache
 from app.common.logging import get_logger
 
 logger = get_logger(__name__)
@@ -17,7 +18,9 @@ class ClassificationService:
 
     async def create_classification(self, classification: ClassificationCreate) -> Classification:
         """Create a new classification."""
-        return await self.repo.create(classification)
+        result = await self.repo.create(classification)
+        cache.invalidate(cache.CLASSIFICATIONS_BUCKET)
+        return result
 
     async def get_all_classifications(self) -> List[Classification]:
         """Get all classifications."""
@@ -25,4 +28,6 @@ class ClassificationService:
 
     async def delete_classification(self, id: str) -> bool:
         """Delete a classification."""
-        return await self.repo.delete(id) 
\ No newline at end of file
+        result = await self.repo.delete(id)
+        cache.invalidate(cache.CLASSIFICATIONS_BUCKET)
+        return result 
\ No newline at end of file
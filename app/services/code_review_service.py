@@ -8,13 +8,12 @@ This service orchestrates the code review process by:
 """
 from typing import List, Optional
 from motor.motor_asyncio import AsyncIOMotorDatabase
-from multiprocessing import Process
 from app.models.code_review import CodeReview, CodeReviewCreate, ReviewStatus, CodeReviewList
 from app.repositories.code_review_repo import CodeReviewRepository
 from app.agents.code_reviews_agent import process_code_review
 from app.common.logging import get_logger
 from app.utils.id_validation import ensure_object_id
-from app.utils.process_utils import run_async_in_process
+from app.utils.process_utils import run_in_worker_loop, submit_in_process
 
 logger = get_logger(__name__)
 
@@ -27,7 +26,7 @@ def _run_in_process(review_id: str, repository_url: str, standard_sets: List[str
         repository_url: URL of the repository to analyze
         standard_sets: List of standard set IDs to check against
     """
-    run_async_in_process(process_code_review, review_id, repository_url, standard_sets)
+    run_in_worker_loop(process_code_review, review_id, repository_url, standard_sets)
 
 
 class CodeReviewService:
@@ -38,27 +37,50 @@ class CodeReviewService:
         self.db = db
         self.repo = repo
 
-    async def create_review(self, code_review: CodeReviewCreate) -> CodeReview:
-        """Create a new code review and start the review process."""
-        # Validate standard sets exist before creating review
-        for standard_set_id in code_review.standard_sets:
+    async def _validate_standard_sets(self, standard_sets: List[str]) -> None:
+        """Check every standard set ID is valid and exists.
+
+        Raises:
+            ValueError: If an ID is invalid or a standard set is not found
+        """
+        if not standard_sets:
+            return
+
+        object_ids = []
+        for standard_set_id in standard_sets:
             object_id = ensure_object_id(standard_set_id)
             if not object_id:
                 raise ValueError(
                     f"Invalid standard set ID format: {standard_set_id}")
+            object_ids.append(object_id)
+
+        found = await self.db.standard_sets.find(
+            {"_id": {"$in": object_ids}}, {"_id": 1}
+        ).to_list(None)
+        found_ids = {doc["_id"] for doc in found}
+        missing = [
+            standard_set_id
+            for standard_set_id, object_id in zip(standard_sets, object_ids)
+            if object_id not in found_ids
+        ]
+        if len(missing) == 1:
+            raise ValueError(f"Standard set {missing[0]} not found")
+        if missing:
+            raise ValueError(f"Standard sets {', '.join(missing)} not found")
 
-            standard_set = await self.db.standard_sets.find_one({"_id": object_id})
-            if not standard_set:
-                raise ValueError(f"Standard set {standard_set_id} not found")
+    async def create_review(self, code_review: CodeReviewCreate) -> CodeReview:
+        """Create a new code review and start the review process."""
+        # Validate standard sets exist before creating review
+        await self._validate_standard_sets(code_review.standard_sets)
 
         created_review = await self.repo.create(code_review)
 
-        # Start agent in separate process
-        Process(
-            target=_run_in_process,
-            args=(str(created_review.id), code_review.repository_url,
-                  code_review.standard_sets)
-        ).start()
+        # Run agent in the shared worker pool
+        submit_in_process(
+            _run_in_process,
+            str(created_review.id), code_review.repository_url,
+            code_review.standard_sets
+        )
 
         return created_review
 
@@ -1,12 +1,11 @@
 """Service layer for standard set operations."""
 from typing import List, Optional
-from multiprocessing import Process
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from app.models.standard_set import StandardSet, StandardSetCreate, StandardSetWithStandards
 from app.repositories.standard_set_repo import StandardSetRepository
 from app.common.logging import get_logger
 from app.agents.standards_agent import process_standard_set
-from app.utils.process_utils import run_async_in_process
+from app.utils.process_utils import run_in_worker_loop, submit_in_process
 
 logger = get_logger(__name__)
 
@@ -30,11 +29,12 @@ class StandardSetService:
             # If it doesn't exist, create new
             standard_set_doc = await self.repo.create(standard_set)
             
-        # Start agent in separate process
-        Process(
-            target=self._run_agent_process_sync,
-            args=(str(standard_set_doc.id), standard_set.repository_url)
-        ).start()
+        # Start agent in the shared worker pool
+        submit_in_process(
+            self._run_agent_process_sync,
+            str(standard_set_doc.id),
+            standard_set.repository_url
+        )
         
         return standard_set_doc
 
@@ -53,4 +53,4 @@ class StandardSetService:
     @staticmethod
     def _run_agent_process_sync(standard_set_id: str, repository_url: str):
         """Run the agent process synchronously."""
-        run_async_in_process(process_standard_set, standard_set_id, repository_url) 
\ No newline at end of file
+        run_in_worker_loop(process_standard_set, standard_set_id, repository_url) 
\ No newline at end of file
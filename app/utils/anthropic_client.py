@@ -1,8 +1,10 @@
 """Singleton Anthropic client utility."""
+import asyncio
 import os
 from abc import ABC, abstractmethod
-from typing import Optional, Protocol, Union, Any
-from anthropic import AsyncAnthropic, AsyncAnthropicBedrock
+from typing import Any, ClassVar, Dict, List, Optional, Protocol, Union
+import httpx
+from anthropic import AsyncAnthropic, AsyncAnthropicBedrock, DefaultAsyncHttpxClient
 from app.common.logging import get_logger
 from app.config.config import settings
 
@@ -10,17 +12,44 @@ logger = get_logger(__name__)
 
 USE_BEDROCK = settings.ANTHROPIC_BEDROCK == 'true'
 
+# Connection pool for LLM calls. Idle connections are kept open long enough to
+# survive gaps between rate-limited requests, so calls reuse an established
+# TLS session instead of reconnecting.
+HTTP_MAX_CONNECTIONS = 64
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 32
+HTTP_KEEPALIVE_EXPIRY = 120.0
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create the pooled HTTP client shared by all LLM requests.
+
+    Returns:
+        httpx.AsyncClient: HTTP client with the SDK's default settings and a
+        long-lived connection pool
+    """
+    return DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY
+        )
+    )
+
 class AnthropicClientProtocol(Protocol):
     """Protocol defining the required interface for Anthropic clients."""
-    
+
     async def messages(self) -> Any:
         ...
 
 class BaseAnthropicClient(ABC):
-    """Abstract base class for Anthropic clients."""
-    
-    _instance: Optional[Union[AsyncAnthropic, AsyncAnthropicBedrock]] = None
-    
+    """Abstract base class for Anthropic clients.
+
+    Each subclass declares its own ``_instance`` so the direct and Bedrock
+    clients never read one another's cached instance.
+    """
+
+    _instance: ClassVar[Optional[Union[AsyncAnthropic, AsyncAnthropicBedrock]]] = None
+
     @abstractmethod
     def get_client(self) -> Union[AsyncAnthropic, AsyncAnthropicBedrock]:
         """Get client instance."""
@@ -28,7 +57,9 @@ class BaseAnthropicClient(ABC):
 
 class DirectAnthropicClient(BaseAnthropicClient):
     """Direct Anthropic API client implementation."""
-    
+
+    _instance: ClassVar[Optional[AsyncAnthropic]] = None
+
     @classmethod
     def get_client(cls) -> AsyncAnthropic:
         if cls._instance is None:
@@ -36,29 +67,38 @@ class DirectAnthropicClient(BaseAnthropicClient):
             if not api_key:
                 logger.error("ANTHROPIC_API_KEY environment variable not set")
                 raise ValueError("ANTHROPIC_API_KEY environment variable not set")
-                
+
             logger.debug("Creating new Direct Anthropic client instance")
-            cls._instance = AsyncAnthropic(api_key=api_key)
-            
+            cls._instance = AsyncAnthropic(
+                api_key=api_key,
+                max_retries=settings.ANTHROPIC_MAX_RETRIES,
+                http_client=create_http_client()
+            )
+
         return cls._instance
 
 class BedrockAnthropicClient(BaseAnthropicClient):
     """AWS Bedrock Anthropic client implementation."""
-    
+
+    _instance: ClassVar[Optional[AsyncAnthropicBedrock]] = None
+
     @classmethod
     def get_client(cls) -> AsyncAnthropicBedrock:
         if cls._instance is None:
-            cls._instance = AsyncAnthropicBedrock()
-            
+            cls._instance = AsyncAnthropicBedrock(
+                max_retries=settings.ANTHROPIC_MAX_RETRIES,
+                http_client=create_http_client()
+            )
+
         return cls._instance
 
 class AnthropicClientFactory:
     """Factory for creating appropriate Anthropic client."""
-    
+
     @staticmethod
     def create_client() -> BaseAnthropicClient:
         """Create appropriate client based on configuration.
-        
+
         Returns:
             BaseAnthropicClient: The appropriate client implementation
         """
@@ -66,64 +106,161 @@ class AnthropicClientFactory:
 
 class AnthropicClient:
     """Main interface for Anthropic client operations."""
-    
-    _instance: Optional[BaseAnthropicClient] = None
-    
+
+    _instance: ClassVar[Optional[BaseAnthropicClient]] = None
+
     @classmethod
     def get_client(cls) -> Union[AsyncAnthropic, AsyncAnthropicBedrock]:
         """Get or create appropriate Anthropic client instance.
-        
+
         Returns:
             Union[AsyncAnthropic, AsyncAnthropicBedrock]: The Anthropic client instance
-            
+
         Raises:
             ValueError: If ANTHROPIC_API_KEY is not set
         """
         if cls._instance is None:
             cls._instance = AnthropicClientFactory.create_client()
         return cls._instance.get_client()
-    
+
+    @staticmethod
+    def _message_params(
+        prompt: Union[str, List[Dict[str, Any]]],
+        system_prompt: str,
+        max_tokens: Optional[int],
+        temperature: Optional[float]
+    ) -> Dict[str, Any]:
+        """Build the request parameters for a single message.
+
+        Overrides are only replaced by the configured defaults when they are
+        None, so an explicit 0 or 0.0 is respected.
+        """
+        return {
+            "model": settings.AWS_BEDROCK_MODEL if USE_BEDROCK else settings.ANTHROPIC_MODEL,
+            "max_tokens": max_tokens if max_tokens is not None else settings.ANTHROPIC_MAX_TOKENS,
+            "system": system_prompt,
+            "temperature": (
+                temperature if temperature is not None else settings.ANTHROPIC_TEMPERATURE
+            ),
+            "messages": [{"role": "user", "content": prompt}]
+        }
+
     @classmethod
     async def create_message(
         cls,
-        prompt: str,
+        prompt: Union[str, List[Dict[str, Any]]],
         system_prompt: str,
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None
     ) -> str:
         """Create a message using the Anthropic client with configured settings.
-        
+
         Args:
-            prompt: The user prompt to send
+            prompt: The user prompt to send, as text or a list of content blocks
             system_prompt: The system prompt to use
             max_tokens: Optional max tokens override
             temperature: Optional temperature override
-            
+
         Returns:
             str: The model's response text
-            
+
         Raises:
             ValueError: If client creation fails
             Exception: If API call fails
         """
         client = cls.get_client()
-        model = settings.AWS_BEDROCK_MODEL if USE_BEDROCK else settings.ANTHROPIC_MODEL
-        
+        params = cls._message_params(prompt, system_prompt, max_tokens, temperature)
+
         try:
-            response = await client.messages.create(
-                model=model,
-                max_tokens=max_tokens or settings.ANTHROPIC_MAX_TOKENS,
-                system=system_prompt,
-                temperature=temperature or settings.ANTHROPIC_TEMPERATURE,
-                messages=[{"role": "user", "content": prompt}]
-            )
-            
+            response = await client.messages.create(**params)
+
             try:
                 return response.content[0].text
             except (IndexError, AttributeError):
                 logger.warning("Could not extract text from response, returning empty string")
                 return ""
-                
+
         except Exception as e:
             logger.error(f"Error creating message: {e}")
-            raise 
\ No newline at end of file
+            raise
+
+    @classmethod
+    def supports_batches(cls) -> bool:
+        """Check whether the configured client supports the Message Batches API.
+
+        Returns:
+            bool: True for the direct Anthropic API, False for AWS Bedrock
+        """
+        return not USE_BEDROCK
+
+    @classmethod
+    async def create_batch(
+        cls,
+        prompts: List[Union[str, List[Dict[str, Any]]]],
+        system_prompt: str,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None
+    ) -> List[Union[str, Exception]]:
+        """Create messages for several prompts using the Message Batches API.
+
+        Submits all prompts as a single batch, polls until processing has
+        ended and collects the results. A request that did not succeed gets
+        an exception in place of its response, so the other responses are
+        still returned.
+
+        Args:
+            prompts: The user prompts to send, as text or lists of content blocks
+            system_prompt: The system prompt to use for every request
+            max_tokens: Optional max tokens override
+            temperature: Optional temperature override
+
+        Returns:
+            List[Union[str, Exception]]: The response texts, or a RuntimeError
+            for each unsuccessful request, in the same order as the prompts
+
+        Raises:
+            Exception: If API call fails
+        """
+        client = cls.get_client()
+        requests = [
+            {
+                "custom_id": f"request-{idx}",
+                "params": cls._message_params(prompt, system_prompt, max_tokens, temperature)
+            }
+            for idx, prompt in enumerate(prompts)
+        ]
+
+        try:
+            batch = await client.messages.batches.create(requests=requests)
+            logger.info(f"Submitted message batch {batch.id} with {len(requests)} requests")
+
+            while batch.processing_status != "ended":
+                await asyncio.sleep(settings.ANTHROPIC_BATCH_POLL_INTERVAL)
+                batch = await client.messages.batches.retrieve(batch.id)
+
+            responses: Dict[str, Union[str, Exception]] = {}
+            async for entry in await client.messages.batches.results(batch.id):
+                if entry.result.type != "succeeded":
+                    logger.warning(
+                        f"Batch request {entry.custom_id} was {entry.result.type}")
+                    responses[entry.custom_id] = RuntimeError(
+                        f"Batch request {entry.custom_id} was {entry.result.type}")
+                    continue
+                try:
+                    responses[entry.custom_id] = entry.result.message.content[0].text
+                except (IndexError, AttributeError):
+                    logger.warning(
+                        f"Could not extract text for {entry.custom_id}, using empty string")
+                    responses[entry.custom_id] = ""
+
+            return [
+                responses.get(
+                    request["custom_id"],
+                    RuntimeError(f"Batch request {request['custom_id']} returned no result")
+                )
+                for request in requests
+            ]
+
+        except Exception as e:
+            logger.error(f"Error creating message batch: {e}")
+            raise
@@ -4,40 +4,56 @@ This module provides functions to safely run async code in separate processes
 with their own database connections, avoiding event loop conflicts.
 """
 import asyncio
-from typing import Any, Callable, Coroutine, TypeVar
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Coroutine, Optional, TypeVar
 
-from app.common.logging import get_logger
-from app.database.connection import create_client
+try:
+    # Prefer the libuv-based loop when uvloop is installed
+    from uvloop import new_event_loop
+except ImportError:  # pragma: no cover
+    from asyncio import new_event_loop
+
+from app.config.config import settings
+from app.common.logging import configure_logging, get_logger
+from app.database import database_utils
 
 logger = get_logger(__name__)
 
 T = TypeVar('T')
 
+# Event loop kept for the life of a worker process, so its database client
+# (which binds to the loop it first runs on) can be reused across tasks
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+_worker_loop_pid: Optional[int] = None
+
+def get_worker_loop() -> asyncio.AbstractEventLoop:
+    """Get the event loop for running tasks in this process, creating it on first use.
+
+    Returns:
+        asyncio.AbstractEventLoop: Loop owned by the current process
+    """
+    global _worker_loop, _worker_loop_pid
+    if _worker_loop is None or _worker_loop_pid != os.getpid():
+        _worker_loop = new_event_loop()
+        _worker_loop_pid = os.getpid()
+    return _worker_loop
+
 async def setup_process_database() -> None:
-    """Set up a new database connection for the current process.
+    """Make sure the current process has its own database connection.
     
-    This function creates a new MongoDB client and overrides the global
-    database connection in the database_utils module for the current process.
-    This ensures that each process has its own connection tied to its own event loop.
+    The connection in database_utils is created on first use in each process
+    and then kept, so later tasks in the same worker skip the connection
+    handshake. A process that inherited its parent's connection gets a new
+    one, as the connection is tied to the process that created it. Clients
+    are closed when the process exits.
     """
-    # Create a new client in this process with its own event loop
-    # This ensures we don't reuse connections from the main process
-    import app.database.database_utils
-    client, db = create_client()
-    app.database.database_utils.client = client
-    app.database.database_utils.db = db
-    
-    logger.debug("Created new database connection for process")
+    await database_utils.get_database()
 
-async def cleanup_process_database() -> None:
-    """Clean up the database connection for the current process."""
-    import app.database.database_utils
-    if hasattr(app.database.database_utils, 'client'):
-        app.database.database_utils.client.close()
-        logger.debug("Closed database connection for process")
-
-async def run_with_new_connection(coro: Coroutine[Any, Any, T]) -> T:
-    """Run a coroutine with a new database connection.
+async def run_with_process_connection(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine with this process's database connection.
     
     Args:
         coro: The coroutine to run
@@ -45,24 +61,80 @@ async def run_with_new_connection(coro: Coroutine[Any, Any, T]) -> T:
     Returns:
         The result of the coroutine
     """
-    try:
-        await setup_process_database()
-        return await coro
-    finally:
-        await cleanup_process_database()
+    await setup_process_database()
+    return await coro
 
-def run_async_in_process(func: Callable[..., Coroutine[Any, Any, Any]], *args: Any, **kwargs: Any) -> None:
-    """Run an async function in a separate process with its own database connection.
+def run_in_worker_loop(func: Callable[..., Coroutine[Any, Any, Any]], *args: Any, **kwargs: Any) -> None:
+    """Run an async function to completion on the current process's worker loop.
     
-    This is a wrapper function that sets up a new event loop and database connection
-    in the new process, runs the async function, and then cleans up.
+    Blocks the calling thread until the function finishes. It does not start
+    a process itself; it is called inside a pool worker (see
+    submit_in_process), where the long-lived loop lets the database
+    connection set up for earlier tasks be reused.
     
     Args:
         func: The async function to run
         *args: Positional arguments to pass to the function
         **kwargs: Keyword arguments to pass to the function
     """
-    async def wrapper():
-        return await run_with_new_connection(func(*args, **kwargs))
-    
-    asyncio.run(wrapper()) 
\ No newline at end of file
+    get_worker_loop().run_until_complete(
+        run_with_process_connection(func(*args, **kwargs))
+    )
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+def _init_worker() -> None:
+    """Prepare a pool worker once, before it runs any tasks."""
+    configure_logging()
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Get the shared worker pool for background tasks, creating it on first use.
+
+    Workers are started with spawn so they do not inherit the parent's event
+    loop, database client or threads, and are reused across tasks.
+
+    Returns:
+        ProcessPoolExecutor: The shared worker pool
+    """
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.BACKGROUND_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker
+        )
+    return _executor
+
+def _log_task_error(future: Future) -> None:
+    """Log a background task that failed in its worker."""
+    if not future.cancelled() and future.exception() is not None:
+        logger.error(f"Background task failed: {future.exception()}")
+
+def submit_in_process(func: Callable[..., Any], *args: Any) -> Future:
+    """Run a function in the shared worker pool.
+
+    If a worker died and left the pool broken, the pool is shut down and
+    rebuilt and the task is submitted once more.
+
+    Args:
+        func: Picklable module-level function to run
+        *args: Positional arguments to pass to the function
+
+    Returns:
+        Future: Future for the task's result
+    """
+    try:
+        future = get_process_pool().submit(func, *args)
+    except BrokenProcessPool as e:
+        logger.warning(f"Worker pool is broken, restarting it: {e}")
+        shutdown_process_pool()
+        future = get_process_pool().submit(func, *args)
+    future.add_done_callback(_log_task_error)
+    return future
+
+def shutdown_process_pool() -> None:
+    """Shut down the shared worker pool, if it was started."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
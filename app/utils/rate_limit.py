@@ -0,0 +1,49 @@
+"""Async rate limiting utilities for outbound API calls."""
+import asyncio
+import time
+from collections import deque
+from typing import Deque
+
+from app.common.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class AsyncRateLimiter:
+    """Sliding-window limiter enforcing a maximum number of requests per minute.
+
+    Callers await `acquire()` before each request. Requests are let through
+    immediately while the window has capacity, otherwise the caller sleeps
+    until the oldest request in the window expires.
+    """
+
+    def __init__(self, requests_per_minute: int, period: float = 60.0) -> None:
+        """Initialize the limiter.
+
+        Args:
+            requests_per_minute: Maximum number of requests allowed per period
+            period: Length of the sliding window in seconds
+        """
+        if requests_per_minute < 1:
+            raise ValueError("requests_per_minute must be at least 1")
+
+        self.requests_per_minute = requests_per_minute
+        self.period = period
+        self._hits: Deque[float] = deque()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request slot is available and claim it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._hits and now - self._hits[0] >= self.period:
+                    self._hits.popleft()
+
+                if len(self._hits) < self.requests_per_minute:
+                    self._hits.append(now)
+                    return
+
+                wait_time = self.period - (now - self._hits[0])
+                logger.debug(f"Rate limit reached, waiting {wait_time:.2f}s")
+                await asyncio.sleep(wait_time)
@@ -1,29 +1,36 @@
 #!/usr/bin/env python3
 """Script to manage MongoDB test data."""
-import json
 import os
 import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import islice, repeat
+import orjson
+import bson
 from bson import ObjectId
+from bson.errors import InvalidId
 from pymongo import MongoClient
 
-class MongoJSONEncoder(json.JSONEncoder):
-    """Custom JSON encoder for MongoDB data types."""
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        if isinstance(obj, ObjectId):
-            return str(obj)
-        return super().default(obj)
+# Documents fetched per cursor batch and inserted per insert_many call
+BATCH_SIZE = 10000
 
 def get_database():
     # Use localhost when running script locally, mongodb when running in container
-    client = MongoClient("mongodb://localhost:27017/")
+    # Wire compression is off by default as it only costs CPU over loopback;
+    # set MONGO_COMPRESSORS (e.g. "zstd,zlib") for a remote server
+    compressors = [c for c in os.getenv("MONGO_COMPRESSORS", "").split(",") if c]
+    client = MongoClient("mongodb://localhost:27017/", compressors=compressors)
     database = os.getenv("MONGO_DATABASE", "ai-sdlc-codereview-api")
     return client[database]
 
-def dump_database(test_data_dir: str = "test_data"):
-    """Dump the current state of MongoDB to the test_data directory."""
+def dump_database(test_data_dir: str = "test_data", dump_format: str = "json"):
+    """Dump the current state of MongoDB to the test_data directory.
+    
+    JSON dumps are a single readable file. BSON dumps are a directory with one
+    <collection>.bson file per collection, as written by mongodump, and keep
+    MongoDB types without any conversion.
+    """
     db = get_database()
     
     # Create dumps directory if it doesn't exist
@@ -32,62 +39,156 @@ def dump_database(test_data_dir: str = "test_data"):
     
     # Generate filename with timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_file = os.path.join(dumps_dir, f"mongodb_dump_{timestamp}.json")
+    if dump_format == "bson":
+        output_dir = os.path.join(dumps_dir, f"mongodb_dump_{timestamp}")
+        os.makedirs(output_dir)
+        run_per_collection(dump_bson_collection, db.list_collection_names(), output_dir)
+        print(f"Database dumped to: {output_dir}")
+        return output_dir
     
-    # Dump data
-    dump_data = {}
-    for collection_name in db.list_collection_names():
-        documents = list(db[collection_name].find())
-        # Convert ObjectId to string for JSON serialization
-        for doc in documents:
-            doc["_id"] = str(doc["_id"])
-        dump_data[collection_name] = documents
-    
-    # Save to file using custom encoder
-    with open(output_file, 'w') as f:
-        json.dump(dump_data, f, indent=2, cls=MongoJSONEncoder)
+    output_file = os.path.join(dumps_dir, f"mongodb_dump_{timestamp}.json")
+    with open(output_file, 'wb') as f:
+        write_json_dump(db, f)
     
     print(f"Database dumped to: {output_file}")
     return output_file
 
-def convert_string_ids_to_objectid(data):
-    """Convert string IDs to ObjectId in the MongoDB dump data"""
-    if isinstance(data, dict):
-        for key, value in data.items():
-            if key == '_id' or key.endswith('_id'):
-                if isinstance(value, str):
+def run_per_collection(func, collection_names, path):
+    """Run func(collection_name, path) for each collection in parallel.
+    
+    Collections are independent, so each is handled by its own worker process
+    with its own MongoClient. Workers are spawned rather than forked so no
+    client is inherited from this process.
+    """
+    if not collection_names:
+        return
+    max_workers = min(os.cpu_count() or 1, len(collection_names))
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        list(executor.map(func, collection_names, repeat(path)))
+
+def dump_bson_collection(collection_name: str, output_dir: str):
+    """Write one collection to <output_dir>/<collection_name>.bson."""
+    db = get_database()
+    with open(os.path.join(output_dir, f"{collection_name}.bson"), 'wb') as f:
+        for doc in db[collection_name].find(batch_size=BATCH_SIZE):
+            f.write(bson.encode(doc))
+
+def write_json_dump(db, f):
+    """Stream all collections to f as an indented JSON object.
+    
+    Documents are written one at a time as the cursor returns them, so no
+    collection is held in memory. The output is UTF-8: unlike json.dump,
+    orjson writes non-ASCII characters as-is rather than as \\uXXXX escapes.
+    load_json_dump reads both forms, so older dumps still restore.
+    """
+    collection_names = db.list_collection_names()
+    f.write(b"{")
+    for index, collection_name in enumerate(collection_names):
+        f.write(b"," if index else b"")
+        f.write(b"\n  " + orjson.dumps(collection_name) + b": [")
+        count = 0
+        for doc in db[collection_name].find(batch_size=BATCH_SIZE):
+            # orjson writes datetimes natively and default=str covers ObjectIds
+            encoded = orjson.dumps(doc, option=orjson.OPT_INDENT_2, default=str)
+            f.write((b"," if count else b"") + b"\n    " + encoded.replace(b"\n", b"\n    "))
+            count += 1
+        f.write(b"\n  ]" if count else b"]")
+    f.write(b"\n}" if collection_names else b"}")
+
+DATE_KEYS = frozenset(('created_at', 'updated_at'))
+
+# Conversion kind per key name, worked out once per distinct key
+ID_KEY, ID_LIST_KEY, DATE_KEY, OTHER_KEY = range(4)
+_key_kinds = {}
+
+def key_kind(key: str) -> int:
+    """Classify a dump key by the conversion its value needs."""
+    kind = _key_kinds.get(key)
+    if kind is None:
+        if key.endswith('_id'):
+            kind = ID_KEY
+        elif key.endswith('_ids'):
+            kind = ID_LIST_KEY
+        elif key in DATE_KEYS:
+            kind = DATE_KEY
+        else:
+            kind = OTHER_KEY
+        _key_kinds[key] = kind
+    return kind
+
+def convert_json_types(data):
+    """Convert string IDs to ObjectId and string dates to datetime in dump data.
+    
+    Walks the data once with an explicit stack, converting in place:
+    - string values of keys ending in _id to ObjectId
+    - lists under keys ending in _ids (like classification_ids) to ObjectIds
+    - string values of created_at / updated_at to datetime
+    """
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(item for item in node if isinstance(item, (dict, list)))
+            continue
+        if not isinstance(node, dict):
+            continue
+        for key, value in node.items():
+            kind = key_kind(key)
+            if isinstance(value, str):
+                if kind == ID_KEY:
                     try:
-                        data[key] = ObjectId(value)
-                    except:
+                        node[key] = ObjectId(value)
+                    except InvalidId:
                         pass
-            # Handle arrays of IDs (like classification_ids)
-            elif key.endswith('_ids') and isinstance(value, list):
-                data[key] = [ObjectId(id_str) for id_str in value if isinstance(id_str, str)]
+                elif kind == DATE_KEY:
+                    try:
+                        node[key] = datetime.fromisoformat(value)
+                    except ValueError:
+                        pass
+            elif isinstance(value, list) and kind == ID_LIST_KEY:
+                node[key] = [ObjectId(id_str) for id_str in value if isinstance(id_str, str)]
             elif isinstance(value, (dict, list)):
-                convert_string_ids_to_objectid(value)
-    elif isinstance(data, list):
-        for item in data:
-            convert_string_ids_to_objectid(item)
+                stack.append(value)
     return data
 
-def convert_string_dates_to_datetime(data):
-    """Convert string dates to datetime objects in the MongoDB dump data"""
-    if isinstance(data, dict):
-        for key, value in data.items():
-            if key in ['created_at', 'updated_at'] and isinstance(value, str):
-                try:
-                    data[key] = datetime.fromisoformat(value)
-                except:
-                    pass
-            elif isinstance(value, (dict, list)):
-                convert_string_dates_to_datetime(value)
-    elif isinstance(data, list):
-        for item in data:
-            convert_string_dates_to_datetime(item)
-    return data
+def iter_bson_file(path: str):
+    """Yield the documents of a .bson file one at a time."""
+    with open(path, 'rb') as f:
+        yield from bson.decode_file_iter(f)
+
+def restore_collection(db, collection_name: str, documents):
+    """Replace a collection's contents with documents."""
+    # Clear existing documents; a no-op when the collection does not exist,
+    # so there is no need to list collections first
+    db[collection_name].delete_many({})
+    
+    # Insert the data in batches so memory and request size stay bounded
+    documents = iter(documents)
+    while batch := list(islice(documents, BATCH_SIZE)):
+        # The documents came from the database, so skip re-validating them
+        # and let the server insert each batch in any order
+        db[collection_name].insert_many(
+            batch, ordered=False, bypass_document_validation=True
+        )
+
+def restore_bson_collection(collection_name: str, dump_dir: str):
+    """Restore one collection from <dump_dir>/<collection_name>.bson."""
+    path = os.path.join(dump_dir, f"{collection_name}.bson")
+    restore_collection(get_database(), collection_name, iter_bson_file(path))
+
+def load_json_dump(dump_file: str) -> dict:
+    """Load a JSON dump file into {collection_name: documents}."""
+    with open(dump_file, 'rb') as f:
+        data = orjson.loads(f.read())
+    
+    # Convert string IDs to ObjectId and dates to datetime
+    return convert_json_types(data)
 
 def restore_database(dump_file: str = None):
-    """Restore MongoDB database from a JSON dump file"""
+    """Restore MongoDB database from a JSON dump file or BSON dump directory"""
     # If no file specified, use the most recent dump
     if dump_file is None:
         dumps_dir = "test_data/mongodb_dumps"
@@ -95,39 +196,34 @@ def restore_database(dump_file: str = None):
             print("No dumps directory found")
             return
         
-        dumps = sorted([f for f in os.listdir(dumps_dir) if f.endswith('.json')],
-                      key=lambda x: os.path.getmtime(os.path.join(dumps_dir, x)),
-                      reverse=True)
+        # scandir entries carry their file type, so only mtimes need a stat
+        with os.scandir(dumps_dir) as entries:
+            dumps = [entry for entry in entries
+                     if entry.name.endswith('.json') or entry.is_dir()]
         
         if not dumps:
             print("No dump files found")
             return
         
-        dump_file = os.path.join(dumps_dir, dumps[0])
+        dump_file = max(dumps, key=lambda entry: entry.stat().st_mtime).path
     
     if not os.path.exists(dump_file):
         print(f"Dump file not found: {dump_file}")
         return
     
-    # Load and restore the data
-    with open(dump_file) as f:
-        data = json.load(f)
-    
-    # Convert string IDs to ObjectId and dates to datetime
-    data = convert_string_ids_to_objectid(data)
-    data = convert_string_dates_to_datetime(data)
-    
-    db = get_database()
-    
-    # Clear existing collections
-    for collection_name in data.keys():
-        if collection_name in db.list_collection_names():
-            db[collection_name].delete_many({})
-    
-    # Insert the data
-    for collection_name, documents in data.items():
-        if documents:  # Only insert if there are documents
-            db[collection_name].insert_many(documents)
+    if os.path.isdir(dump_file):
+        # BSON dumps already hold ObjectIds and datetimes; restore each
+        # collection file in parallel
+        collection_names = [
+            file_name[:-len('.bson')]
+            for file_name in os.listdir(dump_file)
+            if file_name.endswith('.bson')
+        ]
+        run_per_collection(restore_bson_collection, collection_names, dump_file)
+    else:
+        db = get_database()
+        for collection_name, documents in load_json_dump(dump_file).items():
+            restore_collection(db, collection_name, documents)
     
     print(f"Database restored from: {dump_file}")
 
@@ -136,12 +232,14 @@ def main():
     parser.add_argument('action', choices=['dump', 'restore'],
                        help='Action to perform (dump/restore)')
     parser.add_argument('--file', '-f',
-                       help='Specific dump file to restore from (for restore action)')
+                       help='Specific dump file or BSON dump directory to restore from (for restore action)')
+    parser.add_argument('--format', choices=['json', 'bson'], default='json',
+                       help='Dump format (for dump action)')
     
     args = parser.parse_args()
     
     if args.action == 'dump':
-        dump_database()
+        dump_database(dump_format=args.format)
     elif args.action == 'restore':
         restore_database(args.file)
 
@@ -1,11 +1,21 @@
 """Test fixtures for the FastAPI application."""
+import os
+
+# Set before the app is imported so settings never enable the local log file
+os.environ["LOG_TYPE"] = "test"
+
 from app.main import app
+from app.common import cache
+from app.models.classification import Classification
+from tests.utils.fakes import FakeAnthropicClient
+from tests.utils.test_data import create_classification_docs, create_standards_agent_test_data
 import pytest
 from fastapi.testclient import TestClient
 from httpx import AsyncClient, ASGITransport
 from unittest.mock import AsyncMock, patch, MagicMock
+from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorCollection
-from typing import Tuple, AsyncGenerator
+from typing import Tuple, AsyncGenerator, List
 from pathlib import Path
 
 
@@ -21,15 +31,25 @@ async def mock_database_setup():
         collection_mock.database = mock_db
         setattr(mock_db, col, collection_mock)
 
-    with patch("app.database.database_utils.initialize_database", return_value=None), \
-            patch("app.database.database_utils.get_database", return_value=mock_db), \
-            patch("app.database.database_utils.client", new=MagicMock()), \
+    with patch.multiple(
+                "app.database.database_utils",
+                initialize_database=AsyncMock(return_value=None),
+                get_database=AsyncMock(return_value=mock_db),
+                client=MagicMock()), \
             patch("motor.motor_asyncio.AsyncIOMotorClient", return_value=MagicMock()):
 
         app.state.db = mock_db
         yield mock_db
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Clear cached lookups so tests never share results."""
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture(autouse=True)
 async def reset_app_state():
     """Reset application state before each test."""
@@ -67,6 +87,44 @@ def mock_env_vars(monkeypatch):
 
 
 # Standards Agent Testing Fixtures
+@pytest.fixture(scope="session")
+def standards_agent_test_data() -> Tuple[str, str]:
+    """Standard set ID and repository URL shared by the standards agent tests.
+
+    Returns:
+        Tuple containing:
+        - standard_set_id: String ObjectId of the standard set
+        - repository_url: URL of the standards repository
+    """
+    return create_standards_agent_test_data()
+
+
+@pytest.fixture(scope="session")
+def standard_set_object_id(standards_agent_test_data: Tuple[str, str]) -> ObjectId:
+    """Standard set ID from the shared test data, parsed once per session.
+
+    Args:
+        standards_agent_test_data: Shared standard set ID and repository URL
+
+    Returns:
+        ObjectId: The standard set ID as an ObjectId
+    """
+    return ObjectId(standards_agent_test_data[0])
+
+
+@pytest.fixture(scope="session")
+def standards_classifications() -> List[Classification]:
+    """Classifications validated once per session for the standards agent tests.
+
+    Returns:
+        List[Classification]: Classifications built from the mock documents
+    """
+    return [
+        Classification.model_validate({**doc, "_id": str(doc["_id"])})
+        for doc in create_classification_docs()
+    ]
+
+
 @pytest.fixture
 async def standards_mock_collections(
     mock_database_setup: AsyncIOMotorDatabase
@@ -85,8 +143,6 @@ async def standards_mock_collections(
         - classifications_collection: For classification lookups
         - standard_sets_collection: For standard set metadata
     """
-    from tests.utils.test_data import create_classification_docs
-
     standards_collection = AsyncMock()
     classifications_collection = AsyncMock()
     standard_sets_collection = AsyncMock()
@@ -120,23 +176,24 @@ async def standards_mock_collections(
 
 
 @pytest.fixture
-async def mock_anthropic_client() -> AsyncGenerator[None, None]:
-    """Mock Anthropic client for all tests.
+def mock_anthropic_client(
+    monkeypatch: pytest.MonkeyPatch
+) -> type[FakeAnthropicClient]:
+    """Swap the standards agent's Anthropic client for a fake.
 
-    Provides a default mock that returns "Python" as classification.
-    Tests can override this behavior with their own patches.
+    Provides a default fake that returns "Python" as classification.
+    Tests can override this by setting ``response`` or ``error`` on it.
 
-    Yields:
-        None: This fixture is used for its side effects
-    """
-    from app.utils.anthropic_client import AnthropicClient
+    Args:
+        monkeypatch: pytest fixture for replacing the client binding
 
-    with patch.object(
-        AnthropicClient,
-        "create_message",
-        return_value="Python"  # Default classification for standards
-    ):
-        yield
+    Returns:
+        type[FakeAnthropicClient]: Fake client class reset to its defaults
+    """
+    FakeAnthropicClient.response = "Python"
+    FakeAnthropicClient.error = None
+    monkeypatch.setattr("app.agents.standards_agent.AnthropicClient", FakeAnthropicClient)
+    return FakeAnthropicClient
 
 
 @pytest.fixture
@@ -158,20 +215,20 @@ async def standards_env_setup(
     yield
 
 
-@pytest.fixture
-def standards_test_files(tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def standards_test_files(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Create temporary test standard files.
 
     Creates a simulated standards repository with test markdown files
-    in a temporary directory that is cleaned up after the test.
+    in a temporary directory created once and shared, read-only, by all tests.
 
     Args:
-        tmp_path: pytest fixture providing temporary directory
+        tmp_path_factory: pytest fixture providing temporary directories
 
     Returns:
         Path: Path to temporary repository directory containing test standards
     """
-    repo_path = tmp_path / "standards_repo"
+    repo_path = tmp_path_factory.mktemp("standards") / "standards_repo"
     standards_dir = repo_path / "standards"
     standards_dir.mkdir(parents=True)
 
@@ -1,4 +1,6 @@
 """Integration tests for the Code Reviews Agent."""
+import asyncio
+import json
 import os
 from pathlib import Path
 from unittest.mock import AsyncMock, patch, MagicMock
@@ -11,8 +13,18 @@ from fastapi import FastAPI
 from app.agents.code_reviews_agent import (
     CodeReviewConfig,
     check_compliance,
-    CodeReviewError
+    CodeReviewError,
+    ProcessingError,
+    ReviewStatus,
+    REPORT_TOKEN_ESTIMATE,
+    chunk_standards,
+    generate_codebase_block,
+    get_llm_limits,
+    parse_chunk_reports,
+    process_code_review,
+    process_standards
 )
+from app.models.classification import Classification
 from app.utils.anthropic_client import AnthropicClient
 from app.database.database_utils import get_database
 from app.main import app  # Import the FastAPI app
@@ -35,6 +47,14 @@ EXPECTED_REPORT_CONTENT = """# Test Standard Set Code Review
 Date: """
 
 
+def make_standards(count: int) -> list:
+    """Create standards with distinct IDs and texts "Standard 0", "Standard 1", ..."""
+    return [
+        {"_id": ObjectId(), "text": f"Standard {idx}", "repository_path": ""}
+        for idx in range(count)
+    ]
+
+
 @pytest.fixture(autouse=True)
 async def setup_and_teardown():
     """Setup and teardown for each test."""
@@ -91,11 +111,23 @@ The code does not follow PEP 8 guidelines. Missing spaces around operators and n
         yield mock
 
 
+@pytest.fixture(scope="session")
+def mock_codebase_source(tmp_path_factory):
+    """Write the mock codebase once for the whole test session."""
+    source_file = tmp_path_factory.mktemp("codebase") / "test_codebase.py"
+    source_file.write_text(MOCK_CODEBASE)
+    return source_file
+
+
 @pytest.fixture
-def temp_codebase(tmp_path):
-    """Create temporary codebase file."""
+def temp_codebase(tmp_path, mock_codebase_source):
+    """Create temporary codebase file.
+
+    Hard-links the shared read-only codebase into a per-test directory, so
+    reports written next to it stay separate between tests.
+    """
     codebase_file = tmp_path / "test_codebase.py"
-    codebase_file.write_text(MOCK_CODEBASE)
+    os.link(mock_codebase_source, codebase_file)
     return codebase_file
 
 
@@ -172,6 +204,7 @@ async def test_successful_code_review(
     assert "Compliant: <span style=\"color: #d4351c\">**No**</span>" in report_content
     assert "test_repo/file.py" in report_content
     assert "Add spaces around operators" in report_content
+    assert report_content.endswith("\n\n## Specific Recommendations\n\n")
 
     # Verify interactions
     mock_anthropic.assert_called_once()
@@ -211,6 +244,19 @@ async def test_code_review_with_llm_testing_enabled(
     assert "Should be filtered out" not in report_content
 
 
+async def test_code_review_config_normalises_testing_files():
+    """Test testing file names are stripped and blanks dropped once."""
+    # Given: A padded file list with an empty entry
+    os.environ["LLM_TESTING"] = "true"
+    os.environ["LLM_TESTING_STANDARDS_FILES"] = " test_repo/file.py, ,other.md "
+
+    # When: Loading the config
+    config = CodeReviewConfig()
+
+    # Then: Only the cleaned names remain
+    assert config.testing_files == ("test_repo/file.py", "other.md")
+
+
 async def test_code_review_with_invalid_codebase(
     mock_database,
     mock_anthropic
@@ -283,6 +329,419 @@ async def test_code_review_with_db_failure(
     mock_anthropic.assert_not_called()
 
 
+async def test_process_standards_preserves_order(
+    mock_database,
+    mock_anthropic,
+    temp_codebase
+):
+    """Test concurrent compliance checks return reports in standard order."""
+    # Given: Several standards whose responses complete out of order
+    standards = make_standards(3)
+    delays = [0.03, 0.0, 0.01]
+
+    async def delayed_response(prompt, system_prompt):
+        for idx, standard in enumerate(standards):
+            if f"Standard {idx}" in prompt[-1]["text"]:
+                await asyncio.sleep(delays[idx])
+                return f"Report {idx}"
+        return ""
+
+    mock_anthropic.side_effect = delayed_response
+
+    # When: Processing the standards one per prompt
+    with patch('app.agents.code_reviews_agent.settings.ANTHROPIC_MAX_TOKENS', 1000):
+        reports = await process_standards(standards, temp_codebase)
+
+    # Then: Reports match the order of the standards
+    assert reports == ["Report 0", "Report 1", "Report 2"]
+    assert mock_anthropic.call_count == 3
+
+
+async def test_process_standards_keeps_reports_when_one_check_fails(
+    mock_database,
+    mock_anthropic,
+    temp_codebase
+):
+    """Test a failed compliance check does not discard the other reports."""
+    # Given: Two standards where the second check fails
+    standards = make_standards(2)
+
+    async def flaky_response(prompt, system_prompt):
+        if "Standard 1" in prompt[-1]["text"]:
+            raise Exception("Overloaded")
+        return "Report 0"
+
+    mock_anthropic.side_effect = flaky_response
+
+    # When: Processing the standards one per prompt
+    with patch('app.agents.code_reviews_agent.settings.ANTHROPIC_MAX_TOKENS', 1000):
+        reports = await process_standards(standards, temp_codebase)
+
+    # Then: The successful report is kept and the failure is recorded
+    assert reports[0] == "Report 0"
+    assert str(standards[1]["_id"]) in reports[1]
+    assert "Overloaded" in reports[1]
+
+
+async def test_process_standards_shares_rate_limit_window(
+    mock_database,
+    mock_anthropic,
+    temp_codebase
+):
+    """Test back-to-back reviews count against one rate limit window."""
+    # Given: A single worker process with fresh limits
+    standards = make_standards(1)
+
+    with patch('app.agents.code_reviews_agent._llm_limits', None), \
+            patch('app.agents.code_reviews_agent.settings.BACKGROUND_WORKERS', 1), \
+            patch('app.agents.code_reviews_agent.settings.LLM_REQUESTS_PER_MINUTE', 3):
+        # When: Processing standards twice in a row
+        await process_standards(standards, temp_codebase)
+        await process_standards(standards, temp_codebase)
+        _, rate_limiter = get_llm_limits()
+
+    # Then: Both requests were recorded by the same limiter
+    assert rate_limiter.requests_per_minute == 3
+    assert len(rate_limiter._hits) == 2
+
+
+async def test_process_standards_bounds_requests_in_flight(
+    mock_database,
+    mock_anthropic,
+    temp_codebase
+):
+    """Test no more than LLM_MAX_CONCURRENCY requests are ever in flight."""
+    # Given: Requests that block until released, across two reviews
+    standards = make_standards(3)
+    release = asyncio.Event()
+    in_flight = 0
+    max_in_flight = 0
+
+    async def gated_response(prompt, system_prompt):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await release.wait()
+        in_flight -= 1
+        return "Report"
+
+    mock_anthropic.side_effect = gated_response
+
+    with patch('app.agents.code_reviews_agent._llm_limits', None), \
+            patch('app.agents.code_reviews_agent.settings.BACKGROUND_WORKERS', 1), \
+            patch('app.agents.code_reviews_agent.settings.LLM_MAX_CONCURRENCY', 2), \
+            patch('app.agents.code_reviews_agent.settings.ANTHROPIC_MAX_TOKENS', 1000):
+        # When: Both reviews run while the first requests are held open
+        reviews = asyncio.gather(
+            process_standards(standards, temp_codebase),
+            process_standards(standards, temp_codebase)
+        )
+        for _ in range(20):
+            await asyncio.sleep(0)
+        held = in_flight
+        release.set()
+        reports = await reviews
+
+    # Then: Only two requests ran at once and every standard was checked
+    assert held == 2
+    assert max_in_flight == 2
+    assert mock_anthropic.call_count == 6
+    assert reports == [["Report"] * 3, ["Report"] * 3]
+
+
+async def test_llm_limits_split_across_workers():
+    """Test the throughput limits are divided between worker processes."""
+
+    with patch('app.agents.code_reviews_agent._llm_limits', None), \
+            patch('app.agents.code_reviews_agent.settings.BACKGROUND_WORKERS', 4), \
+            patch('app.agents.code_reviews_agent.settings.LLM_MAX_CONCURRENCY', 8), \
+            patch('app.agents.code_reviews_agent.settings.LLM_REQUESTS_PER_MINUTE', 50):
+        # When: Getting the limits twice
+        semaphore, rate_limiter = get_llm_limits()
+        again = get_llm_limits()
+
+    # Then: Each worker gets its share and the limits are reused
+    assert again == (semaphore, rate_limiter)
+    assert semaphore._value == 2
+    assert rate_limiter.requests_per_minute == 12
+
+
+async def test_process_standards_uses_batch_above_threshold(
+    mock_database,
+    mock_anthropic,
+    temp_codebase
+):
+    """Test compliance checks are batched when over the batch threshold."""
+    # Given: More standards than the batch threshold
+    standards = make_standards(3)
+
+    with patch('app.agents.code_reviews_agent.settings.ANTHROPIC_BATCH_THRESHOLD', 2), \
+            patch('app.agents.code_reviews_agent.settings.ANTHROPIC_MAX_TOKENS', 1000), \
+            patch.object(AnthropicClient, 'supports_batches', return_value=True), \
+            patch.object(AnthropicClient, 'create_batch', new_callable=AsyncMock) as mock_batch:
+        mock_batch.return_value = ["Report 0", "Report 1", "Report 2"]
+
+        # When: Processing the standards
+        reports = await process_standards(standards, temp_codebase)
+
+    # Then: A single batch is submitted instead of individual messages
+    assert reports == ["Report 0", "Report 1", "Report 2"]
+    mock_batch.assert_called_once()
+    assert len(mock_batch.call_args.kwargs["prompts"]) == 3
+    mock_anthropic.assert_not_called()
+
+
+async def test_process_standards_batch_keeps_reports_when_one_request_fails(
+    mock_database,
+    mock_anthropic,
+    temp_codebase
+):
+    """Test a failed batch request only fails the standards in its group."""
+    # Given: A batch where the second request did not succeed
+    standards = make_standards(3)
+
+    with patch('app.agents.code_reviews_agent.settings.ANTHROPIC_BATCH_THRESHOLD', 2), \
+            patch('app.agents.code_reviews_agent.settings.ANTHROPIC_MAX_TOKENS', 1000), \
+            patch.object(AnthropicClient, 'supports_batches', return_value=True), \
+            patch.object(AnthropicClient, 'create_batch', new_callable=AsyncMock) as mock_batch:
+        mock_batch.return_value = [
+            "Report 0", RuntimeError("Batch request request-1 was errored"), "Report 2"
+        ]
+
+        # When: Processing the standards
+        reports = await process_standards(standards, temp_codebase)
+
+    # Then: The other reports are kept and the failure is recorded
+    assert reports[0] == "Report 0"
+    assert f"## Standard: {standards[1]['_id']}" in reports[1]
+    assert "request-1 was errored" in reports[1]
+    assert reports[2] == "Report 2"
+
+
+async def test_process_standards_groups_standards_into_one_prompt(
+    mock_database,
+    mock_anthropic,
+    temp_codebase
+):
+    """Test several standards share a prompt and the reports are split out."""
+    # Given: Standards that fit into a single prompt
+    standards = make_standards(2)
+    mock_anthropic.return_value = json.dumps([
+        {"standard_id": str(standards[1]["_id"]), "report": "Report 1"},
+        {"standard_id": str(standards[0]["_id"]), "report": "Report 0"}
+    ])
+
+    # When: Processing the standards
+    reports = await process_standards(standards, temp_codebase)
+
+    # Then: One request covers both standards and reports follow standard order
+    mock_anthropic.assert_called_once()
+    codebase_block, question_block = mock_anthropic.call_args.kwargs["prompt"]
+    assert f"## Standard {standards[0]['_id']}" in question_block["text"]
+    assert f"## Standard {standards[1]['_id']}" in question_block["text"]
+    assert MOCK_CODEBASE in codebase_block["text"]
+    assert reports == ["Report 0", "Report 1"]
+
+
+async def test_process_standards_shares_cached_codebase_block(
+    mock_database,
+    mock_anthropic,
+    temp_codebase
+):
+    """Test every prompt starts with the same cacheable codebase block."""
+    # Given: Standards that are checked one per prompt
+    standards = make_standards(2)
+
+    # When: Processing the standards
+    with patch('app.agents.code_reviews_agent.settings.ANTHROPIC_MAX_TOKENS', 1000):
+        await process_standards(standards, temp_codebase)
+
+    # Then: Both prompts lead with the identical cached codebase block
+    first, second = [call.kwargs["prompt"] for call in mock_anthropic.call_args_list]
+    assert first[0] == second[0]
+    assert first[0]["cache_control"] == {"type": "ephemeral"}
+    assert MOCK_CODEBASE in first[0]["text"]
+    assert first[1] != second[1]
+
+
+async def test_process_standards_warms_cache_before_other_checks(
+    mock_database,
+    mock_anthropic,
+    temp_codebase
+):
+    """Test the first check completes before the rest start concurrently."""
+    # Given: Three standards checked one per prompt
+    standards = make_standards(3)
+    events = []
+
+    async def tracked_response(prompt, system_prompt):
+        name = next(
+            str(idx) for idx in range(3) if f"Standard {idx}" in prompt[-1]["text"])
+        events.append(f"start {name}")
+        await asyncio.sleep(0.01)
+        events.append(f"end {name}")
+        return f"Report {name}"
+
+    mock_anthropic.side_effect = tracked_response
+
+    # When: Processing the standards
+    with patch('app.agents.code_reviews_agent.settings.ANTHROPIC_MAX_TOKENS', 1000):
+        reports = await process_standards(standards, temp_codebase)
+
+    # Then: The first request writes the cache before the others run together
+    assert events[:2] == ["start 0", "end 0"]
+    assert sorted(events[2:4]) == ["start 1", "start 2"]
+    assert reports == ["Report 0", "Report 1", "Report 2"]
+
+
+async def test_codebase_block_without_prompt_caching():
+    """Test the codebase block omits cache control when caching is disabled."""
+
+    # When: Generating the block with prompt caching disabled
+    with patch('app.agents.code_reviews_agent.settings.ANTHROPIC_PROMPT_CACHING', False):
+        block = generate_codebase_block(MOCK_CODEBASE)
+
+    # Then: No cache control is requested
+    assert "cache_control" not in block
+    assert MOCK_CODEBASE in block["text"]
+
+
+async def test_process_standards_unparseable_group_response(
+    mock_database,
+    mock_anthropic,
+    temp_codebase
+):
+    """Test a grouped response that is not JSON is retried per standard."""
+    # Given: Two grouped standards and a plain markdown response
+    standards = make_standards(2)
+
+    # When: Processing the standards
+    reports = await process_standards(standards, temp_codebase)
+
+    # Then: Each standard is checked again on its own
+    assert mock_anthropic.call_count == 3
+    retried = [call.kwargs["prompt"][-1]["text"] for call in mock_anthropic.call_args_list[1:]]
+    assert "Given the standard below" in retried[0]
+    assert "Standard 0" in retried[0] and "Standard 1" in retried[1]
+    assert reports == [mock_anthropic.return_value] * 2
+
+
+async def test_process_standards_group_response_matched_by_id(
+    mock_database,
+    mock_anthropic,
+    temp_codebase
+):
+    """Test grouped reports are matched by ID, ignoring unknown IDs."""
+    # Given: A response missing one standard and including an unknown one
+    standards = make_standards(3)
+    mock_anthropic.side_effect = [
+        json.dumps([
+            {"standard_id": str(ObjectId()), "report": "Unknown report"},
+            {"standard_id": str(standards[2]["_id"]), "report": "Report 2"},
+            {"standard_id": str(standards[0]["_id"]), "report": "Report 0"}
+        ]),
+        "Report 1"
+    ]
+
+    # When: Processing the standards
+    reports = await process_standards(standards, temp_codebase)
+
+    # Then: Known reports keep standard order and only the missing one is retried
+    assert reports == ["Report 0", "Report 1", "Report 2"]
+    assert mock_anthropic.call_count == 2
+    assert "Standard 1" in mock_anthropic.call_args.kwargs["prompt"][-1]["text"]
+
+
+async def test_process_standards_failed_retry_records_failure(
+    mock_database,
+    mock_anthropic,
+    temp_codebase
+):
+    """Test a standard whose retry fails gets a failure section."""
+    # Given: A grouped response missing one standard, whose retry fails
+    standards = make_standards(2)
+    mock_anthropic.side_effect = [
+        json.dumps([{"standard_id": str(standards[0]["_id"]), "report": "Report 0"}]),
+        Exception("Overloaded")
+    ]
+
+    # When: Processing the standards
+    reports = await process_standards(standards, temp_codebase)
+
+    # Then: The report that arrived is kept and the failure recorded
+    assert reports[0] == "Report 0"
+    assert f"## Standard: {standards[1]['_id']}" in reports[1]
+    assert "Overloaded" in reports[1]
+
+
+def make_report_items(standards: list) -> str:
+    """Create a grouped response array with a report per standard."""
+    return json.dumps([
+        {"standard_id": str(standard["_id"]), "report": f"Report {idx} [file.py]"}
+        for idx, standard in enumerate(standards)
+    ])
+
+
+async def test_parse_chunk_reports_skips_brackets_around_array():
+    """Test the report array is found among other bracketed text."""
+    # Given: A grouped response wrapped in prose containing brackets
+    standards = make_standards(2)
+    response = f"Reports for [2] standards:\n{make_report_items(standards)}\nSee [notes]."
+
+    # When: Parsing the response
+    reports = parse_chunk_reports(response, standards)
+
+    # Then: Both reports are matched to their standards
+    assert reports == {
+        str(standards[0]["_id"]): "Report 0 [file.py]",
+        str(standards[1]["_id"]): "Report 1 [file.py]"
+    }
+
+
+async def test_parse_chunk_reports_keeps_complete_items_of_truncated_array():
+    """Test a response cut off part way through keeps its complete reports."""
+    # Given: A grouped response cut off within the second report
+    standards = make_standards(2)
+    response = make_report_items(standards)[:-20]
+
+    # When: Parsing the response
+    reports = parse_chunk_reports(response, standards)
+
+    # Then: Only the complete first report is returned
+    assert reports == {str(standards[0]["_id"]): "Report 0 [file.py]"}
+
+
+async def test_chunk_standards_sizes_groups_by_output_budget():
+    """Test group size depends only on the reports that fit in the output."""
+    # Given: Standards including one with very long text
+    standards = [
+        {"_id": 1, "text": "a" * 40},
+        {"_id": 2, "text": "b" * 4 * 10 * REPORT_TOKEN_ESTIMATE},
+        {"_id": 3, "text": "c" * 40},
+        {"_id": 4, "text": "d" * 40},
+        {"_id": 5, "text": "e" * 40}
+    ]
+
+    # When: Chunking with room for two reports per response
+    chunks = chunk_standards(standards, 2 * REPORT_TOKEN_ESTIMATE + 20)
+
+    # Then: Groups of two keep order regardless of standard text length
+    assert [[s["_id"] for s in chunk] for chunk in chunks] == [[1, 2], [3, 4], [5]]
+
+
+async def test_chunk_standards_grouping_disabled():
+    """Test every standard gets its own prompt when grouping is disabled."""
+    # Given: Grouping disabled
+    standards = make_standards(3)
+
+    # When: Chunking with room for many reports
+    with patch('app.agents.code_reviews_agent.settings.ANTHROPIC_GROUP_STANDARDS', False):
+        chunks = chunk_standards(standards, 100 * REPORT_TOKEN_ESTIMATE)
+
+    # Then: One standard per group
+    assert chunks == [[standard] for standard in standards]
+
+
 # Test Cases - Process Code Review Flow
 
 
@@ -296,9 +755,6 @@ async def test_process_code_review_success(
     temp_codebase
 ):
     """Test successful end-to-end process_code_review flow."""
-    from app.agents.code_reviews_agent import process_code_review, ReviewStatus
-    from app.models.classification import Classification
-
     # Given: Test data setup with consistent IDs
     standard_set_id = ObjectId()
     review_id = str(ObjectId())
@@ -312,14 +768,15 @@ async def test_process_code_review_success(
     ])
     mock_database.classifications.find = MagicMock(return_value=mock_classifications_cursor)
 
-    mock_database.standard_sets.find_one = AsyncMock(return_value={
-        "_id": standard_set_id,
-        "name": "Test Standards"
-    })
+    mock_standard_sets_cursor = AsyncMock()
+    mock_standard_sets_cursor.to_list = AsyncMock(return_value=[
+        {"_id": standard_set_id, "name": "Test Standards"}
+    ])
+    mock_database.standard_sets.find = MagicMock(return_value=mock_standard_sets_cursor)
 
     mock_standards_cursor = AsyncMock()
     mock_standards_cursor.to_list = AsyncMock(return_value=[
-        {"_id": ObjectId(), "text": "Test standard"}
+        {"_id": ObjectId(), "text": "Test standard", "standard_set_id": standard_set_id}
     ])
     mock_database.standards.find = MagicMock(return_value=mock_standards_cursor)
 
@@ -340,6 +797,12 @@ async def test_process_code_review_success(
     mock_analyze_classifications.assert_called_once()
     mock_check_compliance.assert_called_once()
 
+    # Verify standard sets and standards were each fetched in one query
+    mock_database.standard_sets.find.assert_called_once_with(
+        {"_id": {"$in": [standard_set_id]}}
+    )
+    mock_database.standards.find.assert_called_once()
+
     # Verify final status update
     final_call_args = mock_code_review_repo.update_status.call_args_list[-1]
     assert final_call_args[0][0] == review_id
@@ -356,8 +819,6 @@ async def test_process_code_review_with_invalid_standard_set(
     mock_code_review_repo
 ):
     """Test process_code_review with invalid standard set ID."""
-    from app.agents.code_reviews_agent import process_code_review, ReviewStatus
-
     # Given: Invalid standard set ID
     review_id = str(ObjectId())
     repository_url = "https://github.com/test/repo"
@@ -387,8 +848,6 @@ async def test_process_code_review_with_repository_error(
     mock_code_review_repo
 ):
     """Test process_code_review when repository processing fails."""
-    from app.agents.code_reviews_agent import process_code_review, ReviewStatus, ProcessingError
-
     # Given: Repository processing error
     review_id = str(ObjectId())
     repository_url = "https://github.com/test/repo"
@@ -414,8 +873,6 @@ async def test_process_code_review_with_no_matching_standards(
     mock_code_review_repo
 ):
     """Test process_code_review when no standards match the classifications."""
-    from app.agents.code_reviews_agent import process_code_review, ReviewStatus
-
     # Given: Valid standard set but no matching standards
     review_id = str(ObjectId())
     repository_url = "https://github.com/test/repo"
@@ -428,10 +885,11 @@ async def test_process_code_review_with_no_matching_standards(
     ])
     mock_database.classifications.find = MagicMock(return_value=mock_classifications_cursor)
 
-    mock_database.standard_sets.find_one = AsyncMock(return_value={
-        "_id": ObjectId(),
-        "name": "Test Standards"
-    })
+    mock_standard_sets_cursor = AsyncMock()
+    mock_standard_sets_cursor.to_list = AsyncMock(return_value=[
+        {"_id": ObjectId(standard_sets[0]), "name": "Test Standards"}
+    ])
+    mock_database.standard_sets.find = MagicMock(return_value=mock_standard_sets_cursor)
 
     # No matching standards - empty list
     mock_standards_cursor = AsyncMock()
@@ -449,5 +907,5 @@ async def test_process_code_review_with_no_matching_standards(
 
     # Verify all async operations were awaited
     await mock_classifications_cursor.to_list()
-    await mock_database.standard_sets.find_one()
+    await mock_standard_sets_cursor.to_list()
     await mock_standards_cursor.to_list()
@@ -1,17 +1,17 @@
 """Integration tests for the git repos agent."""
 import os
+import re
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 from pathlib import Path
 import tempfile
-import shutil
 import git
 
 from app.agents.git_repos_agent import (
     process_repositories,
     download_repository,
-    EXCLUDED_FILES,
-    EXCLUDED_DIRS
+    flatten_repository,
+    COPY_BUFFER_SIZE
 )
 
 # Test Data Constants
@@ -21,15 +21,42 @@ TEST_REPO_NAME = "repo"
 TEST_FILES = {
     "test.py": "print('test')",
     "test.md": "# Test",
-    "README.md": "# Project"
+    "README.md": "# Project",
+    "src/main.py": "print('main')"
 }
 
 EXCLUDED_TEST_FILES = {
     "test.png": b"binary",
+    "logo.PNG": b"binary",
+    "legacy.txt": b"\xff\xfe not utf-8",
     "package-lock.json": "{}",
     "node_modules/test.js": "console.log('test')"
 }
 
+# Compiled once so each check scans the output in a single pass
+EXPECTED_TEXT = set(TEST_FILES) | set(TEST_FILES.values())
+EXPECTED_TEXT_RE = re.compile("|".join(map(re.escape, EXPECTED_TEXT)))
+EXCLUDED_NAMES_RE = re.compile(
+    "|".join(re.escape(Path(filepath).name) for filepath in EXCLUDED_TEST_FILES)
+)
+
+
+def write_files(directory: Path, files: dict) -> None:
+    """Write files under a directory, creating each parent directory once.
+
+    Args:
+        directory: Path to create the files in
+        files: Mapping of relative path to str or bytes content
+    """
+    contents = {
+        directory / filepath: content.encode("utf-8") if isinstance(content, str) else content
+        for filepath, content in files.items()
+    }
+    for parent in dict.fromkeys(path.parent for path in contents):
+        parent.mkdir(exist_ok=True, parents=True)
+    for path, data in contents.items():
+        path.write_bytes(data)
+
 
 def create_test_files(directory: Path) -> None:
     """Create a standard set of test files in the given directory.
@@ -37,9 +64,7 @@ def create_test_files(directory: Path) -> None:
     Args:
         directory: Path to create the test files in
     """
-    # Create included files
-    for filename, content in TEST_FILES.items():
-        (directory / filename).write_text(content)
+    write_files(directory, TEST_FILES)
 
 
 def create_excluded_files(directory: Path) -> None:
@@ -48,95 +73,57 @@ def create_excluded_files(directory: Path) -> None:
     Args:
         directory: Path to create the excluded files in
     """
-    for filepath, content in EXCLUDED_TEST_FILES.items():
-        full_path = directory / filepath
-        full_path.parent.mkdir(exist_ok=True, parents=True)
-        if isinstance(content, bytes):
-            full_path.write_bytes(content)
-        else:
-            full_path.write_text(content)
+    write_files(directory, EXCLUDED_TEST_FILES)
 
 
-@pytest.fixture
-def mock_git_repo():
-    """Create a mock git repository for testing.
+@pytest.fixture(scope="session")
+def prebuilt_repo_tree(tmp_path_factory):
+    """Build the test repository file tree once for the whole session.
 
-    Instead of creating a real git repository, this creates a directory structure
-    and mocks the git operations to simulate a git repository.
+    Tests must treat this tree as read-only.
     """
-    with tempfile.TemporaryDirectory() as temp_dir:
-        repo_dir = Path(temp_dir)
-
-        # Create all test files
-        create_test_files(repo_dir)
-        create_excluded_files(repo_dir)
+    repo_dir = tmp_path_factory.mktemp("repo_tree")
 
-        # Create mock git repo instead of real one
-        mock_repo = MagicMock(spec=git.Repo)
-        mock_repo.working_dir = str(repo_dir)
-        mock_repo.index = MagicMock()
-
-        # Mock the git operations
-        with patch('git.Repo') as mock_git:
-            mock_git.init.return_value = mock_repo
-            mock_git.clone_from.return_value = mock_repo
-            yield repo_dir
+    # Create all test files
+    create_test_files(repo_dir)
+    create_excluded_files(repo_dir)
+    return repo_dir
 
 
 @pytest.fixture
-def patch_data_paths():
-    """Patch the data paths to use relative paths for testing."""
-    with patch('app.agents.git_repos_agent.DATA_DIR', Path("data")), \
-         patch('app.agents.git_repos_agent.CODEBASE_DIR', Path("data/codebase")):
-        # Create the directory if it doesn't exist
-        codebase_dir = Path("data/codebase")
-        codebase_dir.mkdir(parents=True, exist_ok=True)
-        yield
-        # Clean up after test
-        if codebase_dir.exists():
-            shutil.rmtree(codebase_dir.parent)
+def patch_data_paths(tmp_path, monkeypatch):
+    """Patch the data paths to a per-test temporary directory."""
+    codebase_dir = tmp_path / "data" / "codebase"
+    codebase_dir.mkdir(parents=True)
+    monkeypatch.setattr('app.agents.git_repos_agent.DATA_DIR', codebase_dir.parent)
+    monkeypatch.setattr('app.agents.git_repos_agent.CODEBASE_DIR', codebase_dir)
 
 
 @pytest.mark.asyncio
-async def test_process_repositories_success(patch_data_paths):
+async def test_process_repositories_success(patch_data_paths, prebuilt_repo_tree):
     """Test processing a repository successfully."""
     # Given: A repository URL
     with patch('git.Repo.clone_from') as mock_clone:
-        # Create a temporary directory structure that mimics a cloned repo
-        with tempfile.TemporaryDirectory() as temp_dir:
-            repo_dir = Path(temp_dir)
-
-            # Create test files to simulate cloned content
-            create_test_files(repo_dir)
-            create_excluded_files(repo_dir)
-
-            # Setup mock to "clone" to our test directory
-            def mock_clone_effect(url, path):
-                os.makedirs(path, exist_ok=True)
-                for item in repo_dir.iterdir():
-                    if item.is_file():
-                        shutil.copy2(item, Path(path) / item.name)
-                    else:
-                        shutil.copytree(item, Path(path) / item.name)
-            mock_clone.side_effect = mock_clone_effect
-
-            # When: Processing the repository
-            result = await process_repositories(TEST_REPO_URL)
-
-            # Then: Verify the output file exists and contains expected content
-            assert result.exists()
-            assert result.is_file()
-            content = result.read_text()
-
-            # Check included content is present
-            for filename, file_content in TEST_FILES.items():
-                assert filename in content, f"Expected {filename} to be in content"
-                assert file_content in content, f"Expected content of {filename} to be present"
-
-            # Check excluded content is absent
-            for filepath, _ in EXCLUDED_TEST_FILES.items():
-                filename = Path(filepath).name
-                assert filename not in content, f"Expected {filename} to be excluded"
+        # "Clone" by symlinking the prebuilt tree, which is only read from;
+        # the temp directory cleanup removes the link, not the tree
+        mock_clone.side_effect = lambda url, path, **kwargs: os.symlink(
+            prebuilt_repo_tree, path, target_is_directory=True)
+
+        # When: Processing the repository
+        result = await process_repositories(TEST_REPO_URL)
+
+        # Then: Verify the output file exists and contains expected content
+        assert result.exists()
+        assert result.is_file()
+        content = result.read_text()
+
+        # Check included names and content are present
+        missing = EXPECTED_TEXT - set(EXPECTED_TEXT_RE.findall(content))
+        assert not missing, f"Expected {missing} to be in content"
+
+        # Check excluded content is absent
+        excluded = EXCLUDED_NAMES_RE.search(content)
+        assert excluded is None, f"Expected {excluded and excluded.group()} to be excluded"
 
 
 @pytest.mark.asyncio
@@ -155,32 +142,32 @@ async def test_download_repository_success():
     """Test downloading a repository successfully."""
     # Given: A repository URL and mocked git clone
     with patch('git.Repo.clone_from') as mock_clone:
-        # Create a test directory structure
-        with tempfile.TemporaryDirectory() as temp_dir:
-            repo_dir = Path(temp_dir)
-
-            # Setup mock to create test files
-            def mock_clone_effect(url, path):
-                os.makedirs(path, exist_ok=True)
-                (Path(path) / "test.py").write_text("print('test')")
-                (Path(path) / "README.md").write_text("# Project")
-            mock_clone.side_effect = mock_clone_effect
-
-            # When: Downloading the repository
-            repo_path, temp_dir_obj = await download_repository(TEST_REPO_URL)
-
-            try:
-                # Then: Verify the repository was downloaded correctly
-                assert repo_path.exists()
-                assert (repo_path / "test.py").exists()
-                assert (repo_path / "README.md").exists()
-
-                # Verify temp directory management
-                assert isinstance(temp_dir_obj, tempfile.TemporaryDirectory)
-                assert repo_path == Path(temp_dir_obj.name)
-            finally:
-                # Cleanup
-                temp_dir_obj.cleanup()
+        # Setup mock to create test files
+        def mock_clone_effect(url, path, **kwargs):
+            os.makedirs(path, exist_ok=True)
+            (Path(path) / "test.py").write_text("print('test')")
+            (Path(path) / "README.md").write_text("# Project")
+        mock_clone.side_effect = mock_clone_effect
+
+        # When: Downloading the repository
+        repo_path, temp_dir_obj = await download_repository(TEST_REPO_URL)
+
+        try:
+            # Then: Verify the repository was downloaded correctly
+            assert repo_path.exists()
+            assert (repo_path / "test.py").exists()
+            assert (repo_path / "README.md").exists()
+
+            # Verify temp directory management
+            assert isinstance(temp_dir_obj, tempfile.TemporaryDirectory)
+            assert repo_path == Path(temp_dir_obj.name)
+
+            # Verify only the latest commit was fetched
+            _, kwargs = mock_clone.call_args
+            assert "--depth=1" in kwargs["multi_options"]
+        finally:
+            # Cleanup
+            temp_dir_obj.cleanup()
 
 
 @pytest.mark.asyncio
@@ -192,3 +179,21 @@ async def test_download_repository_error():
         with pytest.raises(Exception) as exc_info:
             await download_repository(TEST_REPO_URL)
         assert "Repository not found" in str(exc_info.value)
+
+
+async def test_flatten_repository_skips_invalid_utf8_after_first_block(tmp_path):
+    """Test a large file with bad bytes past the first block leaves no output."""
+    # Given: A valid file and one that is only invalid after the first block
+    repo_dir = tmp_path / TEST_REPO_NAME
+    write_files(repo_dir, {
+        "main.py": "print('main')",
+        "large.txt": b"a" * (COPY_BUFFER_SIZE + 10) + b"\xff\xfe"
+    })
+    output_file = tmp_path / "flattened.txt"
+
+    # When: Flattening the repository
+    await flatten_repository(repo_dir, output_file)
+
+    # Then: Only the valid file is written, with no partial large file
+    content = output_file.read_text(encoding="utf-8")
+    assert content == "\n# File: main.py\nprint('main')\n"
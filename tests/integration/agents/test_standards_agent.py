@@ -8,13 +8,13 @@ Tests cover the complete flow of standards processing including:
 - Classification integration
 - Error handling scenarios
 
-Test data is currently defined in this file but should be moved to test_data.py in a future update.
+Shared test data comes from the session-scoped standards fixtures in conftest.py.
 """
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from pathlib import Path
 from bson import ObjectId
-from typing import Tuple, List
+from typing import Tuple, List, Type
 
 from app.agents.standards_agent import (
     process_standard_set,
@@ -27,20 +27,8 @@ from app.agents.standards_agent import (
     process_standard_file
 )
 from app.models.classification import Classification
-from app.utils.anthropic_client import AnthropicClient
-from tests.utils.test_data import (
-    create_standards_agent_test_data,
-    create_classification_docs,
-    create_standard_content
-)
-
-# Test Data Setup
-MOCK_STANDARD_SET_ID, MOCK_REPO_URL = create_standards_agent_test_data()
-MOCK_CLASSIFICATION_DOCS = create_classification_docs()
-MOCK_CLASSIFICATIONS = [
-    Classification.model_validate({**doc, "_id": str(doc["_id"])})
-    for doc in MOCK_CLASSIFICATION_DOCS
-]
+from tests.utils.fakes import FakeAnthropicClient
+from tests.utils.test_data import create_standard_content
 
 # Test Cases - Standard Set Processing
 
@@ -48,13 +36,17 @@ MOCK_CLASSIFICATIONS = [
 async def test_process_standard_set_success(
     standards_mock_collections: Tuple[AsyncMock, AsyncMock, AsyncMock],
     standards_test_files: Path,
-    standards_env_setup: None
+    standards_env_setup: None,
+    standards_agent_test_data: Tuple[str, str],
+    standard_set_object_id: ObjectId,
+    standards_classifications: List[Classification]
 ):
     """Test successful processing of a standard set.
 
     Verifies that standards are properly processed and stored when given valid input.
     """
     standards_collection, classifications_collection, _ = standards_mock_collections
+    standard_set_id, repo_url = standards_agent_test_data
 
     # Given: A valid repository with standards
     with patch("app.agents.standards_agent.get_database",
@@ -62,17 +54,17 @@ async def test_process_standard_set_success(
             patch("app.agents.standards_agent.download_repository",
                   return_value=(standards_test_files, MagicMock())), \
             patch("app.agents.standards_agent.get_classifications",
-                  return_value=MOCK_CLASSIFICATIONS), \
+                  return_value=standards_classifications), \
             patch("app.agents.standards_agent.analyze_standard",
                   return_value=["Python", "FastAPI"]), \
             patch("app.agents.standards_agent.process_standard_file") as mock_process_file:
 
         # When: Processing the standard set
-        await process_standard_set(MOCK_STANDARD_SET_ID, MOCK_REPO_URL)
+        await process_standard_set(standard_set_id, repo_url)
 
         # Then: Standards should be deleted and files processed
         standards_collection.delete_many.assert_called_once_with(
-            {"standard_set_id": ObjectId(MOCK_STANDARD_SET_ID)}
+            {"standard_set_id": standard_set_object_id}
         )
 
         # Verify each standard file was processed
@@ -81,7 +73,8 @@ async def test_process_standard_set_success(
 
 async def test_process_standard_set_git_error(
     standards_mock_collections: Tuple[AsyncMock, AsyncMock, AsyncMock],
-    standards_env_setup: None
+    standards_env_setup: None,
+    standards_agent_test_data: Tuple[str, str]
 ):
     """Test handling of git repository download failures."""
     # Given: A failing git repository download
@@ -91,7 +84,7 @@ async def test_process_standard_set_git_error(
               side_effect=Exception("Git error")):
         # When/Then: Processing should raise appropriate error
         with pytest.raises(StandardsProcessingError) as exc_info:
-            await process_standard_set(MOCK_STANDARD_SET_ID, MOCK_REPO_URL)
+            await process_standard_set(*standards_agent_test_data)
         assert "Git error" in str(
             exc_info.value), "Expected git error in exception message"
 
@@ -100,7 +93,7 @@ async def test_process_standard_set_git_error(
 
 async def test_analyze_standard_success(
     standards_env_setup: None,
-    mock_anthropic_client: None
+    mock_anthropic_client: Type[FakeAnthropicClient]
 ):
     """Test successful analysis of a standard with clear classification."""
     # Given: A standard with clear classification indicators
@@ -117,7 +110,7 @@ async def test_analyze_standard_success(
 
 async def test_analyze_standard_empty_response(
     standards_env_setup: None,
-    mock_anthropic_client: None
+    mock_anthropic_client: Type[FakeAnthropicClient]
 ):
     """Test handling of universal standards (no specific classification)."""
     # Given: A universal standard with no specific classification
@@ -125,20 +118,17 @@ async def test_analyze_standard_empty_response(
     classifications = ["Python", "FastAPI"]
 
     # When: LLM returns empty classification
-    with patch.object(
-        AnthropicClient,
-        "create_message",
-        return_value=""
-    ):
-        # Then: Should handle empty response appropriately
-        result = await analyze_standard(content, classifications)
-        assert len(
-            result) == 0, "Expected empty classification list for universal standard"
+    mock_anthropic_client.response = ""
+    result = await analyze_standard(content, classifications)
+
+    # Then: Should handle empty response appropriately
+    assert len(
+        result) == 0, "Expected empty classification list for universal standard"
 
 
 async def test_analyze_standard_error(
     standards_env_setup: None,
-    mock_anthropic_client: None
+    mock_anthropic_client: Type[FakeAnthropicClient]
 ):
     """Test handling of LLM analysis failures."""
     # Given: A standard to analyze
@@ -146,16 +136,13 @@ async def test_analyze_standard_error(
     classifications = ["Python"]
 
     # When: LLM fails
-    with patch.object(
-        AnthropicClient,
-        "create_message",
-        side_effect=Exception("LLM error")
-    ):
-        # Then: Should raise appropriate error
-        with pytest.raises(StandardAnalysisError) as exc_info:
-            await analyze_standard(content, classifications)
-        assert "LLM error" in str(
-            exc_info.value), "Expected LLM error in exception message"
+    mock_anthropic_client.error = Exception("LLM error")
+
+    # Then: Should raise appropriate error
+    with pytest.raises(StandardAnalysisError) as exc_info:
+        await analyze_standard(content, classifications)
+    assert "LLM error" in str(
+        exc_info.value), "Expected LLM error in exception message"
 
 # Test Cases - File Processing
 
@@ -163,7 +150,9 @@ async def test_analyze_standard_error(
 async def test_process_standard_file_success(
     standards_mock_collections: Tuple[AsyncMock, AsyncMock, AsyncMock],
     standards_test_files: Path,
-    standards_env_setup: None
+    standards_env_setup: None,
+    standard_set_object_id: ObjectId,
+    standards_classifications: List[Classification]
 ):
     """Test successful processing of an individual standard file."""
     # Given: A valid standard file and mocked dependencies
@@ -178,8 +167,8 @@ async def test_process_standard_file_success(
         await process_standard_file(
             test_file,
             standards_test_files,
-            ObjectId(MOCK_STANDARD_SET_ID),
-            MOCK_CLASSIFICATIONS,
+            standard_set_object_id,
+            standards_classifications,
             standards_collection
         )
 
@@ -187,14 +176,15 @@ async def test_process_standard_file_success(
         standards_collection.insert_one.assert_called_once()
         doc = standards_collection.insert_one.call_args[0][0]
         assert "text" in doc, "Standard text not found in stored document"
-        assert doc["standard_set_id"] == ObjectId(
-            MOCK_STANDARD_SET_ID), "Incorrect standard set ID"
+        assert doc["standard_set_id"] == standard_set_object_id, "Incorrect standard set ID"
 
 
 async def test_process_standard_file_error(
     standards_mock_collections: Tuple[AsyncMock, AsyncMock, AsyncMock],
     standards_test_files: Path,
-    standards_env_setup: None
+    standards_env_setup: None,
+    standard_set_object_id: ObjectId,
+    standards_classifications: List[Classification]
 ):
     """Test handling of standard file processing errors."""
     # Given: A non-existent standard file
@@ -206,8 +196,8 @@ async def test_process_standard_file_error(
         await process_standard_file(
             test_file,
             standards_test_files,
-            ObjectId(MOCK_STANDARD_SET_ID),
-            MOCK_CLASSIFICATIONS,
+            standard_set_object_id,
+            standards_classifications,
             standards_collection
         )
     assert "Error processing standard" in str(
@@ -216,31 +206,26 @@ async def test_process_standard_file_error(
 # Test Cases - Configuration and File Selection
 
 
-async def test_get_files_to_process_testing_mode(standards_test_files: Path):
-    """Test file filtering in testing mode with specific test files."""
-    # Given: Testing mode configuration
-    config = StandardsConfig()
-    config.llm_testing = True
-    config.testing_files = ["test.md"]
-
-    # When: Getting files to process
-    files = await get_files_to_process(standards_test_files, config)
-
-    # Then: Should only include specified test files
-    assert len(files) == 1, "Expected exactly one test file"
-    assert any("test.md" in str(f)
-               for root, f in files), "test.md not found in results"
-
-
-async def test_get_files_to_process_normal_mode(standards_test_files: Path):
-    """Test file filtering in normal processing mode."""
-    # Given: Normal mode configuration
+@pytest.mark.parametrize("llm_testing, testing_files, expected_count", [
+    (True, ["test.md"], 1),
+    (False, [], 2),
+])
+async def test_get_files_to_process(
+    standards_test_files: Path,
+    llm_testing: bool,
+    testing_files: List[str],
+    expected_count: int
+):
+    """Test file filtering in testing mode and normal processing mode."""
+    # Given: A testing or normal mode configuration
     config = StandardsConfig()
-    config.llm_testing = False
+    config.llm_testing = llm_testing
+    config.testing_files = testing_files
 
     # When: Getting files to process
     files = await get_files_to_process(standards_test_files, config)
 
-    # Then: Should include all markdown files
-    # Both test.md and python.md
-    assert len(files) == 2, "Expected both test.md and python.md"
+    # Then: Testing mode only includes the listed files, normal mode all markdown files
+    assert len(files) == expected_count, f"Expected {expected_count} files"
+    for name in testing_files:
+        assert any(name in str(f) for root, f in files), f"{name} not found in results"
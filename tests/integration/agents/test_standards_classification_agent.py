@@ -9,9 +9,11 @@ Test Categories:
 
 Key Fixtures:
 - mock_codebase_path: Temporary directory with test files
-- mock_anthropic: Mocked Anthropic client responses
+- mock_anthropic: Module-wide Anthropic patch, reset before each test
+- mock_classifications: Session-wide validated classifications
 """
 import os
+import shutil
 from pathlib import Path
 import pytest
 from bson import ObjectId
@@ -48,29 +50,47 @@ def mock_codebase_path(tmp_path):
     return tmp_path
 
 
-@pytest.fixture
-async def mock_anthropic():
-    """Mock Anthropic client responses.
+@pytest.fixture(scope="session")
+def mock_classifications():
+    """Validate the mock classifications once for the whole session.
 
     Returns:
-        MagicMock: Mocked Anthropic client with predefined responses
+        List[Classification]: Classifications shared read-only by the tests
+    """
+    return [Classification(**c) for c in create_mock_classifications()]
+
+
+@pytest.fixture(scope="module")
+def anthropic_patch():
+    """Patch the Anthropic client once for the whole module.
+
+    Yields:
+        MagicMock: Patched Anthropic client class
     """
     with patch("app.agents.standards_classification_agent.AnthropicClient") as mock:
-        mock.create_message = AsyncMock(return_value="Python, FastAPI")
         yield mock
 
 
-async def test_analyze_codebase_success(mock_codebase_path, mock_anthropic):
+@pytest.fixture(autouse=True)
+def mock_anthropic(anthropic_patch):
+    """Reset the patched Anthropic client to its default response.
+
+    Tests needing a different response replace create_message in their body.
+
+    Returns:
+        MagicMock: Mocked Anthropic client with predefined responses
+    """
+    anthropic_patch.create_message = AsyncMock(return_value="Python, FastAPI")
+    return anthropic_patch
+
+
+async def test_analyze_codebase_success(mock_codebase_path, mock_anthropic, mock_classifications):
     """Test successful codebase analysis with valid classifications.
 
     Given: A codebase path and list of classifications
     When: Analyzing the codebase
     Then: Should return matching classification IDs
     """
-    # Given: A codebase path and list of classifications
-    mock_classifications = [Classification(
-        **c) for c in create_mock_classifications()]
-
     # When: Analyzing the codebase
     result = await analyze_codebase_classifications(mock_codebase_path, mock_classifications)
 
@@ -83,7 +103,7 @@ async def test_analyze_codebase_success(mock_codebase_path, mock_anthropic):
 # Test Cases - Edge Cases
 
 
-async def test_empty_codebase_analysis(mock_codebase_path, mock_anthropic):
+async def test_empty_codebase_analysis(mock_codebase_path, mock_anthropic, mock_classifications):
     """Test analysis of empty codebase directory.
 
     Given: An empty directory
@@ -91,17 +111,14 @@ async def test_empty_codebase_analysis(mock_codebase_path, mock_anthropic):
     Then: Should return empty list
     """
     # Given: An empty directory
-    for item in mock_codebase_path.iterdir():
-        if item.is_file():
-            item.unlink()
-        else:
-            for subitem in item.iterdir():
-                subitem.unlink()
-            item.rmdir()
+    with os.scandir(mock_codebase_path) as entries:
+        for entry in entries:
+            if entry.is_file(follow_symlinks=False):
+                os.unlink(entry.path)
+            else:
+                shutil.rmtree(entry.path)
 
     mock_anthropic.create_message = AsyncMock(return_value="")
-    mock_classifications = [Classification(
-        **c) for c in create_mock_classifications()]
 
     # When: Analyzing the codebase
     result = await analyze_codebase_classifications(mock_codebase_path, mock_classifications)
@@ -110,7 +127,7 @@ async def test_empty_codebase_analysis(mock_codebase_path, mock_anthropic):
     assert result == []
 
 
-async def test_binary_file_codebase_analysis(mock_codebase_path, mock_anthropic):
+async def test_binary_file_codebase_analysis(mock_codebase_path, mock_anthropic, mock_classifications):
     """Test analysis of codebase with binary files.
 
     Given: A codebase with binary files
@@ -121,9 +138,6 @@ async def test_binary_file_codebase_analysis(mock_codebase_path, mock_anthropic)
     binary_file = mock_codebase_path / "image.jpg"
     binary_file.write_bytes(b"binary content")
 
-    mock_classifications = [Classification(
-        **c) for c in create_mock_classifications()]
-
     # When: Analyzing the codebase
     result = await analyze_codebase_classifications(mock_codebase_path, mock_classifications)
 
@@ -135,7 +149,7 @@ async def test_binary_file_codebase_analysis(mock_codebase_path, mock_anthropic)
 # Test Cases - Error Handling
 
 
-async def test_invalid_codebase_path():
+async def test_invalid_codebase_path(mock_classifications):
     """Test error handling for invalid codebase path.
 
     Given: An invalid path
@@ -144,15 +158,13 @@ async def test_invalid_codebase_path():
     """
     # Given: An invalid path
     invalid_path = Path("/nonexistent/path")
-    mock_classifications = [Classification(
-        **c) for c in create_mock_classifications()]
 
     # When/Then: Should raise ClassificationError
     with pytest.raises(ClassificationError):
         await analyze_codebase_classifications(invalid_path, mock_classifications)
 
 
-async def test_anthropic_api_failure(mock_codebase_path, mock_anthropic):
+async def test_anthropic_api_failure(mock_codebase_path, mock_anthropic, mock_classifications):
     """Test error handling for Anthropic API failure.
 
     Given: Anthropic API failure
@@ -162,8 +174,6 @@ async def test_anthropic_api_failure(mock_codebase_path, mock_anthropic):
     # Given: Anthropic API failure
     mock_anthropic.create_message = AsyncMock(
         side_effect=Exception("API Error"))
-    mock_classifications = [Classification(
-        **c) for c in create_mock_classifications()]
 
     # When/Then: Should raise ClassificationError
     with pytest.raises(ClassificationError):
@@ -53,6 +53,31 @@ def setup_service(mock_database_setup, mock_collections):
     
     return service, code_reviews_collection, standard_sets_collection
 
+def mock_find_standard_sets(standard_sets_collection, standard_sets):
+    """Mock the batch lookup of standard sets used to validate a review.
+
+    Args:
+        standard_sets_collection: Mocked standard sets collection
+        standard_sets: Standard set documents the lookup should return
+    """
+    mock_cursor = MagicMock()
+    mock_cursor.to_list = AsyncMock(return_value=[
+        {"_id": ObjectId(str(standard_set["_id"]))} for standard_set in standard_sets
+    ])
+    standard_sets_collection.find = MagicMock(return_value=mock_cursor)
+
+def assert_standard_sets_looked_up(standard_sets_collection, standard_set_ids):
+    """Assert standard sets were validated with a single $in lookup.
+
+    Args:
+        standard_sets_collection: Mocked standard sets collection
+        standard_set_ids: Standard set IDs the lookup should filter on
+    """
+    standard_sets_collection.find.assert_called_once_with(
+        {"_id": {"$in": [ObjectId(standard_set_id) for standard_set_id in standard_set_ids]}},
+        {"_id": 1}
+    )
+
 @pytest.fixture
 def setup_mock_result(operation_type="insert", count=1, doc_id=None):
     """Helper fixture to setup mock results for database operations.
@@ -94,7 +119,7 @@ async def test_create_code_review_success(
     # Given: Valid code review data and mocked dependencies
     _, code_reviews_collection, standard_sets_collection = setup_service
     standard_set = create_standard_set_reference(valid_code_review_data["standard_sets"][0])
-    standard_sets_collection.find_one = AsyncMock(return_value=standard_set)
+    mock_find_standard_sets(standard_sets_collection, [standard_set])
     
     mock_doc = create_code_review_test_data(
         repository_url=valid_code_review_data["repository_url"],
@@ -104,7 +129,7 @@ async def test_create_code_review_success(
     code_reviews_collection.find_one = AsyncMock(return_value=mock_doc)
     
     # When: Create code review request is made
-    with patch('app.services.code_review_service.Process'):
+    with patch('app.services.code_review_service.submit_in_process'):
         response = await async_client.post("/api/v1/code-reviews", json=valid_code_review_data)
     
     # Then: Verify response and process creation
@@ -119,6 +144,34 @@ async def test_create_code_review_success(
     assert len(data["standard_sets"]) == 1
     assert data["standard_sets"][0]["_id"] == valid_code_review_data["standard_sets"][0]
     assert data["standard_sets"][0]["name"] == standard_set["name"]
+    assert_standard_sets_looked_up(standard_sets_collection, valid_code_review_data["standard_sets"])
+
+async def test_create_code_review_without_standard_sets(
+    async_client,
+    setup_service,
+    setup_mock_result,
+    valid_code_review_data
+):
+    """Test a review with no standard sets skips the standard set lookup."""
+    # Given: Code review data with an empty list of standard sets
+    _, code_reviews_collection, standard_sets_collection = setup_service
+    review_data = {**valid_code_review_data, "standard_sets": []}
+    standard_sets_collection.find = MagicMock()
+    mock_doc = create_code_review_test_data(
+        repository_url=review_data["repository_url"],
+        standard_sets=[]
+    )
+    code_reviews_collection.insert_one = AsyncMock(return_value=setup_mock_result)
+    code_reviews_collection.find_one = AsyncMock(return_value=mock_doc)
+
+    # When: Create code review request is made
+    with patch('app.services.code_review_service.submit_in_process'):
+        response = await async_client.post("/api/v1/code-reviews", json=review_data)
+
+    # Then: The review is created without querying standard sets
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()["standard_sets"] == []
+    standard_sets_collection.find.assert_not_called()
 
 async def test_create_code_review_validation_error(
     async_client,
@@ -129,7 +182,7 @@ async def test_create_code_review_validation_error(
     # Given: Invalid test data
     
     # When: Create request is made with invalid data
-    with patch('app.services.code_review_service.Process'):
+    with patch('app.services.code_review_service.submit_in_process'):
         response = await async_client.post("/api/v1/code-reviews", json=invalid_code_review_data)
     
     # Then: Verify validation error response
@@ -146,17 +199,18 @@ async def test_create_code_review_invalid_standard_set(
     """Test code review creation with non-existent standard set."""
     # Given: Setup with non-existent standard set
     _, _, standard_sets_collection = setup_service
-    standard_sets_collection.find_one = AsyncMock(return_value=None)
+    mock_find_standard_sets(standard_sets_collection, [])
     
     # When: Create request is made
-    with patch('app.services.code_review_service.Process') as mock_process:
+    with patch('app.services.code_review_service.submit_in_process') as mock_submit:
         response = await async_client.post("/api/v1/code-reviews", json=valid_code_review_data)
     
     # Then: Verify error response and no process creation
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     data = response.json()
     assert f"Standard set {valid_code_review_data['standard_sets'][0]} not found" in data["detail"]
-    mock_process.assert_not_called()
+    assert_standard_sets_looked_up(standard_sets_collection, valid_code_review_data["standard_sets"])
+    mock_submit.assert_not_called()
 
 async def test_create_code_review_db_error(
     async_client,
@@ -168,11 +222,11 @@ async def test_create_code_review_db_error(
     # Given: Setup with database error
     _, code_reviews_collection, standard_sets_collection = setup_service
     standard_set = create_standard_set_reference(valid_code_review_data["standard_sets"][0])
-    standard_sets_collection.find_one = AsyncMock(return_value=standard_set)
+    mock_find_standard_sets(standard_sets_collection, [standard_set])
     code_reviews_collection.insert_one = setup_error_mock
     
     # When: Create request is made
-    with patch('app.services.code_review_service.Process') as mock_process:
+    with patch('app.services.code_review_service.submit_in_process') as mock_submit:
         response = await async_client.post("/api/v1/code-reviews", json=valid_code_review_data)
     
     # Then: Verify error response and no process creation
@@ -180,7 +234,7 @@ async def test_create_code_review_db_error(
     data = response.json()
     assert "Error creating code review" in data["detail"]
     assert "Database error" in data["detail"]
-    mock_process.assert_not_called()
+    mock_submit.assert_not_called()
 
 async def test_create_code_review_multiple_standard_sets(
     async_client,
@@ -195,11 +249,7 @@ async def test_create_code_review_multiple_standard_sets(
     standard_sets = [create_standard_set_reference(id) for id in standard_set_ids]
     
     # Mock standard sets lookup
-    async def mock_find_one(filter_dict):
-        set_id = filter_dict["_id"]
-        return next((s for s in standard_sets if str(s["_id"]) == str(set_id)), None)
-    
-    standard_sets_collection.find_one = AsyncMock(side_effect=mock_find_one)
+    mock_find_standard_sets(standard_sets_collection, standard_sets)
     
     # Prepare test data with multiple standard sets
     test_data = valid_code_review_data.copy()
@@ -213,7 +263,7 @@ async def test_create_code_review_multiple_standard_sets(
     code_reviews_collection.find_one = AsyncMock(return_value=mock_doc)
     
     # When: Create code review request is made
-    with patch('app.services.code_review_service.Process'):
+    with patch('app.services.code_review_service.submit_in_process'):
         response = await async_client.post("/api/v1/code-reviews", json=test_data)
     
     # Then: Verify response
@@ -222,6 +272,7 @@ async def test_create_code_review_multiple_standard_sets(
     assert len(data["standard_sets"]) == len(standard_set_ids)
     for i, standard_set in enumerate(data["standard_sets"]):
         assert standard_set["_id"] == standard_set_ids[i]
+    assert_standard_sets_looked_up(standard_sets_collection, standard_set_ids)
 
 async def test_create_code_review_partial_standard_sets_failure(
     async_client,
@@ -232,18 +283,14 @@ async def test_create_code_review_partial_standard_sets_failure(
     # Given: Mix of valid and invalid standard set IDs
     _, _, standard_sets_collection = setup_service
     valid_set = create_standard_set_reference(str(ObjectId()))
-    
-    async def mock_find_one(filter_dict):
-        return valid_set if str(filter_dict["_id"]) == str(valid_set["_id"]) else None
-    
-    standard_sets_collection.find_one = AsyncMock(side_effect=mock_find_one)
+    mock_find_standard_sets(standard_sets_collection, [valid_set])
     
     # Prepare test data with mix of valid/invalid sets
     test_data = valid_code_review_data.copy()
     test_data["standard_sets"] = [str(valid_set["_id"]), str(ObjectId())]
     
     # When: Create request is made
-    with patch('app.services.code_review_service.Process'):
+    with patch('app.services.code_review_service.submit_in_process'):
         response = await async_client.post("/api/v1/code-reviews", json=test_data)
     
     # Then: Verify error response
@@ -251,6 +298,32 @@ async def test_create_code_review_partial_standard_sets_failure(
     data = response.json()
     assert "Standard set" in data["detail"]
     assert "not found" in data["detail"]
+    assert_standard_sets_looked_up(standard_sets_collection, test_data["standard_sets"])
+
+async def test_create_code_review_reports_all_missing_standard_sets(
+    async_client,
+    setup_service,
+    valid_code_review_data
+):
+    """Test one lookup validates every standard set and reports all missing ones."""
+    # Given: Two standard set IDs that do not exist
+    _, _, standard_sets_collection = setup_service
+    mock_find_standard_sets(standard_sets_collection, [])
+    missing_ids = [str(ObjectId()), str(ObjectId())]
+
+    test_data = valid_code_review_data.copy()
+    test_data["standard_sets"] = missing_ids
+
+    # When: Create request is made
+    with patch('app.services.code_review_service.submit_in_process') as mock_submit:
+        response = await async_client.post("/api/v1/code-reviews", json=test_data)
+
+    # Then: Both IDs are reported after a single query
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    detail = response.json()["detail"]
+    assert all(missing_id in detail for missing_id in missing_ids)
+    assert_standard_sets_looked_up(standard_sets_collection, missing_ids)
+    mock_submit.assert_not_called()
 
 async def test_create_code_review_duplicate_standard_sets(
     async_client,
@@ -261,7 +334,7 @@ async def test_create_code_review_duplicate_standard_sets(
     # Given: Duplicate standard set IDs
     _, code_reviews_collection, standard_sets_collection = setup_service
     standard_set = create_standard_set_reference(str(ObjectId()))
-    standard_sets_collection.find_one = AsyncMock(return_value=standard_set)
+    mock_find_standard_sets(standard_sets_collection, [standard_set])
     
     # Mock the insert operation to raise validation error
     async def mock_insert(*args, **kwargs):
@@ -274,10 +347,11 @@ async def test_create_code_review_duplicate_standard_sets(
     test_data["standard_sets"] = [str(standard_set["_id"]), str(standard_set["_id"])]
     
     # When: Create request is made
-    with patch('app.services.code_review_service.Process'):
+    with patch('app.services.code_review_service.submit_in_process'):
         response = await async_client.post("/api/v1/code-reviews", json=test_data)
     
     # Then: Verify error response
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     data = response.json()
-    assert "Duplicate standard sets" in data["detail"] 
\ No newline at end of file
+    assert "Duplicate standard sets" in data["detail"]
+    assert_standard_sets_looked_up(standard_sets_collection, test_data["standard_sets"]) 
\ No newline at end of file
@@ -7,6 +7,7 @@ from fastapi import status
 from bson import ObjectId
 from datetime import UTC
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
+from pymongo.errors import DuplicateKeyError
 from tests.utils.test_data import (
     create_standard_set_test_data,
     create_standard_test_data,
@@ -98,12 +99,17 @@ async def test_create_standard_set_success(
     standard_sets_collection.find_one_and_replace = AsyncMock(return_value=created_doc)
 
     # When: POST request is made with valid data
-    with patch('app.services.standard_set_service.Process'):
+    with patch('app.services.standard_set_service.submit_in_process') as mock_submit:
         response = await async_client.post("/api/v1/standard-sets", json=valid_standard_set_data)
 
-    # Then: Returns 201 with created standard set
+    # Then: Returns 201 with created standard set and starts the agent in the worker pool
     assert response.status_code == status.HTTP_201_CREATED
     data = response.json()
+    mock_submit.assert_called_once_with(
+        StandardSetService._run_agent_process_sync,
+        data["_id"],
+        valid_standard_set_data["repository_url"]
+    )
     assert data["name"] == valid_standard_set_data["name"]
     assert data["repository_url"] == valid_standard_set_data["repository_url"]
     assert data["custom_prompt"] == valid_standard_set_data["custom_prompt"]
@@ -111,6 +117,33 @@ async def test_create_standard_set_success(
     assert "created_at" in data
     assert "updated_at" in data
 
+async def test_create_standard_set_concurrent_duplicate_name(
+    async_client,
+    setup_service,
+    valid_standard_set_data
+):
+    """Test a create that loses a race on the unique name replaces the winner."""
+    # Given: Another request inserts the same name between lookup and upsert
+    _, standard_sets_collection, standards_collection = setup_service
+    standard_sets_collection.find_one = AsyncMock(return_value=None)
+    standards_collection.delete_many = AsyncMock()
+    created_doc = create_standard_set_test_data()
+    standard_sets_collection.find_one_and_replace = AsyncMock(
+        side_effect=[DuplicateKeyError("E11000 duplicate key"), created_doc]
+    )
+
+    # When: POST request is made with valid data
+    with patch('app.services.standard_set_service.submit_in_process'):
+        response = await async_client.post("/api/v1/standard-sets", json=valid_standard_set_data)
+
+    # Then: The existing document is replaced, keeping its _id, instead of a 500
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()["_id"] == str(created_doc["_id"])
+    retry = standard_sets_collection.find_one_and_replace.call_args_list[1]
+    assert retry.args[0] == {"name": valid_standard_set_data["name"]}
+    assert "_id" not in retry.args[1]
+    assert "upsert" not in retry.kwargs
+
 async def test_create_standard_set_update_existing(
     async_client,
     mock_database_setup,
@@ -130,7 +163,7 @@ async def test_create_standard_set_update_existing(
     app.dependency_overrides[get_standard_set_service] = lambda: service
 
     # When: POST request is made with existing name
-    with patch('app.services.standard_set_service.Process'):
+    with patch('app.services.standard_set_service.submit_in_process'):
         response = await async_client.post("/api/v1/standard-sets", json=valid_standard_set_data)
 
     # Then: Returns 201 with updated standard set
@@ -155,7 +188,7 @@ async def test_create_standard_set_invalid_data(
     app.dependency_overrides[get_standard_set_service] = lambda: service
 
     # When: POST request is made with invalid data
-    with patch('app.services.standard_set_service.Process'):
+    with patch('app.services.standard_set_service.submit_in_process'):
         response = await async_client.post("/api/v1/standard-sets", json=invalid_standard_set_data)
 
     # Then: Returns 422 validation error
@@ -179,7 +212,7 @@ async def test_create_standard_set_database_error(
     app.dependency_overrides[get_standard_set_service] = lambda: service
 
     # When: POST request is made
-    with patch('app.services.standard_set_service.Process'):
+    with patch('app.services.standard_set_service.submit_in_process'):
         response = await async_client.post("/api/v1/standard-sets", json=valid_standard_set_data)
 
     # Then: Returns 500 with error message
@@ -202,7 +235,7 @@ async def test_create_standard_set_validation_error(
     app.dependency_overrides[get_standard_set_service] = lambda: service
 
     # When: POST request is made
-    with patch('app.services.standard_set_service.Process'):
+    with patch('app.services.standard_set_service.submit_in_process'):
         response = await async_client.post("/api/v1/standard-sets", json=valid_standard_set_data)
 
     # Then: Returns 400 with validation error message
@@ -224,7 +257,7 @@ async def test_create_standard_set_unexpected_error(
     app.dependency_overrides[get_standard_set_service] = lambda: service
 
     # When: POST request is made
-    with patch('app.services.standard_set_service.Process'):
+    with patch('app.services.standard_set_service.submit_in_process'):
         response = await async_client.post("/api/v1/standard-sets", json=valid_standard_set_data)
 
     # Then: Returns 500 with internal server error message
@@ -247,7 +280,7 @@ async def test_create_standard_set_find_one_and_replace_returns_none(
     app.dependency_overrides[get_standard_set_service] = lambda: service
 
     # When: POST request is made
-    with patch('app.services.standard_set_service.Process'):
+    with patch('app.services.standard_set_service.submit_in_process'):
         response = await async_client.post("/api/v1/standard-sets", json=valid_standard_set_data)
 
     # Then: Returns 201 with created standard set
@@ -275,7 +308,7 @@ async def test_update_standard_set_replace_fails(
     app.dependency_overrides[get_standard_set_service] = lambda: service
 
     # When: POST request is made to update
-    with patch('app.services.standard_set_service.Process'):
+    with patch('app.services.standard_set_service.submit_in_process'):
         response = await async_client.post("/api/v1/standard-sets", json=valid_standard_set_data)
 
     # Then: Returns 500 with error message
@@ -300,7 +333,7 @@ async def test_find_by_name_returns_none(
     app.dependency_overrides[get_standard_set_service] = lambda: service
 
     # When: POST request is made
-    with patch('app.services.standard_set_service.Process'):
+    with patch('app.services.standard_set_service.submit_in_process'):
         response = await async_client.post("/api/v1/standard-sets", json=valid_standard_set_data)
 
     # Then: Returns 201 with created standard set
@@ -322,7 +355,7 @@ async def test_find_by_name_database_error(
     app.dependency_overrides[get_standard_set_service] = lambda: service
 
     # When: POST request is made
-    with patch('app.services.standard_set_service.Process'):
+    with patch('app.services.standard_set_service.submit_in_process'):
         response = await async_client.post("/api/v1/standard-sets", json=valid_standard_set_data)
 
     # Then: Returns 500 with error message
@@ -356,7 +389,7 @@ async def test_create_standard_set_standards_deletion_error(
     app.dependency_overrides[get_standard_set_service] = lambda: service
 
     # When: POST request is made
-    with patch('app.services.standard_set_service.Process'):
+    with patch('app.services.standard_set_service.submit_in_process'):
         response = await async_client.post("/api/v1/standard-sets", json=valid_standard_set_data)
 
     # Then: Returns 500 with error message
@@ -0,0 +1,67 @@
+"""Integration tests for the health endpoint and startup schema migration."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+@pytest.fixture
+def mock_startup(mock_database_setup):
+    """Patch database startup so the lifespan runs without MongoDB."""
+    with patch("app.main.initialize_database", new_callable=AsyncMock) as mock_init, \
+            patch("app.main.get_database", new_callable=AsyncMock, return_value=MagicMock()):
+        yield mock_init
+
+
+@pytest.mark.parametrize("mode, expected_status, init_calls", [
+    ("sync", "succeeded", 1),
+    ("skip", "skipped", 0),
+])
+def test_health_reports_migration_status(mock_startup, mode, expected_status, init_calls):
+    """Test the health check reports the outcome of startup schema setup."""
+    # Given: A configured migration mode
+    with patch("app.main.settings.MIGRATION_MODE", mode):
+        # When: Starting the app and calling the health check
+        with TestClient(app) as test_client:
+            response = test_client.get("/health")
+
+    # Then: The migration status matches the mode
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"status": "healthy", "migration": expected_status}
+    assert mock_startup.await_count == init_calls
+
+
+def test_async_migration_does_not_block_startup(mock_startup):
+    """Test async mode serves requests while schema setup is still running."""
+    # Given: Schema setup that never finishes on its own
+    async def never_finishes():
+        await asyncio.Event().wait()
+
+    mock_startup.side_effect = never_finishes
+
+    # When: Starting the app in async mode
+    with patch("app.main.settings.MIGRATION_MODE", "async"):
+        with TestClient(app) as test_client:
+            response = test_client.get("/health")
+
+    # Then: The app is healthy and reports the migration as running
+    assert response.json() == {"status": "healthy", "migration": "running"}
+
+
+def test_failed_migration_is_reported(mock_startup):
+    """Test a failed background schema setup is visible in the health check."""
+    # Given: Schema setup that fails
+    mock_startup.side_effect = Exception("Connection refused")
+
+    # When: Starting the app in async mode and letting setup finish
+    with patch("app.main.settings.MIGRATION_MODE", "async"):
+        with TestClient(app) as test_client:
+            test_client.portal.call(asyncio.sleep, 0)
+            response = test_client.get("/health")
+
+    # Then: The failure is reported
+    assert response.json() == {"status": "healthy", "migration": "failed"}
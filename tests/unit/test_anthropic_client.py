@@ -1,33 +1,85 @@
 """Unit tests for Anthropic client utility."""
 import pytest
+from types import SimpleNamespace
 from unittest.mock import patch, AsyncMock, MagicMock
 from anthropic import AsyncAnthropic, AsyncAnthropicBedrock
 from app.utils.anthropic_client import (
-    AnthropicClient, 
+    AnthropicClient,
     DirectAnthropicClient,
     BedrockAnthropicClient,
     USE_BEDROCK,
     AnthropicClientProtocol,
-    BaseAnthropicClient
+    BaseAnthropicClient,
+    HTTP_KEEPALIVE_EXPIRY
 )
 
 from app.config.config import settings
 
+
+# Request params expected for the standard test prompt, besides the model
+EXPECTED_REQUEST = dict(
+    max_tokens=100,
+    system="Test system prompt",
+    temperature=0.8,
+    messages=[{"role": "user", "content": "Test prompt"}]
+)
+
+
+class _FakeResponse:
+    """Message response exposing only the content blocks."""
+    __slots__ = ('content',)
+
+    def __init__(self, content):
+        self.content = content
+
+
+class _FakeMessages:
+    """Messages API returning a fixed response and recording the request."""
+
+    def __init__(self, response=None, error=None):
+        self._response = response
+        self._error = error
+        self.calls = []
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        if self._error is not None:
+            raise self._error
+        return self._response
+
+
+def _fake_client(response=None, error=None):
+    """Create a fake client whose messages API returns the response."""
+    return SimpleNamespace(messages=_FakeMessages(response, error))
+
+
+@pytest.fixture
+def bedrock_settings(monkeypatch):
+    """Enable Bedrock with test credentials and model."""
+    monkeypatch.setattr('app.utils.anthropic_client.USE_BEDROCK', True)
+    with patch.multiple(
+        settings,
+        AWS_ACCESS_KEY="test-key",
+        AWS_SECRET_KEY="test-secret",
+        AWS_REGION="test-region",
+        AWS_BEDROCK_MODEL="test-bedrock-model"
+    ):
+        yield settings
+
+
 @pytest.fixture
 def mock_anthropic_response():
     """Create mock Anthropic response."""
-    mock = MagicMock()
-    mock.content = [MagicMock(text="Test response")]
-    return mock
+    return _FakeResponse(content=[SimpleNamespace(text="Test response")])
 
 class TestAnthropicClient:
     """Test cases for AnthropicClient."""
 
-    def setup_method(self):
-        """Reset client instance before each test."""
-        AnthropicClient._instance = None
-        DirectAnthropicClient._instance = None
-        BedrockAnthropicClient._instance = None
+    @pytest.fixture(autouse=True)
+    def reset_instances(self, monkeypatch):
+        """Start each test without cached clients, restoring them afterwards."""
+        for client_cls in (AnthropicClient, DirectAnthropicClient, BedrockAnthropicClient):
+            monkeypatch.setattr(client_cls, '_instance', None)
 
     async def test_get_client_creates_direct_instance(self):
         """Test direct client instance creation with valid API key."""
@@ -36,32 +88,53 @@ class TestAnthropicClient:
              patch('app.utils.anthropic_client.settings.ANTHROPIC_API_KEY', 'fake-api-key'):
             # When: Getting client instance
             client = AnthropicClient.get_client()
-            
+
             # Then: Should return AsyncAnthropic instance
             assert isinstance(client, AsyncAnthropic)
 
-    async def test_get_client_creates_bedrock_instance(self):
+    async def test_get_client_reuses_pooled_http_client(self):
+        """Test the client keeps idle connections alive between requests."""
+        # Given: No existing client instance and Bedrock disabled
+        with patch('app.utils.anthropic_client.USE_BEDROCK', False), \
+             patch('app.utils.anthropic_client.settings.ANTHROPIC_API_KEY', 'fake-api-key'):
+            # When: Getting the client twice
+            client = AnthropicClient.get_client()
+            same_client = AnthropicClient.get_client()
+
+            # Then: One connection pool is shared with the extended keepalive
+            assert client._client is same_client._client
+            assert client.max_retries == settings.ANTHROPIC_MAX_RETRIES
+            assert client._client._transport._pool._keepalive_expiry == HTTP_KEEPALIVE_EXPIRY
+
+    async def test_get_client_creates_bedrock_instance(self, bedrock_settings):
         """Test bedrock client instance creation with valid credentials."""
         # Given: No existing client instance and Bedrock enabled
-        with patch('app.utils.anthropic_client.USE_BEDROCK', True):
-            with patch('app.utils.anthropic_client.settings') as mock_settings:
-                mock_settings.AWS_ACCESS_KEY = "test-key"
-                mock_settings.AWS_SECRET_KEY = "test-secret"
-                mock_settings.AWS_REGION = "test-region"
+        # When: Getting client instance
+        client = AnthropicClient.get_client()
 
-                # When: Getting client instance
-                client = AnthropicClient.get_client()
+        # Then: New Bedrock instance is created
+        assert isinstance(client, AsyncAnthropicBedrock)
+        assert isinstance(AnthropicClient._instance, BedrockAnthropicClient)
 
-                # Then: New Bedrock instance is created
-                assert isinstance(client, AsyncAnthropicBedrock)
-                assert isinstance(AnthropicClient._instance, BedrockAnthropicClient)
+    async def test_direct_and_bedrock_clients_do_not_share_instance(self):
+        """Test each client implementation caches its own instance."""
+        # Given: A direct client already created
+        with patch('app.utils.anthropic_client.settings.ANTHROPIC_API_KEY', 'fake-api-key'):
+            direct_client = DirectAnthropicClient.get_client()
+
+        # When: Getting the Bedrock client
+        bedrock_client = BedrockAnthropicClient.get_client()
+
+        # Then: Each implementation returns its own client type
+        assert isinstance(direct_client, AsyncAnthropic)
+        assert isinstance(bedrock_client, AsyncAnthropicBedrock)
+        assert DirectAnthropicClient._instance is direct_client
+        assert BedrockAnthropicClient._instance is bedrock_client
 
     async def test_direct_client_raises_error_without_api_key(self):
         """Test error handling when API key is missing for direct client."""
         # Given: No API key in settings
-        with patch('app.utils.anthropic_client.settings') as mock_settings:
-            mock_settings.ANTHROPIC_API_KEY = None
-
+        with patch.object(settings, 'ANTHROPIC_API_KEY', None):
             # When/Then: Getting client raises error
             with pytest.raises(ValueError, match="ANTHROPIC_API_KEY environment variable not set"):
                 DirectAnthropicClient.get_client()
@@ -70,11 +143,7 @@ class TestAnthropicClient:
         """Test message creation with direct client."""
         # Given: Mocked direct client instance
         with patch('app.utils.anthropic_client.USE_BEDROCK', False):
-            mock_messages = AsyncMock()
-            mock_messages.create = AsyncMock(return_value=mock_anthropic_response)
-
-            mock_client = AsyncMock()
-            mock_client.messages = mock_messages
+            mock_client = _fake_client(mock_anthropic_response)
 
             with patch.object(DirectAnthropicClient, 'get_client', return_value=mock_client):
                 # When: Creating message
@@ -87,54 +156,54 @@ class TestAnthropicClient:
 
                 # Then: Message is created with correct parameters
                 assert response == "Test response"
-                mock_messages.create.assert_called_once_with(
-                    model="claude-3-5-sonnet-20241022",
-                    max_tokens=100,
-                    system="Test system prompt",
-                    temperature=0.8,
-                    messages=[{"role": "user", "content": "Test prompt"}]
-                )
+                assert mock_client.messages.calls == [
+                    dict(model="claude-3-5-sonnet-20241022", **EXPECTED_REQUEST)
+                ]
+
+    async def test_create_message_respects_zero_temperature(self, mock_anthropic_response):
+        """Test an explicit 0.0 temperature is not replaced by the default."""
+        # Given: A configured default temperature above zero
+        mock_client = _fake_client(mock_anthropic_response)
+
+        with patch('app.utils.anthropic_client.USE_BEDROCK', False), \
+             patch.object(DirectAnthropicClient, 'get_client', return_value=mock_client), \
+             patch('app.utils.anthropic_client.settings.ANTHROPIC_TEMPERATURE', 0.7):
+            # When: Creating a message with temperature 0.0
+            await AnthropicClient.create_message(
+                prompt="Test prompt",
+                system_prompt="Test system prompt",
+                temperature=0.0
+            )
+
+        # Then: The explicit temperature is used
+        assert mock_client.messages.calls[0]["temperature"] == 0.0
 
-    async def test_create_message_with_bedrock_client(self, mock_anthropic_response):
+    async def test_create_message_with_bedrock_client(
+        self, bedrock_settings, mock_anthropic_response, monkeypatch
+    ):
         """Test message creation with bedrock client."""
         # Given: Mocked bedrock client instance
-        with patch('app.utils.anthropic_client.USE_BEDROCK', True):
-            mock_messages = AsyncMock()
-            mock_messages.create = AsyncMock(return_value=mock_anthropic_response)
-
-            mock_client = AsyncMock()
-            mock_client.messages = mock_messages
-
-            with patch.object(BedrockAnthropicClient, 'get_client', return_value=mock_client):
-                with patch('app.utils.anthropic_client.settings') as mock_settings:
-                    mock_settings.AWS_BEDROCK_MODEL = "test-bedrock-model"
-
-                    # When: Creating message
-                    response = await AnthropicClient.create_message(
-                        prompt="Test prompt",
-                        system_prompt="Test system prompt",
-                        max_tokens=100,
-                        temperature=0.8
-                    )
-
-                    # Then: Message is created with correct parameters
-                    assert response == "Test response"
-                    mock_messages.create.assert_called_once_with(
-                        model="test-bedrock-model",
-                        max_tokens=100,
-                        system="Test system prompt",
-                        temperature=0.8,
-                        messages=[{"role": "user", "content": "Test prompt"}]
-                    )
+        mock_client = _fake_client(mock_anthropic_response)
+        monkeypatch.setattr(BedrockAnthropicClient, '_instance', mock_client)
+
+        # When: Creating message
+        response = await AnthropicClient.create_message(
+            prompt="Test prompt",
+            system_prompt="Test system prompt",
+            max_tokens=100,
+            temperature=0.8
+        )
+
+        # Then: Message is created with correct parameters
+        assert response == "Test response"
+        assert mock_client.messages.calls == [
+            dict(model="test-bedrock-model", **EXPECTED_REQUEST)
+        ]
 
     async def test_create_message_handles_api_error(self, mock_anthropic_response):
         """Test error handling in message creation."""
         # Given: Mocked client that raises an error
-        mock_messages = AsyncMock()
-        mock_messages.create = AsyncMock(side_effect=Exception("API Error"))
-
-        mock_client = AsyncMock()
-        mock_client.messages = mock_messages
+        mock_client = _fake_client(error=Exception("API Error"))
 
         with patch.object(DirectAnthropicClient, 'get_client', return_value=mock_client):
             # When/Then: Creating message raises error
@@ -155,7 +224,7 @@ async def test_anthropic_client_protocol():
     """Test AnthropicClientProtocol implementation."""
     # Given: A class implementing the protocol
     client = MockAnthropicClient()
-    
+
     # When/Then: Messages method exists and returns
     messages = await client.messages()
     assert messages is not None
@@ -171,13 +240,13 @@ async def test_base_anthropic_client_instance():
             if cls._instance is None:  # Add instance initialization
                 cls._instance = AsyncMock()
             return cls._instance
-    
+
     # When: Accessing instance before initialization
     assert TestClient._instance is None
-    
+
     # When: Getting client
     client = TestClient.get_client()
-    
+
     # Then: Instance is set
     assert TestClient._instance is not None
     assert isinstance(client, AsyncMock)
@@ -186,22 +255,16 @@ async def test_base_anthropic_client_instance():
 async def test_create_message_response_error():
     """Test error handling when response structure is invalid."""
     # Given: A mocked client with invalid response structure
-    mock_response = MagicMock()
-    mock_response.content = []  # Empty content to trigger IndexError
-    
-    mock_messages = AsyncMock()
-    mock_messages.create = AsyncMock(return_value=mock_response)
-    
-    mock_client = AsyncMock()
-    mock_client.messages = mock_messages
-    
+    mock_response = _FakeResponse(content=[])  # Empty content to trigger IndexError
+    mock_client = _fake_client(mock_response)
+
     with patch.object(DirectAnthropicClient, 'get_client', return_value=mock_client):
         # When: Creating message
         result = await AnthropicClient.create_message(
             prompt="Test prompt",
             system_prompt="Test system prompt"
         )
-        
+
         # Then: Should handle error and return empty string
         assert result == ""
 
@@ -209,21 +272,99 @@ async def test_create_message_response_error():
 async def test_create_message_attribute_error():
     """Test error handling when response lacks required attributes."""
     # Given: A mocked client with response missing attributes
-    mock_response = MagicMock()
-    delattr(mock_response, 'content')  # Remove content attribute to trigger AttributeError
-    
-    mock_messages = AsyncMock()
-    mock_messages.create = AsyncMock(return_value=mock_response)
-    
-    mock_client = AsyncMock()
-    mock_client.messages = mock_messages
-    
+    mock_response = SimpleNamespace()  # No content attribute to trigger AttributeError
+    mock_client = _fake_client(mock_response)
+
     with patch.object(DirectAnthropicClient, 'get_client', return_value=mock_client):
         # When: Creating message
         result = await AnthropicClient.create_message(
             prompt="Test prompt",
             system_prompt="Test system prompt"
         )
-        
+
         # Then: Should handle error and return empty string
-        assert result == "" 
\ No newline at end of file
+        assert result == ""
+
+
+def _batch_entry(custom_id, text=None):
+    """Create a mock batch result entry."""
+    entry = MagicMock()
+    entry.custom_id = custom_id
+    if text is None:
+        entry.result.type = "errored"
+    else:
+        entry.result.type = "succeeded"
+        entry.result.message.content = [MagicMock(text=text)]
+    return entry
+
+
+def _mock_batch_client(entries, statuses=("ended",)):
+    """Create a mock client exposing the Message Batches API."""
+    batches = [MagicMock(id="batch-1", processing_status=status) for status in statuses]
+
+    async def results(_batch_id):
+        async def iterate():
+            for entry in entries:
+                yield entry
+        return iterate()
+
+    mock_client = MagicMock()
+    mock_client.messages.batches.create = AsyncMock(return_value=batches[0])
+    mock_client.messages.batches.retrieve = AsyncMock(side_effect=batches[1:])
+    mock_client.messages.batches.results = results
+    return mock_client
+
+
+async def test_create_batch_returns_ordered_results():
+    """Test batch results are returned in prompt order once processing ends."""
+    # Given: A batch that finishes after one poll with results out of order
+    mock_client = _mock_batch_client(
+        [_batch_entry("request-1", "Second"), _batch_entry("request-0", "First")],
+        statuses=("in_progress", "ended")
+    )
+
+    with patch.object(DirectAnthropicClient, 'get_client', return_value=mock_client), \
+         patch('app.utils.anthropic_client.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+        # When: Creating a batch
+        results = await AnthropicClient.create_batch(
+            prompts=["Prompt 0", "Prompt 1"],
+            system_prompt="Test system prompt"
+        )
+
+    # Then: Results follow prompt order and the batch was polled
+    assert results == ["First", "Second"]
+    mock_sleep.assert_called_once()
+    requests = mock_client.messages.batches.create.call_args.kwargs["requests"]
+    assert [r["custom_id"] for r in requests] == ["request-0", "request-1"]
+    assert requests[0]["params"]["messages"] == [{"role": "user", "content": "Prompt 0"}]
+
+
+async def test_create_batch_returns_errors_per_request():
+    """Test unsuccessful batch requests get an error without losing the rest."""
+    # Given: A batch with one errored request and one missing result
+    mock_client = _mock_batch_client(
+        [_batch_entry("request-0", "First"), _batch_entry("request-1")]
+    )
+
+    with patch.object(DirectAnthropicClient, 'get_client', return_value=mock_client):
+        # When: Creating a batch
+        results = await AnthropicClient.create_batch(
+            prompts=["Prompt 0", "Prompt 1", "Prompt 2"],
+            system_prompt="Test system prompt"
+        )
+
+    # Then: Each failed request has its own error in prompt order
+    first, errored, missing = results
+    assert first == "First"
+    assert isinstance(errored, RuntimeError)
+    assert "request-1 was errored" in str(errored)
+    assert isinstance(missing, RuntimeError)
+    assert "request-2 returned no result" in str(missing)
+
+
+async def test_supports_batches_only_for_direct_client():
+    """Test batches are only supported for the direct Anthropic API."""
+    with patch('app.utils.anthropic_client.USE_BEDROCK', False):
+        assert AnthropicClient.supports_batches()
+    with patch('app.utils.anthropic_client.USE_BEDROCK', True):
+        assert not AnthropicClient.supports_batches()
@@ -0,0 +1,102 @@
+"""Unit tests for the in-process TTL cache."""
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from app.common import cache
+
+
+async def test_get_or_load_caches_value_within_ttl():
+    """Test a cached value is reused until it expires."""
+    # Given: A loader returning a value
+    loader = AsyncMock(return_value=["Python"])
+
+    # When: Loading the same key twice within the TTL
+    first = await cache.get_or_load("bucket", "key", loader, ttl=60)
+    second = await cache.get_or_load("bucket", "key", loader, ttl=60)
+
+    # Then: The loader runs once and both calls get the value
+    assert first == second == ["Python"]
+    loader.assert_awaited_once()
+
+
+async def test_get_or_load_reloads_after_expiry():
+    """Test an expired value is loaded again."""
+    # Given: A value cached at t=0 with a 60s TTL
+    loader = AsyncMock(side_effect=["old", "new"])
+    with patch("app.common.cache.time.monotonic", return_value=0.0):
+        await cache.get_or_load("bucket", "key", loader, ttl=60)
+
+    # When: Loading after the TTL has passed
+    with patch("app.common.cache.time.monotonic", return_value=61.0):
+        result = await cache.get_or_load("bucket", "key", loader, ttl=60)
+
+    # Then: The fresh value is returned
+    assert result == "new"
+    assert loader.await_count == 2
+
+
+async def test_concurrent_callers_share_one_load():
+    """Test concurrent misses for the same key trigger a single load."""
+    # Given: A slow loader
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return calls
+
+    # When: Several callers miss at the same time
+    results = await asyncio.gather(
+        *(cache.get_or_load("bucket", "key", loader, ttl=60) for _ in range(5))
+    )
+
+    # Then: Only one load happens
+    assert calls == 1
+    assert results == [1] * 5
+
+
+async def test_invalidate_drops_only_bucket():
+    """Test invalidating a bucket leaves other buckets cached."""
+    # Given: Values cached in two buckets
+    await cache.get_or_load("a", "key", AsyncMock(return_value=1), ttl=60)
+    await cache.get_or_load("b", "key", AsyncMock(return_value=2), ttl=60)
+
+    # When: Invalidating one bucket
+    cache.clear("a")
+
+    # Then: Only that bucket is reloaded
+    loader_a = AsyncMock(return_value=3)
+    loader_b = AsyncMock(return_value=4)
+    assert await cache.get_or_load("a", "key", loader_a, ttl=60) == 3
+    assert await cache.get_or_load("b", "key", loader_b, ttl=60) == 2
+    loader_b.assert_not_awaited()
+
+
+async def test_invalidate_prunes_idle_locks():
+    """Test invalidating a bucket drops its locks so they do not accumulate."""
+    # Given: Values cached under several keys in two buckets
+    for key in range(3):
+        await cache.get_or_load("a", key, AsyncMock(return_value=key), ttl=60)
+    await cache.get_or_load("b", "key", AsyncMock(return_value=1), ttl=60)
+
+    # When: Invalidating one bucket
+    cache.invalidate("a")
+
+    # Then: Only the other bucket's lock remains
+    assert list(cache._locks) == [("b", "key")]
+
+
+async def test_get_or_load_evicts_expired_entries():
+    """Test storing a value drops expired entries for other keys."""
+    # Given: A value cached at t=0 with a 60s TTL
+    with patch("app.common.cache.time.monotonic", return_value=0.0):
+        await cache.get_or_load("bucket", "old", AsyncMock(return_value=1), ttl=60)
+
+    # When: Loading a different key after the first has expired
+    with patch("app.common.cache.time.monotonic", return_value=61.0):
+        await cache.get_or_load("bucket", "new", AsyncMock(return_value=2), ttl=60)
+
+    # Then: Only the fresh entry and its lock remain
+    assert list(cache._entries) == [("bucket", "new")]
+    assert list(cache._locks) == [("bucket", "new")]
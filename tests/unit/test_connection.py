@@ -0,0 +1,86 @@
+"""Unit tests for MongoDB connection management."""
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pymongo.read_preferences import ReadPreference
+
+from app.database import connection
+
+
+@pytest.fixture(autouse=True)
+def clear_clients():
+    """Start each test without cached clients."""
+    connection._clients.clear()
+    yield
+    connection._clients.clear()
+
+
+def test_create_client_reuses_client_for_same_uri():
+    """Test repeated calls with the same URI share one client."""
+    # Given: A patched Motor client class
+    with patch("app.database.connection.AsyncIOMotorClient") as mock_client_cls:
+        # When: Creating a client twice for the same URI
+        first_client, _ = connection.create_client("mongodb://db:27017")
+        second_client, _ = connection.create_client("mongodb://db:27017")
+
+    # Then: Only one client is constructed
+    assert first_client is second_client
+    mock_client_cls.assert_called_once()
+
+
+def test_create_client_builds_new_client_in_child_process():
+    """Test a client cached by another process is not reused."""
+    # Given: A client created in the current process
+    with patch("app.database.connection.AsyncIOMotorClient", side_effect=lambda *a, **k: MagicMock()):
+        parent_client, _ = connection.create_client("mongodb://db:27017")
+
+        # When: Creating a client under a different pid
+        with patch("app.database.connection.os.getpid", return_value=-1):
+            child_client, _ = connection.create_client("mongodb://db:27017")
+
+    # Then: The child gets its own client
+    assert child_client is not parent_client
+
+
+def test_close_client_evicts_from_cache():
+    """Test a closed client is not handed out again."""
+    # Given: A cached client
+    with patch("app.database.connection.AsyncIOMotorClient", side_effect=lambda *a, **k: MagicMock()):
+        client, _ = connection.create_client("mongodb://db:27017")
+
+        # When: Closing it and creating a client again
+        connection.close_client(client)
+        new_client, _ = connection.create_client("mongodb://db:27017")
+
+    # Then: The old client was closed and a new one created
+    client.close.assert_called_once()
+    assert new_client is not client
+
+
+def test_close_all_clients_closes_only_current_process_clients():
+    """Test exit cleanup leaves clients inherited from a parent alone."""
+    # Given: One client for this process and one for another pid
+    own_client = MagicMock()
+    inherited_client = MagicMock()
+    connection._clients[("mongodb://db:27017", connection.os.getpid())] = own_client
+    connection._clients[("mongodb://db:27017", -1)] = inherited_client
+
+    # When: Closing all clients
+    connection.close_all_clients()
+
+    # Then: Only this process's client is closed
+    own_client.close.assert_called_once()
+    inherited_client.close.assert_not_called()
+
+
+def test_create_client_reads_from_primary():
+    """Test the database handle uses the primary read preference."""
+    # Given: A patched Motor client class
+    with patch("app.database.connection.AsyncIOMotorClient") as mock_client_cls:
+        # When: Creating a client
+        client, _ = connection.create_client("mongodb://db:27017")
+
+    # Then: The database is opened with a primary read preference
+    _, kwargs = client.get_database.call_args
+    assert kwargs["read_preference"] == ReadPreference.PRIMARY
+    assert "readPreference" not in mock_client_cls.call_args.kwargs
@@ -0,0 +1,193 @@
+"""Unit tests for database schema setup and its lock."""
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pymongo.errors import DuplicateKeyError, OperationFailure
+
+from app.database import database_init
+from app.database.database_init import (
+    COLLECTION_INDEXES,
+    SCHEMA_LOCK_COLLECTION,
+    SCHEMA_LOCK_ID,
+    acquire_schema_lock,
+    init_database,
+    release_schema_lock,
+    try_schema_lock
+)
+
+OWNER = "host:1"
+
+
+@pytest.fixture
+def lock_collection():
+    """Mock collection holding the lock document."""
+    collection = MagicMock()
+    collection.find_one_and_update = AsyncMock()
+    collection.find_one = AsyncMock()
+    collection.update_one = AsyncMock()
+    return collection
+
+
+@pytest.fixture
+def lock_db(lock_collection):
+    """Mock database returning the lock collection."""
+    db = MagicMock()
+    db.__getitem__.side_effect = {SCHEMA_LOCK_COLLECTION: lock_collection}.__getitem__
+    return db
+
+
+@pytest.fixture
+def no_sleep():
+    """Skip the wait between lock polls."""
+    with patch("app.database.database_init.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        yield mock_sleep
+
+
+async def test_try_schema_lock_takes_free_lock(lock_collection):
+    """Test the lock is taken when free or expired."""
+    # Given: The upsert returns a lock owned by this process
+    lock_collection.find_one_and_update.return_value = {"_id": SCHEMA_LOCK_ID, "owner": OWNER}
+
+    # When: Trying the lock
+    result = await try_schema_lock(lock_collection, OWNER)
+
+    # Then: The lock is held, and only an expired lock could be replaced
+    assert result is True
+    query, update = lock_collection.find_one_and_update.call_args.args
+    assert query["_id"] == SCHEMA_LOCK_ID
+    assert "$lt" in query["expires"]
+    assert update["$set"]["owner"] == OWNER
+    assert update["$set"]["status"] == "running"
+    assert lock_collection.find_one_and_update.call_args.kwargs["upsert"] is True
+
+
+async def test_try_schema_lock_held_elsewhere(lock_collection):
+    """Test an unexpired lock held by another replica is not taken."""
+    # Given: The upsert collides with the existing lock document
+    lock_collection.find_one_and_update.side_effect = DuplicateKeyError("duplicate")
+
+    # When/Then: Trying the lock fails without raising
+    assert await try_schema_lock(lock_collection, OWNER) is False
+
+
+async def test_acquire_schema_lock_taken_immediately(lock_db, lock_collection, no_sleep):
+    """Test schema setup runs when the lock is free."""
+    # Given: A free lock
+    lock_collection.find_one_and_update.return_value = {"owner": OWNER}
+
+    # When/Then: This process should run schema setup, without waiting
+    assert await acquire_schema_lock(lock_db, OWNER) is True
+    no_sleep.assert_not_awaited()
+
+
+async def test_acquire_schema_lock_other_replica_succeeded(lock_db, lock_collection, no_sleep):
+    """Test waiting replicas skip setup once another replica succeeds."""
+    # Given: A lock held elsewhere whose setup then succeeds
+    lock_collection.find_one_and_update.side_effect = DuplicateKeyError("duplicate")
+    lock_collection.find_one.return_value = {"status": "succeeded", "owner": "other:2"}
+
+    # When/Then: This process skips schema setup after one poll
+    assert await acquire_schema_lock(lock_db, OWNER) is False
+    no_sleep.assert_awaited_once()
+    lock_collection.find_one.assert_awaited_once_with({"_id": SCHEMA_LOCK_ID})
+
+
+async def test_acquire_schema_lock_retries_after_failure(lock_db, lock_collection, no_sleep):
+    """Test the lock is taken over after another replica's setup fails."""
+    # Given: A lock held elsewhere that is released as failed
+    lock_collection.find_one_and_update.side_effect = [
+        DuplicateKeyError("duplicate"),
+        {"owner": OWNER}
+    ]
+    lock_collection.find_one.return_value = {"status": "failed", "owner": "other:2"}
+
+    # When/Then: This process takes the lock and runs schema setup
+    assert await acquire_schema_lock(lock_db, OWNER) is True
+    assert lock_collection.find_one_and_update.await_count == 2
+
+
+async def test_acquire_schema_lock_skips_after_deadline(lock_db, lock_collection, no_sleep):
+    """Test setup is skipped when the lock is not freed within its TTL."""
+    # Given: A lock that stays held by a replica that never finishes
+    lock_collection.find_one_and_update.side_effect = DuplicateKeyError("duplicate")
+    lock_collection.find_one.return_value = {"status": "running", "owner": "other:2"}
+
+    # When: The deadline has already passed on the first poll
+    with patch.object(database_init, "SCHEMA_LOCK_TTL", timedelta(seconds=-1)):
+        result = await acquire_schema_lock(lock_db, OWNER)
+
+    # Then: Schema setup is skipped
+    assert result is False
+    no_sleep.assert_awaited_once()
+
+
+async def test_release_schema_lock_records_status(lock_db, lock_collection):
+    """Test releasing the lock records the outcome and expires it."""
+    # When: Releasing the lock after a failed setup
+    await release_schema_lock(lock_db, OWNER, "failed")
+
+    # Then: Only this owner's lock is updated, with the status and expiry
+    query, update = lock_collection.update_one.call_args.args
+    assert query == {"_id": SCHEMA_LOCK_ID, "owner": OWNER}
+    assert update["$set"]["status"] == "failed"
+    assert "expires" in update["$set"]
+
+
+@pytest.fixture
+def schema_db():
+    """Mock database for init_database, with no existing collections."""
+    db = MagicMock()
+    db.create_collection = AsyncMock()
+    cursor = MagicMock()
+    cursor.to_list = AsyncMock(return_value=[])
+    db.list_collections = AsyncMock(return_value=cursor)
+
+    collections = {name: MagicMock() for name in COLLECTION_INDEXES}
+    for collection in collections.values():
+        collection.create_indexes = AsyncMock()
+    db.get_collection.side_effect = lambda name, **kwargs: collections[name]
+
+    client = MagicMock()
+    client.admin.command = AsyncMock()
+    with patch("app.database.database_init.create_client", return_value=(client, db)), \
+            patch("app.database.database_init.acquire_schema_lock",
+                  new_callable=AsyncMock, return_value=True), \
+            patch("app.database.database_init.release_schema_lock",
+                  new_callable=AsyncMock) as mock_release:
+        yield db, collections, mock_release
+
+
+async def test_init_database_creates_indexes(schema_db):
+    """Test every managed collection gets its indexes, including unique names."""
+    # Given: A database with none of the managed collections
+    _, collections, mock_release = schema_db
+
+    # When: Initializing the database
+    await init_database()
+
+    # Then: Each collection's indexes are created and setup is recorded as succeeded
+    for name, collection in collections.items():
+        collection.create_indexes.assert_awaited_once_with(COLLECTION_INDEXES[name])
+    standard_set_index = COLLECTION_INDEXES["standard_sets"][0].document
+    assert standard_set_index["key"] == {"name": 1}
+    assert standard_set_index["unique"] is True
+    assert mock_release.await_args.args[2] == "succeeded"
+
+
+async def test_init_database_continues_when_index_creation_fails(schema_db):
+    """Test an index that cannot be built is logged without stopping setup."""
+    # Given: Existing duplicate standard set names block the unique index
+    _, collections, mock_release = schema_db
+    collections["standard_sets"].create_indexes.side_effect = OperationFailure(
+        "E11000 duplicate key error")
+
+    # When: Initializing the database
+    with patch.object(database_init.logger, "warning") as mock_warning:
+        await init_database()
+
+    # Then: The failure is logged and the other collections are still indexed
+    messages = [call.args[0] for call in mock_warning.call_args_list]
+    assert any("indexes for standard_sets" in message for message in messages)
+    collections["standards"].create_indexes.assert_awaited_once()
+    assert mock_release.await_args.args[2] == "succeeded"
@@ -0,0 +1,74 @@
+"""Unit tests for the lazily created database connection."""
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.database import database_utils
+from app.database.database_utils import close_database, get_database, reset_database
+
+
+@pytest.fixture(autouse=True)
+def reset_connection():
+    """Start and finish each test without a connection."""
+    reset_database()
+    yield
+    reset_database()
+
+
+async def test_get_database_creates_client_once():
+    """Test the client is created on first use and then reused."""
+    # Given: No connection yet
+    mock_db = MagicMock()
+    with patch("app.database.database_utils.create_client",
+               return_value=(MagicMock(), mock_db)) as mock_create:
+        # When: Getting the database twice
+        first = await get_database()
+        second = await get_database()
+
+    # Then: One client is created and shared
+    assert first is second is mock_db
+    mock_create.assert_called_once()
+
+
+async def test_get_database_recreates_client_after_fork():
+    """Test a child process does not reuse the parent's client."""
+    # Given: A connection created by another process
+    with patch("app.database.database_utils.create_client",
+               side_effect=lambda: (MagicMock(), MagicMock())) as mock_create:
+        parent_db = await get_database()
+        database_utils._pid = -1
+
+        # When: Getting the database in this process
+        child_db = await get_database()
+
+    # Then: A new client is created
+    assert child_db is not parent_db
+    assert mock_create.call_count == 2
+
+
+async def test_close_database_closes_and_forgets_client():
+    """Test closing the connection lets the next use create a new one."""
+    # Given: A connection created in this process
+    mock_client = MagicMock()
+    with patch("app.database.database_utils.create_client",
+               return_value=(mock_client, MagicMock())), \
+            patch("app.database.database_utils.close_client") as mock_close:
+        await get_database()
+
+        # When: Closing the database
+        close_database()
+
+    # Then: The client is closed through the connection module and forgotten
+    mock_close.assert_called_once_with(mock_client)
+    assert database_utils.client is None
+    assert database_utils.db is None
+
+
+def test_close_database_without_connection():
+    """Test closing before any connection was created does nothing."""
+    # Given/When: Closing with no connection
+    with patch("app.database.database_utils.close_client") as mock_close:
+        close_database()
+
+    # Then: No client is closed
+    mock_close.assert_not_called()
@@ -1,43 +1,58 @@
 """Unit tests for logging configuration."""
 import logging
-import os
 from pathlib import Path
-from unittest.mock import mock_open, patch
+from unittest.mock import patch
 
 import pytest
 import yaml
 
-from app.common.logging import configure_logging, get_logger
+from app.common import logging as app_logging
+from app.common.logging import LOG_FILE, configure_logging, get_logger
+
+
+# Basic logging config, serialised once and written to the session config file
+MOCK_YAML_CONFIG = {
+    "version": 1,
+    "root": {
+        "level": "INFO",
+        "handlers": ["default"]
+    },
+    "formatters": {
+        "default": {"format": ""},
+        "access": {"format": ""}
+    },
+    "handlers": {
+        "default": {
+            "class": "logging.StreamHandler",
+            "formatter": "default"
+        }
+    },
+    "loggers": {}  # Add empty loggers section
+}
+MOCK_YAML_CONFIG_TEXT = yaml.dump(MOCK_YAML_CONFIG)
+
+
+@pytest.fixture(scope="session")
+def logging_config_file(tmp_path_factory):
+    """Write the basic logging config to a file once per session."""
+    config_file = tmp_path_factory.mktemp("config") / "logging.yaml"
+    config_file.write_text(MOCK_YAML_CONFIG_TEXT)
+    return config_file
 
 
-@pytest.fixture
-def mock_yaml_config():
-    """Basic logging config fixture."""
-    return {
-        "version": 1,
-        "root": {
-            "level": "INFO",
-            "handlers": ["default"]
-        },
-        "formatters": {
-            "default": {"format": ""},
-            "access": {"format": ""}
-        },
-        "handlers": {
-            "default": {
-                "class": "logging.StreamHandler",
-                "formatter": "default"
-            }
-        },
-        "loggers": {}  # Add empty loggers section
-    }
+@pytest.fixture(autouse=True)
+def use_logging_config_file(logging_config_file, monkeypatch):
+    """Point configure_logging at the test config file."""
+    monkeypatch.setattr(app_logging, "LOGGING_CONFIG_FILE", logging_config_file)
 
 
 @pytest.fixture(autouse=True)
 def setup_and_teardown():
     """Reset logging config after each test."""
+    app_logging._configured = False
     yield
     logging.getLogger().handlers = []
+    app_logging._configured = False
 
 
 @pytest.fixture
@@ -48,11 +63,10 @@ def mock_settings():
         yield mock_settings
 
 
-async def test_configure_logging_local_environment(mock_yaml_config, mock_settings):
+async def test_configure_logging_local_environment(mock_settings):
     # Given: Local environment setup
-    with patch.dict(os.environ, {"LOG_TYPE": "local"}), \
-         patch("builtins.open", mock_open(read_data=yaml.dump(mock_yaml_config))), \
-         patch("pathlib.Path.mkdir"):
+    mock_settings.LOG_TYPE = "local"
+    with patch("pathlib.Path.mkdir"):
 
         # When: Configure logging
         configure_logging()
@@ -71,20 +85,39 @@ async def test_configure_logging_local_environment(mock_yaml_config, mock_settin
         assert not pymongo_logger.propagate
 
 
-async def test_configure_logging_non_local_environment(mock_yaml_config, mock_settings):
+async def test_configure_logging_non_local_environment(mock_settings):
     # Given: Non-local environment
-    with patch.dict(os.environ, {"LOG_TYPE": "prod"}), \
-         patch("builtins.open", mock_open(read_data=yaml.dump(mock_yaml_config))):
+    mock_settings.LOG_TYPE = "prod"
 
-        # When: Configure logging
+    # When: Configure logging
+    configure_logging()
+
+    # Then: Verify ECS formatting
+    root_logger = logging.getLogger()
+    handlers = root_logger.handlers
+
+    assert len(handlers) == 1  # Only default handler
+    assert isinstance(handlers[0], logging.StreamHandler)
+
+
+async def test_configure_logging_runs_once_with_rotating_log_file(mock_settings):
+    # Given: Local environment setup
+    mock_settings.LOG_TYPE = "local"
+    with patch("app.common.logging.yaml.load", wraps=yaml.load) as mock_load, \
+         patch("pathlib.Path.mkdir"), \
+         patch("logging.config.dictConfig") as mock_dict_config:
+
+        # When: Configure logging twice
+        configure_logging()
         configure_logging()
 
-        # Then: Verify ECS formatting
-        root_logger = logging.getLogger()
-        handlers = root_logger.handlers
-        
-        assert len(handlers) == 1  # Only default handler
-        assert isinstance(handlers[0], logging.StreamHandler)
+    # Then: Logging is configured once with a lazily opened rotating log file
+    mock_dict_config.assert_called_once()
+    mock_load.assert_called_once()
+    file_handler = mock_dict_config.call_args.args[0]["handlers"]["file"]
+    assert file_handler["class"] == "logging.handlers.RotatingFileHandler"
+    assert file_handler["filename"] == str(LOG_FILE)
+    assert file_handler["delay"] is True
 
 
 async def test_get_logger():
@@ -0,0 +1,239 @@
+"""Unit tests for the MongoDB backup and restore script."""
+import copy
+import io
+from datetime import datetime
+from unittest.mock import patch
+
+import orjson
+from bson import ObjectId
+
+from scripts import mongo_backup
+
+STANDARD_SET_ID = ObjectId("507f1f77bcf86cd799439011")
+CLASSIFICATION_ID = ObjectId("507f1f77bcf86cd799439012")
+CREATED_AT = datetime(2024, 1, 2, 3, 4, 5, 678000)
+
+# A dump in the format written by the earlier json.dump version of the
+# script, with non-ASCII text escaped
+FIXTURE_DUMP = b"""{
+  "standard_sets": [
+    {
+      "_id": "507f1f77bcf86cd799439011",
+      "name": "Caf\\u00e9 standards \\u2713",
+      "created_at": "2024-01-02T03:04:05.678000",
+      "updated_at": "2024-01-02T03:04:05.678000"
+    }
+  ],
+  "standards": [
+    {
+      "_id": "507f1f77bcf86cd799439013",
+      "text": "Use UTF-8",
+      "standard_set_id": "507f1f77bcf86cd799439011",
+      "classification_ids": ["507f1f77bcf86cd799439012"],
+      "created_at": "2024-01-02T03:04:05.678000",
+      "updated_at": "2024-01-02T03:04:05.678000"
+    }
+  ],
+  "classifications": []
+}"""
+
+
+class FakeCollection:
+    """In-memory collection recording the calls restore makes."""
+
+    def __init__(self, documents=None):
+        self.documents = list(documents or [])
+        self.insert_calls = []
+
+    def find(self, batch_size=None):
+        """Return copies of the stored documents."""
+        return iter(copy.deepcopy(self.documents))
+
+    def delete_many(self, query):
+        """Remove every stored document."""
+        self.documents = []
+
+    def insert_many(self, documents, **kwargs):
+        """Store documents and record the insert options."""
+        self.insert_calls.append((len(documents), kwargs))
+        self.documents.extend(copy.deepcopy(documents))
+
+
+class FakeDatabase(dict):
+    """In-memory database creating collections on first access."""
+
+    def __missing__(self, name):
+        self[name] = FakeCollection()
+        return self[name]
+
+    def list_collection_names(self):
+        """Return the names of the collections."""
+        return list(self)
+
+
+def make_database():
+    """Create a database holding documents with MongoDB types."""
+    return FakeDatabase(
+        standard_sets=FakeCollection([{
+            "_id": STANDARD_SET_ID,
+            "name": "Café standards ✓",
+            "created_at": CREATED_AT,
+            "updated_at": CREATED_AT
+        }]),
+        standards=FakeCollection([{
+            "_id": ObjectId(),
+            "text": "Nested",
+            "standard_set_id": STANDARD_SET_ID,
+            "classification_ids": [CLASSIFICATION_ID],
+            "meta": {"owner_id": STANDARD_SET_ID, "items": [{"created_at": CREATED_AT}]},
+            "created_at": CREATED_AT,
+            "updated_at": CREATED_AT
+        }]),
+        classifications=FakeCollection()
+    )
+
+
+def write_marker(name, path):
+    """Write a file named after the collection, run in a worker process."""
+    (path / name).write_text(name)
+
+
+def test_json_dump_round_trip(tmp_path):
+    """Test a JSON dump restores the original documents and types."""
+    # Given: A database and its streamed JSON dump
+    source = make_database()
+    dump_file = tmp_path / "dump.json"
+    with open(dump_file, "wb") as f:
+        mongo_backup.write_json_dump(source, f)
+
+    # When: Restoring the dump into an empty database
+    target = FakeDatabase()
+    for collection_name, documents in mongo_backup.load_json_dump(str(dump_file)).items():
+        mongo_backup.restore_collection(target, collection_name, documents)
+
+    # Then: Every collection matches, including ObjectIds, dates and UTF-8 text
+    assert target.list_collection_names() == source.list_collection_names()
+    for collection_name, collection in source.items():
+        assert target[collection_name].documents == collection.documents
+    assert "Café standards ✓".encode("utf-8") in dump_file.read_bytes()
+
+
+def test_json_dump_matches_full_document_dump():
+    """Test streaming gives the same JSON as dumping every collection at once."""
+    # Given: A database with empty and non-empty collections
+    db = make_database()
+    f = io.BytesIO()
+
+    # When: Streaming the dump
+    mongo_backup.write_json_dump(db, f)
+
+    # Then: The output matches the one-shot dump of the whole mapping
+    expected = orjson.dumps(
+        {name: collection.documents for name, collection in db.items()},
+        option=orjson.OPT_INDENT_2, default=str
+    )
+    assert f.getvalue() == expected
+
+
+def test_json_dump_empty_database():
+    """Test a database with no collections dumps as an empty object."""
+    f = io.BytesIO()
+    mongo_backup.write_json_dump(FakeDatabase(), f)
+    assert orjson.loads(f.getvalue()) == {}
+
+
+def test_load_escaped_fixture_dump(tmp_path):
+    """Test a dump written with \\u escapes by json.dump still restores."""
+    # Given: A dump from the earlier json.dump version of the script
+    dump_file = tmp_path / "fixture.json"
+    dump_file.write_bytes(FIXTURE_DUMP)
+
+    # When: Loading and restoring it, then dumping it again
+    db = FakeDatabase()
+    for collection_name, documents in mongo_backup.load_json_dump(str(dump_file)).items():
+        mongo_backup.restore_collection(db, collection_name, documents)
+    f = io.BytesIO()
+    mongo_backup.write_json_dump(db, f)
+
+    # Then: Types are converted and the new dump holds the same data
+    standard_set = db["standard_sets"].documents[0]
+    assert standard_set["_id"] == STANDARD_SET_ID
+    assert standard_set["name"] == "Café standards ✓"
+    assert standard_set["created_at"] == CREATED_AT
+    standard = db["standards"].documents[0]
+    assert standard["standard_set_id"] == STANDARD_SET_ID
+    assert standard["classification_ids"] == [CLASSIFICATION_ID]
+    assert orjson.loads(f.getvalue()) == orjson.loads(FIXTURE_DUMP)
+
+
+def test_convert_json_types_leaves_other_values():
+    """Test only valid IDs and dates under matching keys are converted."""
+    # Given: Values that look like, but are not, IDs and dates
+    data = {"items": [[{
+        "_id": "not-an-id",
+        "created_at": "yesterday",
+        "name_id_hint": "507f1f77bcf86cd799439011",
+        "updated_at": "2024-01-02T03:04:05.678000",
+        "tags": ["507f1f77bcf86cd799439011"]
+    }]]}
+
+    # When: Converting the types
+    item = mongo_backup.convert_json_types(data)["items"][0][0]
+
+    # Then: Only the valid date is converted
+    assert item["_id"] == "not-an-id"
+    assert item["created_at"] == "yesterday"
+    assert item["name_id_hint"] == "507f1f77bcf86cd799439011"
+    assert item["updated_at"] == CREATED_AT
+    assert item["tags"] == ["507f1f77bcf86cd799439011"]
+
+
+def test_restore_collection_inserts_unordered_batches():
+    """Test restore clears the collection and inserts unordered batches."""
+    # Given: A collection with stale data and five documents to restore
+    db = FakeDatabase(standards=FakeCollection([{"_id": "stale"}]))
+    documents = [{"_id": index} for index in range(5)]
+
+    # When: Restoring with a batch size of two
+    with patch.object(mongo_backup, "BATCH_SIZE", 2):
+        mongo_backup.restore_collection(db, "standards", iter(documents))
+
+    # Then: The stale data is gone and every batch skips ordering and validation
+    assert db["standards"].documents == documents
+    options = {"ordered": False, "bypass_document_validation": True}
+    assert db["standards"].insert_calls == [(2, options), (2, options), (1, options)]
+
+
+def test_bson_dump_round_trip(tmp_path):
+    """Test a BSON dump restores the original documents and types."""
+    # Given: A database dumped to one .bson file per collection
+    source = make_database()
+    with patch.object(mongo_backup, "get_database", return_value=source):
+        for collection_name in source.list_collection_names():
+            mongo_backup.dump_bson_collection(collection_name, str(tmp_path))
+
+    # When: Restoring each file into an empty database
+    target = FakeDatabase()
+    with patch.object(mongo_backup, "get_database", return_value=target):
+        for collection_name in source.list_collection_names():
+            mongo_backup.restore_bson_collection(collection_name, str(tmp_path))
+
+    # Then: Every collection matches without any type conversion
+    for collection_name, collection in source.items():
+        assert target[collection_name].documents == collection.documents
+
+
+def test_run_per_collection_uses_worker_processes(tmp_path):
+    """Test each collection is handled by the spawned process pool."""
+    # When: Running a task for two collections
+    mongo_backup.run_per_collection(write_marker, ["standards", "classifications"], tmp_path)
+
+    # Then: Both tasks ran
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["classifications", "standards"]
+
+
+def test_run_per_collection_without_collections(tmp_path):
+    """Test no process pool is started when there are no collections."""
+    with patch.object(mongo_backup, "ProcessPoolExecutor") as mock_executor:
+        mongo_backup.run_per_collection(write_marker, [], tmp_path)
+    mock_executor.assert_not_called()
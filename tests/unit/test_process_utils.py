@@ -0,0 +1,125 @@
+"""Unit tests for background process utilities."""
+import asyncio
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.database import database_utils
+from app.database.database_utils import get_database
+from app.utils import process_utils
+
+
+@pytest.fixture(autouse=True)
+def reset_pool():
+    """Start and finish each test without a worker pool."""
+    process_utils._executor = None
+    yield
+    process_utils._executor = None
+
+
+@pytest.fixture
+def worker_loop():
+    """Run each test with a fresh worker loop and no database connection."""
+    database_utils.reset_database()
+    process_utils._worker_loop = None
+    yield
+    if process_utils._worker_loop is not None:
+        process_utils._worker_loop.close()
+    process_utils._worker_loop = None
+    database_utils.reset_database()
+
+
+def test_get_process_pool_is_created_once():
+    """Test the worker pool is created lazily and then reused."""
+    # Given: A patched executor class
+    with patch("app.utils.process_utils.ProcessPoolExecutor") as mock_executor_cls:
+        # When: Getting the pool twice
+        first = process_utils.get_process_pool()
+        second = process_utils.get_process_pool()
+
+    # Then: One pool is created with the configured worker count
+    assert first is second
+    mock_executor_cls.assert_called_once()
+    _, kwargs = mock_executor_cls.call_args
+    assert kwargs["max_workers"] == process_utils.settings.BACKGROUND_WORKERS
+    assert kwargs["initializer"] is process_utils._init_worker
+
+
+def test_submit_in_process_logs_failed_tasks():
+    """Test a task that fails in a worker is logged."""
+    # Given: A pool whose task fails
+    future = Future()
+    mock_executor = MagicMock()
+    mock_executor.submit.return_value = future
+
+    with patch("app.utils.process_utils.ProcessPoolExecutor", return_value=mock_executor), \
+            patch.object(process_utils.logger, "error") as mock_log:
+        # When: Submitting the task and it fails
+        result = process_utils.submit_in_process(print, "review-id")
+        future.set_exception(RuntimeError("boom"))
+
+    # Then: The task was submitted and its failure logged
+    assert result is future
+    mock_executor.submit.assert_called_once_with(print, "review-id")
+    mock_log.assert_called_once()
+    assert "boom" in mock_log.call_args[0][0]
+
+
+def test_submit_in_process_restarts_broken_pool():
+    """Test a broken pool is replaced and the task submitted again."""
+    # Given: A pool whose worker died, and a healthy replacement
+    future = Future()
+    broken = MagicMock()
+    broken.submit.side_effect = BrokenProcessPool("worker died")
+    healthy = MagicMock()
+    healthy.submit.return_value = future
+
+    with patch("app.utils.process_utils.ProcessPoolExecutor",
+               side_effect=[broken, healthy]) as mock_executor_cls:
+        # When: Submitting a task
+        result = process_utils.submit_in_process(print, "review-id")
+
+    # Then: The broken pool is shut down and the task runs on the new pool
+    assert result is future
+    broken.shutdown.assert_called_once_with(wait=False)
+    healthy.submit.assert_called_once_with(print, "review-id")
+    assert mock_executor_cls.call_count == 2
+    assert process_utils._executor is healthy
+
+
+def test_shutdown_process_pool():
+    """Test shutting down stops the pool and allows a new one later."""
+    # Given: A started pool
+    with patch("app.utils.process_utils.ProcessPoolExecutor") as mock_executor_cls:
+        pool = process_utils.get_process_pool()
+
+        # When: Shutting it down
+        process_utils.shutdown_process_pool()
+
+    # Then: The pool is shut down and forgotten
+    pool.shutdown.assert_called_once_with(wait=False)
+    assert process_utils._executor is None
+
+
+def test_run_in_worker_loop_reuses_loop_and_connection(worker_loop):
+    """Test tasks in the same worker share one event loop and database client."""
+    # Given: A task recording the loop and database it ran with
+    seen = []
+
+    async def task(name):
+        seen.append((name, asyncio.get_running_loop(), await database_utils.get_database()))
+
+    with patch("app.database.database_utils.get_database", new=get_database), \
+            patch("app.database.database_utils.create_client",
+                  side_effect=lambda: (MagicMock(), MagicMock())) as mock_create:
+        # When: Running two tasks in this process
+        process_utils.run_in_worker_loop(task, "first")
+        process_utils.run_in_worker_loop(task, "second")
+
+    # Then: Both ran on the same loop with a single client
+    (_, first_loop, first_db), (_, second_loop, second_db) = seen
+    assert first_loop is second_loop
+    assert first_db is second_db
+    mock_create.assert_called_once()
@@ -0,0 +1,47 @@
+"""Unit tests for async rate limiting utilities."""
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.utils.rate_limit import AsyncRateLimiter
+
+
+async def test_acquire_within_limit_does_not_wait():
+    """Test requests within the limit are let through immediately."""
+    # Given: A limiter with spare capacity
+    limiter = AsyncRateLimiter(requests_per_minute=3)
+
+    # When: Acquiring up to the limit
+    with patch("app.utils.rate_limit.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        for _ in range(3):
+            await limiter.acquire()
+
+    # Then: No waiting occurs
+    mock_sleep.assert_not_called()
+
+
+async def test_acquire_over_limit_waits_for_window():
+    """Test requests over the limit wait for the oldest slot to expire."""
+    # Given: A limiter whose window is already full
+    limiter = AsyncRateLimiter(requests_per_minute=2, period=60.0)
+    clock = iter([0.0, 1.0, 2.0, 60.5])
+
+    async def advance(_):
+        return None
+
+    # When: Acquiring one more request than allowed
+    with patch("app.utils.rate_limit.time.monotonic", side_effect=lambda: next(clock)), \
+            patch("app.utils.rate_limit.asyncio.sleep", side_effect=advance) as mock_sleep:
+        await limiter.acquire()
+        await limiter.acquire()
+        await limiter.acquire()
+
+    # Then: The limiter waits until the first request leaves the window
+    mock_sleep.assert_called_once_with(58.0)
+
+
+async def test_invalid_requests_per_minute():
+    """Test the limiter rejects a non-positive limit."""
+    # When/Then: Creating a limiter with zero capacity raises
+    with pytest.raises(ValueError, match="requests_per_minute must be at least 1"):
+        AsyncRateLimiter(requests_per_minute=0)
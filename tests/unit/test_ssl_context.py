@@ -6,13 +6,11 @@ from unittest.mock import patch, MagicMock
 
 import pytest
 
-from app.common.ssl_context import get_truststore_certs, get_mongodb_ssl_options
+from app.common.ssl_context import get_truststore_certs, get_mongodb_ssl_options, remove_ca_file
 
 
-@pytest.fixture
-def mock_cert():
-    """Sample certificate fixture."""
-    return """
+# Sample certificate, base64-encoded once for the truststore variables
+MOCK_CERT = """
     -----BEGIN CERTIFICATE-----
     MIICMTCCAZoCCQD01SSXK+AoETANBgkqhkiG9w0BAQsFADBdMQswCQYDVQQGEwJV
     UzELMAkGA1UECAwCQ0ExEDAOBgNVBAoMB0NvbXBhbnkxDDAKBgNVBAsMA09yZzEh
@@ -28,87 +26,136 @@ def mock_cert():
     w5QqH1wG3RYhzIWuvJxk9ZOHwf7cHxRGtBf5F7HEwGwW4Tg9Yg==
     -----END CERTIFICATE-----
     """
+MOCK_CERT_B64 = base64.b64encode(MOCK_CERT.encode()).decode()
+VALID_CERT = base64.b64encode(b"valid-cert").decode()
+
+
+@pytest.fixture(autouse=True)
+def clear_ssl_caches():
+    """Clear cached certificate and SSL option lookups between tests."""
+    get_truststore_certs.cache_clear()
+    get_mongodb_ssl_options.cache_clear()
+    yield
+    get_truststore_certs.cache_clear()
+    get_mongodb_ssl_options.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def ca_files_in_tmp_path(tmp_path, monkeypatch):
+    """Write CA files under tmp_path so pytest removes them."""
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
 
 
 @pytest.fixture
-def mock_env_vars(mock_cert):
+def mock_env_vars():
     """Setup environment variables for testing."""
-    cert_b64 = base64.b64encode(mock_cert.encode()).decode()
     env_vars = {
-        "TRUSTSTORE_1": cert_b64,
+        "TRUSTSTORE_1": MOCK_CERT_B64,
         "ENABLE_SECURE_CONTEXT": "true"
     }
     with patch.dict(os.environ, env_vars, clear=True):
         yield env_vars
 
 
-async def test_get_truststore_certs_scenarios():
+@pytest.mark.parametrize("env_vars, expected_count", [
+    ({}, 0),  # Empty environment
+    ({"TRUSTSTORE_1": "invalid-base64"}, 0),  # Invalid base64
+    ({"TRUSTSTORE_1": "invalid-base64", "TRUSTSTORE_2": VALID_CERT}, 1)  # Mixed valid/invalid
+])
+async def test_get_truststore_certs_scenarios(env_vars, expected_count):
     """Test various certificate retrieval scenarios."""
-    # Given: Different certificate scenarios
-    valid_cert = base64.b64encode(b"valid-cert").decode()
-    scenarios = [
-        ({}, 0),  # Empty environment
-        ({"TRUSTSTORE_1": "invalid-base64"}, 0),  # Invalid base64
-        ({"TRUSTSTORE_1": "invalid-base64", "TRUSTSTORE_2": valid_cert}, 1)  # Mixed valid/invalid
-    ]
-    
-    for env_vars, expected_count in scenarios:
+    # Given: A certificate scenario
+    with patch.dict(os.environ, env_vars, clear=True):
         # When: Get certificates
-        with patch.dict(os.environ, env_vars, clear=True):
-            certs = get_truststore_certs()
-        
-        # Then: Verify expected behavior
-        assert len(certs) == expected_count
+        certs = get_truststore_certs()
+
+    # Then: Verify expected behavior
+    assert len(certs) == expected_count
 
 
-async def test_get_mongodb_ssl_options_scenarios(mock_env_vars):
+@pytest.mark.parametrize("secure_context, with_cert, should_have_config", [
+    ("false", False, False),
+    ("true", False, False),
+    ("true", True, True)
+])
+async def test_get_mongodb_ssl_options_scenarios(
+    mock_env_vars, secure_context, with_cert, should_have_config
+):
     """Test SSL options in different scenarios."""
-    scenarios = [
-        ({"ENABLE_SECURE_CONTEXT": "false"}, False),
-        ({"ENABLE_SECURE_CONTEXT": "true"}, False),
-        (mock_env_vars, True)
-    ]
-    
-    for env_vars, should_have_config in scenarios:
-        # When: Get SSL options
-        with patch.dict(os.environ, env_vars, clear=True):
-            options, ca_file = get_mongodb_ssl_options()
-            
-        # Then: Verify configuration
-        if should_have_config:
-            assert options == {
-                "tls": True,
-                "tlsCAFile": ca_file,
-                "tlsAllowInvalidCertificates": False
-            }
-            assert ca_file.endswith('.pem')
-            # Cleanup
-            if ca_file:
-                os.unlink(ca_file)
-        else:
-            assert options == {}
-            assert ca_file == ""
-
-
-async def test_get_mongodb_ssl_options_error_handling(mock_env_vars):
+    # Given: A secure context setting with or without a certificate
+    env_vars = {"ENABLE_SECURE_CONTEXT": secure_context}
+    if with_cert:
+        env_vars["TRUSTSTORE_1"] = mock_env_vars["TRUSTSTORE_1"]
+
+    # When: Get SSL options
+    with patch.dict(os.environ, env_vars, clear=True):
+        options, ca_file = get_mongodb_ssl_options()
+
+    # Then: Verify configuration
+    if should_have_config:
+        assert options == {
+            "tls": True,
+            "tlsCAFile": ca_file,
+            "tlsAllowInvalidCertificates": False
+        }
+        assert ca_file.endswith('.pem')
+    else:
+        assert options == {}
+        assert ca_file == ""
+
+
+@pytest.mark.parametrize("failure", ["create", "write"])
+async def test_get_mongodb_ssl_options_error_handling(mock_env_vars, failure):
     """Test error handling in SSL options."""
-    # Given: Different error scenarios
-    mock_file = MagicMock()
-    mock_file.name = "/tmp/test.pem"
-    mock_file.write.side_effect = Exception("Write failed")
-
-    error_scenarios = [
-        # Temp file creation fails
-        patch("tempfile.NamedTemporaryFile", side_effect=Exception("Failed to create file")),
-        # Write fails
-        patch("tempfile.NamedTemporaryFile", return_value=mock_file)
-    ]
-    
-    for scenario in error_scenarios:
-        with scenario:
-            # When: Get SSL options
-            options, ca_file = get_mongodb_ssl_options()
-            
-            # Then: Should handle errors gracefully
-            assert options == {}
-            assert ca_file == "" 
\ No newline at end of file
+    # Given: Temp file creation or writing fails
+    if failure == "create":
+        scenario = patch("tempfile.NamedTemporaryFile", side_effect=Exception("Failed to create file"))
+    else:
+        mock_file = MagicMock()
+        mock_file.name = "/tmp/test.pem"
+        mock_file.write.side_effect = Exception("Write failed")
+        scenario = patch("tempfile.NamedTemporaryFile", return_value=mock_file)
+
+    with scenario:
+        # When: Get SSL options
+        options, ca_file = get_mongodb_ssl_options()
+
+    # Then: Should handle errors gracefully
+    assert options == {}
+    assert ca_file == ""
+
+
+async def test_get_mongodb_ssl_options_reuses_ca_file(mock_env_vars):
+    """Test repeated calls share one complete CA file."""
+    # When: Getting SSL options twice
+    options, ca_file = get_mongodb_ssl_options()
+    _, second_ca_file = get_mongodb_ssl_options()
+
+    # Then: Both calls return the same CA file
+    assert ca_file
+    assert second_ca_file == ca_file
+    with open(ca_file) as f:
+        assert f.read() == MOCK_CERT.strip() + "\n"
+
+
+async def test_ca_file_is_removed_at_exit_only_by_owner(mock_env_vars):
+    """Test the CA file is kept for the process lifetime and removed at exit."""
+    # Given: SSL options with a CA file, capturing the exit handler
+    with patch("app.common.ssl_context.atexit.register") as mock_register:
+        _, ca_file = get_mongodb_ssl_options()
+    handler, *args = mock_register.call_args.args
+
+    # When: A different process runs the exit handler
+    with patch("app.common.ssl_context.os.getpid", return_value=-1):
+        handler(*args)
+
+    # Then: The file is kept
+    assert os.path.exists(ca_file)
+
+    # When: The owning process runs the exit handler
+    handler(*args)
+
+    # Then: The file is removed, and a second run is harmless
+    assert handler is remove_ca_file
+    assert not os.path.exists(ca_file)
+    handler(*args)
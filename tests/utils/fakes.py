@@ -0,0 +1,17 @@
+"""Fake collaborators shared across test modules."""
+
+
+class FakeAnthropicClient:
+    """Stand-in for AnthropicClient in the standards agent.
+
+    Returns ``response`` from create_message, or raises ``error`` when set.
+    """
+
+    response = "Python"  # Default classification for standards
+    error = None
+
+    @classmethod
+    async def create_message(cls, *args, **kwargs) -> str:
+        if cls.error is not None:
+            raise cls.error
+        return cls.response
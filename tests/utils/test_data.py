@@ -3,6 +3,15 @@ import pytest
 from datetime import datetime, UTC
 from bson import ObjectId
 from pathlib import Path
+from typing import Optional
+
+# Shared timestamp for test documents, no test relies on them differing
+_NOW = datetime.now(UTC)
+
+# Fixed classification ids used by the classification agent tests
+_PYTHON_CLASSIFICATION_ID = ObjectId("507f1f77bcf86cd799439011")
+_FASTAPI_CLASSIFICATION_ID = ObjectId("507f1f77bcf86cd799439012")
+_REACT_CLASSIFICATION_ID = ObjectId("507f1f77bcf86cd799439013")
 
 
 def create_classification_test_data(name: str = "Test Classification") -> dict:
@@ -69,19 +78,24 @@ def create_standard_test_data(set_id: ObjectId, index: int = 0) -> dict:
     )
 
 
-def create_db_document(**kwargs) -> dict:
+def create_db_document(now: Optional[datetime] = None, **kwargs) -> dict:
     """Create a database document with common fields.
 
     Args:
+        now: Optional timestamp for created_at and updated_at, defaults to
+            the time this module was imported
         **kwargs: Additional fields to add to the document
 
     Returns:
         dict: Document with _id and timestamps
     """
+    # Only generate an id when the caller did not supply one
+    doc_id = kwargs.pop("_id", None)
+    timestamp = now or _NOW
     return {
-        "_id": kwargs.pop("_id", ObjectId()),
-        "created_at": datetime.now(UTC),
-        "updated_at": datetime.now(UTC),
+        "_id": doc_id if doc_id is not None else ObjectId(),
+        "created_at": timestamp,
+        "updated_at": timestamp,
         **kwargs
     }
 
@@ -253,17 +267,17 @@ def create_mock_classifications() -> list[dict]:
     """
     return [
         create_db_document(
-            _id=ObjectId("507f1f77bcf86cd799439011"),
+            _id=_PYTHON_CLASSIFICATION_ID,
             name="Python",
             description="Python language"
         ),
         create_db_document(
-            _id=ObjectId("507f1f77bcf86cd799439012"),
+            _id=_FASTAPI_CLASSIFICATION_ID,
             name="FastAPI",
             description="FastAPI framework"
         ),
         create_db_document(
-            _id=ObjectId("507f1f77bcf86cd799439013"),
+            _id=_REACT_CLASSIFICATION_ID,
             name="React",
             description="React framework"
         )